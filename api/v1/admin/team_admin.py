@@ -1,8 +1,15 @@
 from django.contrib import admin
-from api.v1.models import Team
+from api.v1.models import Team, Membership
+
+
+class MembershipInline(admin.TabularInline):
+    model = Membership
+    extra = 0
+    raw_id_fields = ("user",)
 
 
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "owner", "created_at", "updated_at")
     search_fields = ("name", "description")
+    inlines = (MembershipInline,)
@@ -15,7 +15,7 @@ class UserAdmin(BaseUserAdmin):
                 (None, {"fields": ("username", "email", "password")}),
                 (
                     "Personal info",
-                    {"fields": ("first_name", "middle_name", "last_name", "teams")},
+                    {"fields": ("first_name", "middle_name", "last_name")},
                 ),
             ) + fieldsets[2:]
 
@@ -10,4 +10,19 @@ class V1Config(AppConfig):
             UserAdmin,
             TeamAdmin,
             NoteAdmin,
-        )  
+        )
+        from api.v1.checks import check_shared_caches
+        from api.v1.signals import (
+            invalidate_membership_cache,
+            invalidate_user_cache,
+            install_query_recorder,
+            invalidate_saved_note,
+            invalidate_deleted_note,
+            invalidate_saved_team,
+            invalidate_deleted_team,
+            invalidate_team_members,
+            invalidate_changed_team_members,
+            invalidate_user_payloads,
+            index_saved_note,
+            remove_deleted_note,
+        )
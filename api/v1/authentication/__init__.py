@@ -0,0 +1,18 @@
+from api.v1.authentication.stateless_jwt_authentication import (
+    StatelessJWTAuthentication,
+    TokenBackedUser,
+    UserRefreshToken,
+)
+from api.v1.authentication.credential_authentication import (
+    aauthenticate_credentials,
+    authenticate_credentials,
+)
+
+
+__all__ = [
+    "StatelessJWTAuthentication",
+    "TokenBackedUser",
+    "UserRefreshToken",
+    "aauthenticate_credentials",
+    "authenticate_credentials",
+]
@@ -0,0 +1,57 @@
+from django.contrib.auth.hashers import check_password, make_password
+from api.v1.models import User
+from api.v1.utils import (
+    acheck_password,
+    amake_password,
+    get_password_upgrade_queue,
+)
+
+
+# Columns needed to check a password and issue tokens for the user.
+LOGIN_FIELDS = ("id", "email", "username", "is_active", "password")
+
+
+def authenticate_credentials(email, password):
+    """
+    Return the active user with the given email and password, or `None`.
+
+    Only `LOGIN_FIELDS` are loaded, in a single query. Unknown emails still
+    hash the password once so that they take as long to reject as a wrong
+    password. Credentials are compared exactly as given, never
+    sanitized. Hashes made with an outdated hasher or work factor are
+    upgraded in the background rather than during the login.
+    """
+    user = User.objects.only(*LOGIN_FIELDS).filter(email=email).first()
+
+    if user is None:
+        make_password(password)
+        return None
+
+    if not check_password(password, user.password, _upgrade_setter(user)):
+        return None
+
+    return user if user.is_active else None
+
+
+async def aauthenticate_credentials(email, password):
+    """
+    Async counterpart of `authenticate_credentials`, hashing on the
+    bounded password hashing executor.
+    """
+    user = await User.objects.only(*LOGIN_FIELDS).filter(email=email).afirst()
+
+    if user is None:
+        await amake_password(password)
+        return None
+
+    if not await acheck_password(password, user.password, _upgrade_setter(user)):
+        return None
+
+    return user if user.is_active else None
+
+
+def _upgrade_setter(user):
+    def setter(raw_password):
+        get_password_upgrade_queue().submit(user.pk, user.password, raw_password)
+
+    return setter
@@ -0,0 +1,152 @@
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from api.v1.models import User
+from api.v1.utils import get_authenticated_user, get_blacklist_filter
+
+
+# User fields copied into issued tokens so that requests can be served
+# without loading the user row.
+USER_CLAIMS = ("email", "username", "is_active")
+
+
+class UserRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the `USER_CLAIMS` of its user. Access tokens
+    derived from it, including on refresh, copy the claims along.
+
+    Blacklist checks consult the per-process blacklist filter first and
+    only query for possible hits. A token blacklisted by another process
+    since the filter last synced still cannot be used twice: blacklisting
+    it again, as every rotation does, fails.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+    def check_blacklist(self):
+        if self.payload[api_settings.JTI_CLAIM] in get_blacklist_filter():
+            super().check_blacklist()
+
+    def blacklist(self):
+        blacklisted, created = super().blacklist()
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+
+        get_blacklist_filter().add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted, created
+
+
+class TokenBackedUser:
+    """
+    Authenticated user built from the claims of a validated access token.
+
+    `id`, `email`, `username` and `is_active` are read from the token, so
+    most requests never touch the user table. Any other attribute loads the
+    full `User` row, through the user cache, the first time it is accessed.
+    Claims reflect the user as of token issue; read `user` for fresh values.
+    """
+
+    is_anonymous = False
+    is_authenticated = True
+
+    def __init__(self, token):
+        self.token = token
+
+    def __str__(self):
+        return self.email
+
+    def __eq__(self, other):
+        if isinstance(other, (TokenBackedUser, User)):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __getattr__(self, attr):
+        # Only reached for attributes not backed by a claim.
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.user, attr)
+
+    @cached_property
+    def id(self):
+        return self.token[api_settings.USER_ID_CLAIM]
+
+    @property
+    def pk(self):
+        return self.id
+
+    @cached_property
+    def email(self):
+        return self._claim("email")
+
+    @cached_property
+    def username(self):
+        return self._claim("username")
+
+    @cached_property
+    def is_active(self):
+        return self._claim("is_active")
+
+    @cached_property
+    def user(self):
+        """
+        The full `User` row, loaded on first access.
+        """
+        return get_authenticated_user(self.id)
+
+    def get_username(self):
+        return getattr(self, User.USERNAME_FIELD)
+
+    def _claim(self, name):
+        # Tokens issued before the claim was added fall back to the row.
+        if name in self.token:
+            return self.token[name]
+        return getattr(self.user, name)
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that returns a `TokenBackedUser` instead of looking
+    up the `User` row on every request.
+
+    Set `STATELESS_JWT_AUTHENTICATION` to `False` to fall back to the
+    per-request lookup of `JWTAuthentication`.
+    """
+
+    def get_user(self, validated_token):
+        if not settings.STATELESS_JWT_AUTHENTICATION:
+            return super().get_user(validated_token)
+
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = TokenBackedUser(validated_token)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
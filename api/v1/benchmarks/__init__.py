@@ -0,0 +1,34 @@
+from api.v1.benchmarks.dataset_distribution import Distribution
+from api.v1.benchmarks.dataset_builder import (
+    Dataset,
+    build_dataset,
+    default_dataset_shape,
+)
+from api.v1.benchmarks.benchmark_scenarios import (
+    SCENARIOS,
+    BenchmarkContext,
+    BenchmarkRequest,
+    Scenario,
+)
+from api.v1.benchmarks.benchmark_runner import (
+    BenchmarkRunner,
+    compare_results,
+    percentile,
+    summarize,
+)
+
+
+__all__ = [
+    "Distribution",
+    "Dataset",
+    "build_dataset",
+    "default_dataset_shape",
+    "SCENARIOS",
+    "BenchmarkContext",
+    "BenchmarkRequest",
+    "Scenario",
+    "BenchmarkRunner",
+    "compare_results",
+    "percentile",
+    "summarize",
+]
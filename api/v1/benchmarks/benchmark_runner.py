@@ -0,0 +1,161 @@
+import math
+import time
+from collections import Counter
+from contextlib import ExitStack
+from unittest import mock
+from django.db import connections
+from django.test import Client
+from api.v1.throttles import SlidingWindowRateThrottle
+from api.v1.authentication import UserRefreshToken
+from api.v1.utils import get_last_login_buffer
+from api.v1.benchmarks.benchmark_scenarios import SCENARIOS, BenchmarkContext
+
+
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+class _QueryCounter:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(pct / 100 * len(values)) - 1)]
+
+
+def summarize(latencies, queries, statuses):
+    """
+    Reduce per-request samples to the statistics written to the report.
+    """
+    ordered = sorted(latencies)
+    total = sum(ordered)
+
+    return {
+        "iterations": len(ordered),
+        "throughput_rps": round(len(ordered) / total, 2) if total else 0.0,
+        "mean_ms": round(total / len(ordered) * 1000, 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else 0,
+        "max_queries": max(queries, default=0),
+        "statuses": dict(Counter(str(status) for status in statuses)),
+    }
+
+
+class BenchmarkRunner:
+    """
+    Drive every scenario through the Django test client and time each
+    request, untimed setup excluded.
+
+    Throttles are disabled for the run so that rate limits do not turn the
+    measured requests into 429s.
+    """
+
+    def __init__(self, iterations=50, warmup=5, scenarios=None):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.scenarios = scenarios or SCENARIOS
+        self.client = Client()
+
+    def run(self, dataset):
+        context = BenchmarkContext(dataset)
+        self._tokens = {context.actor.pk: _access_token(context.actor)}
+
+        try:
+            with mock.patch.object(
+                SlidingWindowRateThrottle, "allow_request", return_value=True
+            ):
+                return {
+                    scenario.name: self.run_scenario(scenario, context)
+                    for scenario in self.scenarios
+                }
+        finally:
+            # Write buffered logins before the dataset's database goes away.
+            get_last_login_buffer().flush()
+
+    def run_scenario(self, scenario, context):
+        latencies = []
+        queries = []
+        statuses = []
+
+        for iteration in range(self.warmup + self.iterations):
+            request = scenario.prepare(context, iteration)
+            headers = self._headers(request, context)
+            counter = _QueryCounter()
+
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(counter))
+                started = time.perf_counter()
+                response = getattr(self.client, request.method)(
+                    request.path,
+                    request.data,
+                    content_type="application/json",
+                    **headers,
+                )
+                elapsed = time.perf_counter() - started
+
+            if iteration >= self.warmup:
+                latencies.append(elapsed)
+                queries.append(counter.count)
+                statuses.append(response.status_code)
+
+        return summarize(latencies, queries, statuses)
+
+    def _headers(self, request, context):
+        if request.auth is None:
+            return {}
+
+        user = context.actor if request.auth == "actor" else request.auth
+        token = self._tokens.get(user.pk) or _access_token(user)
+        return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+
+def _access_token(user):
+    return str(UserRefreshToken.for_user(user).access_token)
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Return `(size, scenario, metric, baseline, current)` for every latency
+    percentile that grew by more than `threshold` (a fraction) and every
+    increase in queries per request.
+    """
+    regressions = []
+
+    for size, scenarios in current.items():
+        for name, stats in scenarios.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+
+            for metric in LATENCY_METRICS:
+                if stats[metric] > previous[metric] * (1 + threshold):
+                    regressions.append(
+                        (size, name, metric, previous[metric], stats[metric])
+                    )
+
+            if stats["queries_per_request"] > previous["queries_per_request"]:
+                regressions.append(
+                    (
+                        size,
+                        name,
+                        "queries_per_request",
+                        previous["queries_per_request"],
+                        stats["queries_per_request"],
+                    )
+                )
+
+    return regressions
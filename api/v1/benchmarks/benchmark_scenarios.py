@@ -0,0 +1,282 @@
+import uuid
+from collections import namedtuple
+from api.v1.authentication import UserRefreshToken
+from api.v1.models import User, Team, Note, Membership
+
+
+Scenario = namedtuple("Scenario", ["name", "prepare"])
+
+# `auth` is "actor" for the benchmark user, `None` for anonymous requests or
+# a `User` to authenticate as someone else.
+BenchmarkRequest = namedtuple(
+    "BenchmarkRequest", ["method", "path", "data", "auth"], defaults=[None, "actor"]
+)
+
+
+class BenchmarkContext:
+    """
+    Fixed objects of a dataset that the scenarios point their requests at.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.actor = User.objects.get(pk=dataset.actor_id)
+        self.owned_team = Team.objects.filter(owner=self.actor).order_by("id").first()
+        self.joined_team = (
+            Team.objects.filter(
+                memberships__user=self.actor,
+                memberships__role=Membership.Role.MEMBER,
+            )
+            .order_by("id")
+            .first()
+        ) or self.owned_team
+        # Owned by someone else, so the actor can always join and leave it,
+        # even in a dataset where it belongs to every team.
+        self.other_team = Team.objects.create(
+            name=self.unique("bt"), owner=self.create_user()
+        )
+        self.note = (
+            Note.objects.filter(team=self.owned_team).order_by("id").first()
+            or self.create_note()
+        )
+
+    def unique(self, prefix, length=20):
+        return f"{prefix}{uuid.uuid4().hex}"[:length]
+
+    def create_team(self):
+        return Team.objects.create(name=self.unique("bt"), owner=self.actor)
+
+    def create_note(self):
+        return Note.objects.create(
+            title=self.unique("bench note ", 100),
+            body="benchmark",
+            team=self.owned_team,
+            owner=self.actor,
+        )
+
+    def create_user(self):
+        name = self.unique("bu")
+        return User.objects.create(
+            username=name, email=f"{name}@example.com", password=self.actor.password
+        )
+
+
+def _users_retrieve(context, iteration):
+    return BenchmarkRequest("get", f"/api/v1/users/{context.actor.pk}/")
+
+
+def _users_update(context, iteration):
+    return BenchmarkRequest(
+        "put",
+        f"/api/v1/users/{context.actor.pk}/",
+        {"first_name": "Bench", "middle_name": "", "last_name": str(iteration)},
+    )
+
+
+def _users_partial_update(context, iteration):
+    return BenchmarkRequest(
+        "patch", f"/api/v1/users/{context.actor.pk}/", {"last_name": str(iteration)}
+    )
+
+
+def _users_destroy(context, iteration):
+    user = context.create_user()
+    return BenchmarkRequest("delete", f"/api/v1/users/{user.pk}/", auth=user)
+
+
+def _users_teams(context, iteration):
+    return BenchmarkRequest("get", f"/api/v1/users/{context.actor.pk}/teams/")
+
+
+def _teams_list(context, iteration):
+    return BenchmarkRequest("get", "/api/v1/teams/")
+
+
+def _teams_retrieve(context, iteration):
+    return BenchmarkRequest("get", f"/api/v1/teams/{context.joined_team.pk}/")
+
+
+def _teams_create(context, iteration):
+    return BenchmarkRequest(
+        "post", "/api/v1/teams/", {"name": context.unique("bt"), "description": ""}
+    )
+
+
+def _teams_update(context, iteration):
+    return BenchmarkRequest(
+        "put",
+        f"/api/v1/teams/{context.owned_team.pk}/",
+        {"name": context.owned_team.name, "description": str(iteration)},
+    )
+
+
+def _teams_partial_update(context, iteration):
+    return BenchmarkRequest(
+        "patch",
+        f"/api/v1/teams/{context.owned_team.pk}/",
+        {"description": str(iteration)},
+    )
+
+
+def _teams_destroy(context, iteration):
+    team = context.create_team()
+    return BenchmarkRequest("delete", f"/api/v1/teams/{team.pk}/")
+
+
+def _teams_join(context, iteration):
+    team = context.other_team
+    Membership.objects.filter(team=team, user=context.actor).delete()
+    return BenchmarkRequest(
+        "post", f"/api/v1/teams/{team.pk}/join/", {"code": team.code}
+    )
+
+
+def _teams_leave(context, iteration):
+    team = context.other_team
+    Membership.objects.get_or_create(team=team, user=context.actor)
+    return BenchmarkRequest("delete", f"/api/v1/teams/{team.pk}/leave/")
+
+
+def _teams_notes(context, iteration):
+    return BenchmarkRequest("get", f"/api/v1/teams/{context.owned_team.pk}/notes/")
+
+
+def _teams_rotate_code(context, iteration):
+    return BenchmarkRequest(
+        "post", f"/api/v1/teams/{context.owned_team.pk}/rotate-code/", {}
+    )
+
+
+def _notes_create(context, iteration):
+    return BenchmarkRequest(
+        "post",
+        "/api/v1/notes/",
+        {
+            "title": context.unique("bench note ", 100),
+            "body": "benchmark body",
+            "team": context.owned_team.pk,
+        },
+    )
+
+
+def _notes_retrieve(context, iteration):
+    return BenchmarkRequest("get", f"/api/v1/notes/{context.note.pk}/")
+
+
+def _notes_update(context, iteration):
+    return BenchmarkRequest(
+        "put",
+        f"/api/v1/notes/{context.note.pk}/",
+        {
+            "title": context.note.title,
+            "body": f"benchmark body {iteration}",
+            "team": context.owned_team.pk,
+        },
+    )
+
+
+def _notes_partial_update(context, iteration):
+    return BenchmarkRequest(
+        "patch",
+        f"/api/v1/notes/{context.note.pk}/",
+        {"body": f"benchmark body {iteration}"},
+    )
+
+
+def _notes_destroy(context, iteration):
+    note = context.create_note()
+    return BenchmarkRequest("delete", f"/api/v1/notes/{note.pk}/")
+
+
+def _notes_bulk(context, iteration):
+    updated, deleted = context.create_note(), context.create_note()
+    return BenchmarkRequest(
+        "post",
+        "/api/v1/notes/bulk/",
+        {
+            "create": [
+                {
+                    "title": context.unique("bench note ", 100),
+                    "body": "benchmark body",
+                    "team": context.owned_team.pk,
+                }
+                for _ in range(5)
+            ],
+            "update": [{"id": updated.pk, "body": f"benchmark body {iteration}"}],
+            "delete": [deleted.pk],
+        },
+    )
+
+
+def _notes_search(context, iteration):
+    return BenchmarkRequest("get", "/api/v1/notes/search/?q=release+roadmap")
+
+
+def _register_create(context, iteration):
+    name = context.unique("br")
+    password = context.dataset.password
+    return BenchmarkRequest(
+        "post",
+        "/api/v1/auth/register/",
+        {
+            "username": name,
+            "email": f"{name}@example.com",
+            "password": password,
+            "re_password": password,
+        },
+        None,
+    )
+
+
+def _login_create(context, iteration):
+    return BenchmarkRequest(
+        "post",
+        "/api/v1/auth/login/",
+        {"email": context.actor.email, "password": context.dataset.password},
+        None,
+    )
+
+
+def _token_refresh(context, iteration):
+    refresh = UserRefreshToken.for_user(context.actor)
+    return BenchmarkRequest(
+        "post", "/api/v1/auth/refresh/", {"refresh": str(refresh)}, None
+    )
+
+
+def _token_blacklist(context, iteration):
+    refresh = UserRefreshToken.for_user(context.actor)
+    return BenchmarkRequest(
+        "post", "/api/v1/auth/blacklist/", {"refresh": str(refresh)}, None
+    )
+
+
+# Read-only scenarios run first so that writes do not skew them.
+SCENARIOS = [
+    Scenario("UserViewSet.retrieve", _users_retrieve),
+    Scenario("UserViewSet.teams", _users_teams),
+    Scenario("TeamViewSet.list", _teams_list),
+    Scenario("TeamViewSet.retrieve", _teams_retrieve),
+    Scenario("TeamViewSet.notes", _teams_notes),
+    Scenario("NoteViewSet.retrieve", _notes_retrieve),
+    Scenario("NoteViewSet.search", _notes_search),
+    Scenario("UserViewSet.update", _users_update),
+    Scenario("UserViewSet.partial_update", _users_partial_update),
+    Scenario("UserViewSet.destroy", _users_destroy),
+    Scenario("TeamViewSet.create", _teams_create),
+    Scenario("TeamViewSet.update", _teams_update),
+    Scenario("TeamViewSet.partial_update", _teams_partial_update),
+    Scenario("TeamViewSet.destroy", _teams_destroy),
+    Scenario("TeamViewSet.join", _teams_join),
+    Scenario("TeamViewSet.leave", _teams_leave),
+    Scenario("TeamViewSet.rotate_code", _teams_rotate_code),
+    Scenario("NoteViewSet.create", _notes_create),
+    Scenario("NoteViewSet.update", _notes_update),
+    Scenario("NoteViewSet.partial_update", _notes_partial_update),
+    Scenario("NoteViewSet.destroy", _notes_destroy),
+    Scenario("NoteViewSet.bulk", _notes_bulk),
+    Scenario("RegisterViewSet.create", _register_create),
+    Scenario("LoginViewSet.create", _login_create),
+    Scenario("TokenRefreshView.post", _token_refresh),
+    Scenario("TokenBlacklistView.post", _token_blacklist),
+]
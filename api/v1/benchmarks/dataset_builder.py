@@ -0,0 +1,266 @@
+import random
+import string
+import time
+from collections import Counter, namedtuple
+from datetime import timedelta
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+from api.v1.models import User, Team, Note, Membership
+from api.v1.search import get_search_backend
+from api.v1.benchmarks.dataset_distribution import Distribution
+
+
+Dataset = namedtuple(
+    "Dataset", ["users", "teams", "notes", "memberships", "actor_id", "password"]
+)
+
+WORDS = (
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima "
+    "mike november oscar papa quebec romeo sierra tango uniform victor whiskey "
+    "xray yankee zulu agenda budget design meeting release review roadmap "
+    "sprint retro launch metrics backlog"
+).split()
+
+CODE_ALPHABET = string.ascii_uppercase + string.digits
+
+DEFAULT_TEAM_SIZE = Distribution("pareto", 1.5, 3, minimum=1, maximum=500)
+DEFAULT_NOTES_PER_TEAM = Distribution("pareto", 1.2, 20, minimum=0)
+DEFAULT_BODY_WORDS = Distribution("normal", 40, 20, minimum=1, maximum=2000)
+
+# Notes are backdated by up to this much so pagination sees realistic spreads.
+NOTE_AGE_SPAN = timedelta(days=365)
+
+
+def default_dataset_shape(notes):
+    """
+    Return the `(users, teams)` counts used alongside `notes` notes.
+    """
+    return max(2, notes // 200), max(1, notes // 100)
+
+
+def build_dataset(
+    users,
+    teams,
+    notes=None,
+    team_size=DEFAULT_TEAM_SIZE,
+    notes_per_team=DEFAULT_NOTES_PER_TEAM,
+    body_words=DEFAULT_BODY_WORDS,
+    password="benchmark-password",
+    prefix="user",
+    seed=0,
+    batch_size=5000,
+    rebuild_search_index=True,
+    progress=None,
+):
+    """
+    Bulk insert a deterministic dataset of users, teams, memberships and notes.
+
+    Members per team, notes per team and note body lengths are drawn from
+    the given distributions. When `notes` is set, exactly that many notes
+    are spread over the teams weighted by `notes_per_team`.
+
+    Every user shares one precomputed password hash and the first user is
+    the actor the benchmarks authenticate as. `progress` is called with
+    `(model name, rows written, rows total, seconds elapsed)` as batches
+    are written. Users and teams go through `bulk_create` since their ids
+    are needed; memberships and notes, the bulk of the rows, are inserted
+    as plain tuples with `executemany`. The search index is rebuilt
+    afterwards since bulk inserts bypass it.
+    """
+    # The prefix is part of the seed so that datasets seeded side by side do
+    # not draw the same team codes.
+    rng = random.Random(f"{prefix}:{seed}")
+    password_hash = make_password(password)
+    writer = _BatchWriter(batch_size, progress)
+    now = timezone.now()
+    adapt_datetime = connection.ops.adapt_datetimefield_value
+    now_value = adapt_datetime(now)
+
+    with transaction.atomic():
+        user_ids = writer.write(
+            User,
+            users,
+            (
+                User(
+                    username=f"{prefix}{index}",
+                    email=f"{prefix}{index}@example.com",
+                    password=password_hash,
+                )
+                for index in range(users)
+            ),
+        )
+
+        codes = {}
+        while len(codes) < teams:
+            codes.setdefault("".join(rng.choices(CODE_ALPHABET, k=8)))
+
+        team_owner_ids = [user_ids[index % users] for index in range(teams)]
+        team_ids = writer.write(
+            Team,
+            teams,
+            (
+                Team(
+                    name=f"{prefix}t{index}",
+                    code=code,
+                    description=_sentence(rng, 12),
+                    owner_id=owner_id,
+                )
+                for index, (code, owner_id) in enumerate(zip(codes, team_owner_ids))
+            ),
+        )
+
+        team_members = _draw_team_members(
+            rng, team_ids, team_owner_ids, user_ids, team_size
+        )
+        membership_count = sum(len(members) for members in team_members.values())
+        writer.insert_rows(
+            Membership,
+            ["team", "user", "role", "created_at"],
+            membership_count,
+            (
+                (
+                    team_id,
+                    user_id,
+                    Membership.Role.OWNER if position == 0 else Membership.Role.MEMBER,
+                    now_value,
+                )
+                for team_id, members in team_members.items()
+                for position, user_id in enumerate(members)
+            ),
+        )
+
+        team_note_counts = _draw_note_counts(rng, team_ids, notes_per_team, notes)
+        note_count = sum(team_note_counts.values())
+        note_team_ids = (
+            team_id for team_id in team_ids for _ in range(team_note_counts[team_id])
+        )
+        note_age_seconds = NOTE_AGE_SPAN.total_seconds()
+        writer.insert_rows(
+            Note,
+            ["title", "body", "team", "owner", "created_at", "updated_at", "version"],
+            note_count,
+            (
+                (
+                    f"{prefix} note {index}",
+                    _sentence(rng, body_words.sample(rng)),
+                    team_id,
+                    rng.choice(team_members[team_id]),
+                    adapt_datetime(
+                        now - timedelta(seconds=rng.random() * note_age_seconds)
+                    ),
+                    now_value,
+                    1,
+                )
+                for index, team_id in enumerate(note_team_ids)
+            ),
+        )
+
+    if rebuild_search_index:
+        get_search_backend().rebuild()
+
+    return Dataset(users, teams, note_count, membership_count, user_ids[0], password)
+
+
+def _draw_team_members(rng, team_ids, team_owner_ids, user_ids, team_size):
+    """
+    Return each team's member ids, owner first.
+    """
+    team_members = {}
+
+    for team_id, owner_id in zip(team_ids, team_owner_ids):
+        size = min(team_size.sample(rng), len(user_ids))
+        members = [owner_id]
+        if size > 1:
+            members.extend(
+                user_id for user_id in rng.sample(user_ids, size) if user_id != owner_id
+            )
+            del members[size:]
+        team_members[team_id] = members
+
+    return team_members
+
+
+def _draw_note_counts(rng, team_ids, notes_per_team, notes):
+    counts = {team_id: notes_per_team.sample(rng) for team_id in team_ids}
+
+    if notes is None:
+        return counts
+
+    weights = [counts[team_id] + 1 for team_id in team_ids]
+    return Counter(rng.choices(team_ids, weights=weights, k=notes))
+
+
+def _sentence(rng, words):
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+class _BatchWriter:
+    """
+    Write a stream of objects or rows in fixed-size batches, reporting
+    progress after each batch.
+    """
+
+    def __init__(self, batch_size, progress=None):
+        self.batch_size = batch_size
+        self.progress = progress
+
+    def write(self, model, total, objects):
+        """
+        `bulk_create` model instances and return their primary keys in order.
+        """
+        ids = []
+
+        def flush(batch):
+            ids.extend(obj.pk for obj in model.objects.bulk_create(batch))
+
+        self._write(model, total, objects, flush)
+        return ids
+
+    def insert_rows(self, model, fields, total, rows):
+        """
+        Insert `rows`, tuples of raw column values for `fields`, skipping
+        model instantiation and per-field preparation.
+        """
+        quote = connection.ops.quote_name
+        columns = ", ".join(
+            quote(model._meta.get_field(name).column) for name in fields
+        )
+        placeholders = ", ".join(["%s"] * len(fields))
+        sql = (
+            f"INSERT INTO {quote(model._meta.db_table)} ({columns}) "
+            f"VALUES ({placeholders})"
+        )
+
+        def flush(batch):
+            with connection.cursor() as cursor:
+                cursor.executemany(sql, batch)
+
+        self._write(model, total, rows, flush)
+
+    def _write(self, model, total, items, flush):
+        batch = []
+        written = 0
+        started = time.perf_counter()
+
+        for item in items:
+            batch.append(item)
+            if len(batch) == self.batch_size:
+                flush(batch)
+                written += len(batch)
+                self._report(model, written, total, started)
+                batch = []
+
+        if batch or not written:
+            flush(batch)
+            written += len(batch)
+            self._report(model, written, total, started)
+
+    def _report(self, model, written, total, started):
+        if self.progress is not None:
+            self.progress(
+                model._meta.verbose_name_plural,
+                written,
+                total,
+                time.perf_counter() - started,
+            )
@@ -0,0 +1,50 @@
+import math
+
+
+class Distribution:
+    """
+    Integer distribution parsed from a `kind:arg[:arg]` spec.
+
+    Supported kinds are `fixed:N`, `uniform:LOW:HIGH`, `normal:MEAN:STDDEV`
+    and `pareto:ALPHA:SCALE`, the heavy-tailed shape most team sizes and
+    note counts follow. Samples are clipped to `[minimum, maximum]`.
+    """
+
+    KINDS = {"fixed": 1, "uniform": 2, "normal": 2, "pareto": 2}
+
+    def __init__(self, kind, *args, minimum=0, maximum=None):
+        if kind not in self.KINDS or len(args) != self.KINDS[kind]:
+            raise ValueError(f"Invalid distribution `{kind}` with arguments {args}.")
+
+        self.kind = kind
+        self.args = args
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def parse(cls, spec, minimum=0, maximum=None):
+        kind, *args = spec.split(":")
+        try:
+            args = [float(arg) for arg in args]
+        except ValueError:
+            raise ValueError(f"Invalid distribution `{spec}`.")
+        return cls(kind, *args, minimum=minimum, maximum=maximum)
+
+    def __str__(self):
+        return ":".join([self.kind, *(f"{arg:g}" for arg in self.args)])
+
+    def sample(self, rng):
+        if self.kind == "fixed":
+            value = self.args[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.args)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.args)
+        else:
+            alpha, scale = self.args
+            value = scale * rng.paretovariate(alpha)
+
+        value = max(self.minimum, math.floor(value + 0.5))
+        if self.maximum is not None:
+            value = min(self.maximum, value)
+        return value
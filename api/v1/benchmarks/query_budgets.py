@@ -0,0 +1,59 @@
+from collections import namedtuple
+
+
+class QueryBudget(namedtuple("QueryBudget", ["base", "per_item"])):
+    """
+    Maximum SQL statements an action may run for a page of `page_size`
+    items: `base + per_item * page_size`.
+
+    Savepoint statements are not counted, since nesting inside an outer
+    transaction is what produces them. Authentication runs no queries, the
+    user being built from the access token claims.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, base, per_item=0):
+        return super().__new__(cls, base, per_item)
+
+    def limit(self, page_size=1):
+        return self.base + self.per_item * page_size
+
+
+# Actions returning a page of results; the harness checks them at several
+# `page_size` values to catch per-row queries.
+PAGINATED_ACTIONS = {
+    "UserViewSet.teams",
+    "TeamViewSet.list",
+    "TeamViewSet.notes",
+    "NoteViewSet.search",
+}
+
+QUERY_BUDGETS = {
+    "UserViewSet.retrieve": QueryBudget(1),
+    "UserViewSet.update": QueryBudget(2),
+    "UserViewSet.partial_update": QueryBudget(2),
+    "UserViewSet.destroy": QueryBudget(9),
+    "UserViewSet.teams": QueryBudget(2),
+    "TeamViewSet.list": QueryBudget(4),
+    "TeamViewSet.retrieve": QueryBudget(0),
+    "TeamViewSet.create": QueryBudget(3),
+    "TeamViewSet.update": QueryBudget(5),
+    "TeamViewSet.partial_update": QueryBudget(4),
+    "TeamViewSet.destroy": QueryBudget(5),
+    "TeamViewSet.join": QueryBudget(3),
+    "TeamViewSet.leave": QueryBudget(2),
+    "TeamViewSet.notes": QueryBudget(3),
+    "TeamViewSet.rotate_code": QueryBudget(2),
+    "NoteViewSet.create": QueryBudget(5),
+    "NoteViewSet.retrieve": QueryBudget(0),
+    "NoteViewSet.update": QueryBudget(5),
+    "NoteViewSet.partial_update": QueryBudget(4),
+    "NoteViewSet.destroy": QueryBudget(3),
+    "NoteViewSet.search": QueryBudget(2),
+    "NoteViewSet.bulk": QueryBudget(10),
+    "RegisterViewSet.create": QueryBudget(4),
+    "LoginViewSet.create": QueryBudget(2),
+    "TokenRefreshView.post": QueryBudget(5),
+    "TokenBlacklistView.post": QueryBudget(5),
+}
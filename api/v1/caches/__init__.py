@@ -0,0 +1,11 @@
+from api.v1.caches.note_cache import note_cache, get_note_tag
+from api.v1.caches.team_cache import team_cache, get_team_representation, get_team_tag
+
+
+__all__ = [
+    "note_cache",
+    "get_note_tag",
+    "team_cache",
+    "get_team_representation",
+    "get_team_tag",
+]
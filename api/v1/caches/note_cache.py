@@ -0,0 +1,42 @@
+from api.v1.models import Note
+from api.v1.serializers import NoteSerializer
+from api.v1.utils import ObjectCache
+
+
+def load_note(pk):
+    """
+    Return the team of the note, which readers must belong to, its row
+    version, when the note or its team last changed, the state of the rows
+    its representation embeds, the team as embedded, and that
+    representation, or `None` if there is no such note.
+    """
+    note = Note.objects.select_related("owner", "team").filter(pk=pk).first()
+    if note is None:
+        return None
+
+    return {
+        "team_id": note.team_id,
+        "version": note.version,
+        "modified": max(note.updated_at, note.team.updated_at),
+        "tag": get_note_tag(note),
+        "scope": (note.team_id, note.team.updated_at),
+        "data": dict(NoteSerializer(note).data),
+    }
+
+
+def get_note_tag(note):
+    """
+    Return the state of the rows the representation of a note embeds,
+    which the ETag covers along with its version: team and owner changes
+    do not move the note's own version.
+    """
+    return [
+        note.updated_at,
+        note.team.updated_at,
+        note.owner.username,
+        note.owner.email,
+    ]
+
+
+# Notes embed their team, so saving a team stales all of its notes at once.
+note_cache = ObjectCache("note", load_note, scope="team")
@@ -0,0 +1,57 @@
+from api.v1.models import Team
+from api.v1.serializers import TeamSerializer
+from api.v1.utils import ObjectCache
+
+
+def load_team(pk):
+    """
+    Return the row version of the team, when it last changed, the state of
+    the owner and members it embeds and its representation shared by every
+    reader, with its members but without `is_joined`, or `None` if there is
+    no such team.
+    """
+    team = (
+        Team.objects.select_related("owner")
+        .prefetch_related(TeamSerializer.get_members_prefetch())
+        .filter(pk=pk)
+        .first()
+    )
+    if team is None:
+        return None
+
+    serializer = TeamSerializer(team, context={"exclude_fields": ["code", "is_joined"]})
+    return {
+        "version": team.version,
+        "modified": team.updated_at,
+        "tag": get_team_tag(team, serializer.data["members"]),
+        "data": dict(serializer.data),
+    }
+
+
+def get_team_representation(payload, is_joined):
+    """
+    Layer the reader's `is_joined` over a cached team payload. Members are
+    only listed to members, as `TeamSerializer` does.
+    """
+    shared = payload["data"]
+    data = {key: value for key, value in shared.items() if key != "members"}
+    data["is_joined"] = is_joined
+    data["members"] = shared["members"] if is_joined else []
+    return data
+
+
+def get_team_tag(team, members):
+    """
+    Return the state of the owner and the serialized `members` the
+    representation of a team embeds, which the ETag covers along with its
+    version: owner and member changes do not move the team's own version.
+    """
+    return [
+        team.updated_at,
+        team.owner.username,
+        team.owner.email,
+        [[member["id"], member["username"], member["email"]] for member in members],
+    ]
+
+
+team_cache = ObjectCache("team", load_team)
@@ -0,0 +1,4 @@
+from api.v1.checks.cache_check import check_shared_caches
+
+
+__all__ = ["check_shared_caches"]
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+
+# Backends whose entries live in the memory of one worker.
+PROCESS_LOCAL_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+@register(Tags.caches)
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Warn when a cache that writes invalidate lives in each worker's memory
+    outside of development, where invalidations would not reach the other
+    workers.
+    """
+    if settings.DEBUG:
+        return []
+
+    warnings = []
+    for alias in (settings.MEMBERSHIP_CACHE_ALIAS, settings.OBJECT_CACHE_ALIAS):
+        backend = settings.CACHES.get(alias, {}).get("BACKEND")
+        if backend in PROCESS_LOCAL_BACKENDS:
+            warnings.append(
+                Warning(
+                    f"The `{alias}` cache keeps entries in each worker's memory.",
+                    hint=(
+                        "Other workers keep serving entries that a write "
+                        "replaced. Set `DJANGO_CACHE_URL` to a cache every "
+                        "worker shares."
+                    ),
+                    id="v1.W001",
+                )
+            )
+
+    return warnings
@@ -0,0 +1,169 @@
+import json
+import logging
+import platform
+import sqlite3
+import time
+import django
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from api.v1.benchmarks import (
+    SCENARIOS,
+    BenchmarkRunner,
+    build_dataset,
+    compare_results,
+    default_dataset_shape,
+)
+
+
+class Command(BaseCommand):
+
+    help = (
+        "Benchmark every API action against throwaway SQLite databases seeded "
+        "with the given note counts and report latency percentiles, "
+        "throughput and SQL queries per request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1000],
+            help="Note counts of the datasets to benchmark, e.g. 1000 100000 1000000.",
+        )
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=[scenario.name for scenario in SCENARIOS],
+            help="Only run this scenario; may be repeated.",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file.")
+        parser.add_argument(
+            "--baseline", help="Compare against a previously written JSON report."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Fractional latency increase over the baseline reported as a regression.",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="Exit with an error when the baseline comparison finds a regression.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("Benchmarks run against SQLite only.")
+
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not options["scenarios"] or scenario.name in options["scenarios"]
+        ]
+        runner = BenchmarkRunner(options["iterations"], options["warmup"], scenarios)
+        results = {}
+        datasets = {}
+
+        # DEBUG would record every query in memory and skew the timings, and
+        # the per-request instrumentation log would drown the report.
+        setup_test_environment(debug=False)
+        instrumentation_logger = logging.getLogger("api.v1.instrumentation")
+        log_level = instrumentation_logger.level
+        instrumentation_logger.setLevel(logging.WARNING)
+        try:
+            for size in options["sizes"]:
+                datasets[str(size)], results[str(size)] = self.run_size(
+                    runner, size, options["seed"]
+                )
+        finally:
+            instrumentation_logger.setLevel(log_level)
+            teardown_test_environment()
+
+        report = {
+            "meta": {
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+                "seed": options["seed"],
+                "datasets": datasets,
+            },
+            "results": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f"Report written to {options['output']}")
+
+        if options["baseline"]:
+            self.compare(report, options)
+
+    def run_size(self, runner, size, seed):
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        for alias in settings.CACHES:
+            caches[alias].clear()
+
+        try:
+            started = time.perf_counter()
+            users, teams = default_dataset_shape(size)
+            dataset = build_dataset(users, teams, notes=size, seed=seed)
+            self.stdout.write(
+                f"\nDataset: {dataset.notes} notes, {dataset.teams} teams, "
+                f"{dataset.users} users, {dataset.memberships} memberships "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+
+            results = runner.run(dataset)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.write_table(results)
+
+        return dataset._asdict(), results
+
+    def write_table(self, results):
+        self.stdout.write(
+            f"{'scenario':<28}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}"
+            f"{'p99 ms':>10}{'queries':>9}  statuses"
+        )
+        for name, stats in results.items():
+            self.stdout.write(
+                f"{name:<28}{stats['throughput_rps']:>9}{stats['p50_ms']:>10}"
+                f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+                f"{stats['queries_per_request']:>9}  {stats['statuses']}"
+            )
+
+    def compare(self, report, options):
+        with open(options["baseline"]) as file:
+            baseline = json.load(file)
+
+        regressions = compare_results(
+            report["results"], baseline.get("results", {}), options["threshold"]
+        )
+
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("\nNo regressions against baseline."))
+            return
+
+        self.stdout.write(self.style.WARNING("\nRegressions against baseline:"))
+        for size, name, metric, previous, current in regressions:
+            self.stdout.write(f"  [{size}] {name} {metric}: {previous} -> {current}")
+
+        if options["fail_on_regression"]:
+            raise CommandError(f"{len(regressions)} regression(s) against baseline.")
@@ -0,0 +1,29 @@
+import time
+from django.core.management.base import BaseCommand
+from api.v1.utils import prune_expired_tokens
+
+
+class Command(BaseCommand):
+
+    help = (
+        "Delete expired outstanding and blacklisted tokens in batches. "
+        "Meant to run periodically, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        def progress(deleted):
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  {deleted} tokens deleted")
+
+        deleted = prune_expired_tokens(options["batch_size"], progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {deleted} expired tokens "
+                f"({time.perf_counter() - started:.1f}s)."
+            )
+        )
@@ -0,0 +1,125 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from api.v1.models import User
+from api.v1.search import get_search_backend
+from api.v1.benchmarks import Distribution, build_dataset
+from api.v1.benchmarks.dataset_builder import (
+    DEFAULT_BODY_WORDS,
+    DEFAULT_NOTES_PER_TEAM,
+    DEFAULT_TEAM_SIZE,
+)
+
+
+class Command(BaseCommand):
+
+    help = (
+        "Bulk insert synthetic users, teams, memberships and notes for load "
+        "testing. Distributions are given as `fixed:N`, `uniform:LOW:HIGH`, "
+        "`normal:MEAN:STDDEV` or `pareto:ALPHA:SCALE`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10000)
+        parser.add_argument("--teams", type=int, default=2000)
+        parser.add_argument(
+            "--notes",
+            type=int,
+            help="Exact number of notes; by default the sum of --notes-per-team.",
+        )
+        parser.add_argument(
+            "--team-size",
+            default=str(DEFAULT_TEAM_SIZE),
+            help="Members per team, owner included.",
+        )
+        parser.add_argument(
+            "--max-team-size", type=int, default=DEFAULT_TEAM_SIZE.maximum
+        )
+        parser.add_argument("--notes-per-team", default=str(DEFAULT_NOTES_PER_TEAM))
+        parser.add_argument(
+            "--body-words",
+            default=str(DEFAULT_BODY_WORDS),
+            help="Words per note body.",
+        )
+        parser.add_argument(
+            "--password",
+            default="seed-password",
+            help="Password shared by every seeded user; hashed once.",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="seed",
+            help="Prefix of the generated usernames, emails and names.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--skip-search-index",
+            action="store_true",
+            help="Do not rebuild the note search index afterwards.",
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+        if len(f"{prefix}t{options['teams'] - 1}") > 20:
+            raise CommandError("--prefix is too long for the 20 character team names.")
+
+        if User.objects.filter(username=f"{prefix}0").exists():
+            raise CommandError(
+                f"Users prefixed `{prefix}` already exist; pass another --prefix."
+            )
+
+        try:
+            distributions = {
+                "team_size": Distribution.parse(
+                    options["team_size"],
+                    minimum=1,
+                    maximum=min(options["max_team_size"], options["users"]),
+                ),
+                "notes_per_team": Distribution.parse(options["notes_per_team"]),
+                "body_words": Distribution.parse(options["body_words"], minimum=1),
+            }
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self._last_report = 0.0
+        started = time.perf_counter()
+
+        dataset = build_dataset(
+            options["users"],
+            options["teams"],
+            notes=options["notes"],
+            password=options["password"],
+            prefix=prefix,
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            rebuild_search_index=False,
+            progress=self.report_progress,
+            **distributions,
+        )
+
+        if not options["skip_search_index"]:
+            index_started = time.perf_counter()
+            self.stdout.write("Rebuilding the note search index...")
+            get_search_backend().rebuild()
+            self.stdout.write(
+                f"Search index rebuilt in {time.perf_counter() - index_started:.1f}s"
+            )
+
+        elapsed = time.perf_counter() - started
+        rows = dataset.users + dataset.teams + dataset.memberships + dataset.notes
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {dataset.users} users, {dataset.teams} teams, "
+                f"{dataset.memberships} memberships and {dataset.notes} notes "
+                f"in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)."
+            )
+        )
+
+    def report_progress(self, name, written, total, elapsed):
+        now = time.perf_counter()
+        if written < total and now - self._last_report < 1.0:
+            return
+        self._last_report = now
+
+        rate = written / elapsed if elapsed else 0
+        self.stdout.write(f"  {name}: {written:,}/{total:,} ({rate:,.0f} rows/s)")
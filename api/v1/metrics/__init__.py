@@ -0,0 +1,22 @@
+from api.v1.metrics.metrics_registry import (
+    METRICS,
+    MetricsRegistry,
+    get_metrics_registry,
+    record_cache_lookup,
+)
+from api.v1.metrics.metrics_exposition import (
+    CONTENT_TYPE,
+    merge_snapshots,
+    render_metrics,
+)
+
+
+__all__ = [
+    "METRICS",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "record_cache_lookup",
+    "CONTENT_TYPE",
+    "merge_snapshots",
+    "render_metrics",
+]
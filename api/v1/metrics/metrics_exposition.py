@@ -0,0 +1,83 @@
+from api.v1.metrics.metrics_registry import METRICS
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def merge_snapshots(snapshots):
+    """
+    Sum the counters and histograms of several worker snapshots.
+    """
+    counters = {}
+    histograms = {}
+
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get("counters", []):
+            key = (name, tuple(sorted(labels.items())))
+            counters[key] = counters.get(key, 0) + value
+
+        for name, labels, state in snapshot.get("histograms", []):
+            if name not in METRICS or len(state) != len(METRICS[name][2]) + 2:
+                # Written by a worker running different bucket bounds.
+                continue
+            key = (name, tuple(sorted(labels.items())))
+            merged = histograms.get(key)
+            histograms[key] = (
+                list(state)
+                if merged is None
+                else [a + b for a, b in zip(merged, state)]
+            )
+
+    return counters, histograms
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_metrics(snapshots) -> str:
+    """
+    Render worker snapshots in the Prometheus text exposition format.
+    """
+    counters, histograms = merge_snapshots(snapshots)
+    lines = []
+
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+        if kind == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(
+                        f"{name}{_format_labels(labels)} {_format_value(value)}"
+                    )
+            continue
+
+        for (metric, labels), state in sorted(histograms.items()):
+            if metric != name:
+                continue
+
+            cumulative = 0
+            for bound, count in zip(buckets + ("+Inf",), state):
+                cumulative += count
+                bucket_labels = labels + (("le", _format_value(bound)),)
+                lines.append(
+                    f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                )
+
+            label_text = _format_labels(labels)
+            lines.append(f"{name}_sum{label_text} {_format_value(state[-1])}")
+            lines.append(f"{name}_count{label_text} {cumulative}")
+
+    return "\n".join(lines) + "\n"
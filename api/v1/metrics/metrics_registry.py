@@ -0,0 +1,332 @@
+import atexit
+import fcntl
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from django.conf import settings
+
+
+# Metric name -> (type, help text, histogram upper bounds).
+METRICS = {
+    "http_requests_total": (
+        "counter",
+        "Requests served, by view and status code.",
+        None,
+    ),
+    "http_request_duration_seconds": (
+        "histogram",
+        "Wall time of a request, by view.",
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    ),
+    "db_queries_per_request": (
+        "histogram",
+        "SQL statements executed by a request, by view.",
+        (1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+    ),
+    "db_duration_seconds": (
+        "histogram",
+        "Total SQL time of a request, by view.",
+        (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    ),
+    "throttle_rejections_total": (
+        "counter",
+        "Requests rejected by a throttle, by throttle scope.",
+        None,
+    ),
+    "cache_requests_total": (
+        "counter",
+        "Cache lookups, by cache name and result (hit or miss).",
+        None,
+    ),
+}
+
+# Snapshot of the counts of every worker that exited, within the metrics
+# directory.
+RETIRED_FILENAME = "retired.json"
+
+
+class _Shard:
+    """
+    Counters and histograms written by a single thread, or merged from
+    several shards.
+    """
+
+    def __init__(self, thread=None):
+        self.thread = thread
+        self.counters = {}
+        self.histograms = {}
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        shard = cls()
+        for name, labels, value in snapshot.get("counters", []):
+            shard.counters[(name, tuple(sorted(labels.items())))] = value
+        for name, labels, state in snapshot.get("histograms", []):
+            # Skip histograms written with different bucket bounds.
+            if name in METRICS and len(state) == len(METRICS[name][2]) + 2:
+                shard.histograms[(name, tuple(sorted(labels.items())))] = state
+
+        return shard
+
+    def merge(self, other):
+        """
+        Add the counts of another shard to this one.
+        """
+        for key, value in other.counters.copy().items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, state in other.histograms.copy().items():
+            merged = self.histograms.get(key)
+            self.histograms[key] = (
+                list(state)
+                if merged is None
+                else [a + b for a, b in zip(merged, state)]
+            )
+
+    def to_snapshot(self):
+        return {
+            "counters": [
+                [name, dict(labels), value]
+                for (name, labels), value in self.counters.items()
+            ],
+            "histograms": [
+                [name, dict(labels), state]
+                for (name, labels), state in self.histograms.items()
+            ],
+        }
+
+
+class MetricsRegistry:
+    """
+    Per-process metrics store.
+
+    Every thread writes to its own shard, so recording never takes a lock.
+    Shards are merged into a snapshot on demand and, when `METRICS_DIRECTORY`
+    is set, written to a per-process JSON file that the metrics endpoint
+    merges across every worker sharing the directory.
+
+    The shards of threads that ended, and the files of workers that exited
+    on this host, are folded into retired totals, so neither grows with the
+    number of threads or workers ever started while counts never go back.
+    """
+
+    def __init__(self, directory=None, flush_interval=1.0):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.filename = (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}.json"
+        )
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+        self._shards_lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard(threading.current_thread())
+            with self._shards_lock:
+                self._retire_dead_shards()
+                self._shards.append(shard)
+            return shard
+
+    def _retire_dead_shards(self):
+        # Called with `_shards_lock` held. A thread that ended writes no
+        # more, so its shard can be merged; the merge builds a new shard as
+        # a snapshot may be reading the current one.
+        dead = [shard for shard in self._shards if not shard.thread.is_alive()]
+        if not dead:
+            return
+
+        retired = _Shard()
+        for shard in [self._retired, *dead]:
+            retired.merge(shard)
+        self._retired = retired
+        self._shards = [shard for shard in self._shards if shard.thread.is_alive()]
+
+    def inc(self, name, labels, value=1):
+        key = (name, tuple(sorted(labels.items())))
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(sorted(labels.items())))
+        histograms = self._shard().histograms
+        buckets = METRICS[name][2]
+
+        state = histograms.get(key)
+        if state is None:
+            # One slot per bucket plus +Inf, followed by the sum.
+            state = histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+
+        state[bisect_left(buckets, value)] += 1
+        state[-1] += value
+
+    def snapshot(self):
+        """
+        Return the merged state of every shard as JSON-ready entries.
+        """
+        with self._shards_lock:
+            self._retire_dead_shards()
+            shards = [self._retired, *self._shards]
+
+        merged = _Shard()
+        for shard in shards:
+            merged.merge(shard)
+
+        return merged.to_snapshot()
+
+    def flush(self):
+        """
+        Atomically replace this process's snapshot file.
+        """
+        if not self.directory:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.filename)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+
+        with open(temp_path, "w") as file:
+            json.dump(self.snapshot(), file, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self):
+        if not self.directory:
+            return
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def collect(self):
+        """
+        Return the snapshots of every worker, this one included.
+        """
+        if not self.directory:
+            return [self.snapshot()]
+
+        self.flush()
+        self.retire_dead_workers()
+
+        snapshots = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            snapshot = self._read(entry.path)
+            if snapshot is not None:
+                snapshots.append(snapshot)
+
+        return snapshots
+
+    def retire_dead_workers(self):
+        """
+        Fold the files of the workers of this host that exited into the
+        retired snapshot file and remove them.
+        """
+        if not any(self._is_dead(entry.name) for entry in os.scandir(self.directory)):
+            return
+
+        # Scrapers of several workers may retire at once: the lock lets one
+        # of them merge each file exactly once.
+        with open(os.path.join(self.directory, "retired.lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            retired = _Shard()
+            dead = []
+            for entry in os.scandir(self.directory):
+                if entry.name == RETIRED_FILENAME or self._is_dead(entry.name):
+                    snapshot = self._read(entry.path)
+                    if snapshot is not None:
+                        retired.merge(_Shard.from_snapshot(snapshot))
+                    if entry.name != RETIRED_FILENAME:
+                        dead.append(entry.path)
+
+            if not dead:
+                return
+
+            path = os.path.join(self.directory, RETIRED_FILENAME)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump(retired.to_snapshot(), file, separators=(",", ":"))
+            os.replace(temp_path, path)
+
+            for path in dead:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _is_dead(filename):
+        """
+        Tell whether a snapshot file names a worker of this host that is no
+        longer running. Files of other hosts sharing the directory are never
+        retired, as their process ids mean nothing here.
+        """
+        if not filename.endswith(".json"):
+            return False
+
+        worker, _, _ = filename[: -len(".json")].rpartition("-")
+        host, _, pid = worker.rpartition("-")
+        if host != socket.gethostname() or not pid.isdigit():
+            return False
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+
+        return False
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry():
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = MetricsRegistry(
+                    directory=getattr(settings, "METRICS_DIRECTORY", None),
+                    flush_interval=getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0),
+                )
+                atexit.register(registry.flush)
+                _registry = registry
+
+    return _registry
+
+
+def record_cache_lookup(cache_name, hit):
+    get_metrics_registry().inc(
+        "cache_requests_total",
+        {"cache": cache_name, "result": "hit" if hit else "miss"},
+    )
+
+
+def _reset_registry():
+    # A registry inherited through fork would share its file with the parent.
+    global _registry
+    _registry = None
+
+
+os.register_at_fork(after_in_child=_reset_registry)
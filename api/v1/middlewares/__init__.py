@@ -0,0 +1,4 @@
+from api.v1.middlewares.instrumentation_middleware import InstrumentationMiddleware
+
+
+__all__ = ["InstrumentationMiddleware"]
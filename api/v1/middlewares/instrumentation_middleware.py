@@ -0,0 +1,120 @@
+import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from api.v1.metrics import get_metrics_registry
+from api.v1.utils import (
+    RequestMetrics,
+    activate_request_metrics,
+    deactivate_request_metrics,
+    get_instrumentation_setting,
+)
+
+
+logger = logging.getLogger("api.v1.instrumentation")
+
+
+class InstrumentationMiddleware:
+    """
+    Record SQL query count and time, serializer, render and wall time for
+    every request.
+
+    The numbers are exposed through a `Server-Timing` header and one
+    structured log line per request, tagged with the viewset action that
+    served it (see `InstrumentedViewSetMixin`). The line is logged at
+    DEBUG, or at INFO for requests slower than `SLOW_REQUEST_THRESHOLD`
+    seconds. Queries are counted by the `record_query` wrapper installed on
+    every connection.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not get_instrumentation_setting("ENABLED"):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.server_timing = get_instrumentation_setting("SERVER_TIMING")
+        self.log_duplicates = get_instrumentation_setting("LOG_DUPLICATE_QUERIES")
+        self.duplicate_threshold = get_instrumentation_setting(
+            "DUPLICATE_QUERY_THRESHOLD"
+        )
+        self.slow_threshold = get_instrumentation_setting("SLOW_REQUEST_THRESHOLD")
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics(track_fingerprints=self.log_duplicates)
+        token = activate_request_metrics(metrics)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            deactivate_request_metrics(token)
+
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics(track_fingerprints=self.log_duplicates)
+        token = activate_request_metrics(metrics)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            deactivate_request_metrics(token)
+
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        metrics.finish()
+
+        if metrics.view_name is None and request.resolver_match is not None:
+            metrics.view_name = request.resolver_match.view_name
+
+        if self.server_timing:
+            response["Server-Timing"] = metrics.server_timing()
+
+        self.log(request, response, metrics)
+        self.record(response, metrics)
+
+        return response
+
+    def record(self, response, metrics):
+        registry = get_metrics_registry()
+        labels = {"view": metrics.view_name or "unmatched"}
+
+        registry.inc(
+            "http_requests_total", {**labels, "status": str(response.status_code)}
+        )
+        registry.observe("http_request_duration_seconds", labels, metrics.wall_time)
+        registry.observe("db_queries_per_request", labels, metrics.query_count)
+        registry.observe("db_duration_seconds", labels, metrics.sql_time)
+        registry.maybe_flush()
+
+    def log(self, request, response, metrics):
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            **metrics.as_log_fields(),
+        }
+        level = (
+            logging.INFO if metrics.wall_time >= self.slow_threshold else logging.DEBUG
+        )
+        logger.log(
+            level,
+            " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"metrics": fields},
+        )
+
+        for sql, count in metrics.duplicate_queries(self.duplicate_threshold):
+            logger.warning(
+                "view=%s duplicate_query count=%d sql=%s",
+                metrics.view_name,
+                count,
+                sql,
+            )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-16 23:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['created_at', 'id'], name='team_created_at_id_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-16 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0002_team_created_at_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['team', 'created_at'], name='note_team_created_at_idx'),
+        ),
+    ]
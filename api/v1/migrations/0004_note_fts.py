@@ -0,0 +1,52 @@
+from html import unescape
+from django.db import migrations
+from django.utils.html import strip_tags
+
+
+def create_note_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS v1_note_fts USING fts5("
+        "title, body, team_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    )
+
+    Note = apps.get_model("v1", "Note")
+    notes = Note.objects.using(schema_editor.connection.alias).values_list(
+        "id", "title", "body", "team_id"
+    )
+    rows = [
+        (
+            note_id,
+            unescape(strip_tags(title)),
+            unescape(strip_tags(body or "")),
+            team_id,
+        )
+        for note_id, title, body, team_id in notes.iterator()
+    ]
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO v1_note_fts (rowid, title, body, team_id) "
+            "VALUES (%s, %s, %s, %s)",
+            rows,
+        )
+
+
+def drop_note_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute("DROP TABLE IF EXISTS v1_note_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("v1", "0003_note_team_created_at_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_note_fts, drop_note_fts),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.13 on 2026-10-17 00:00
+
+import api.v1.utils.code_generator_util
+from django.db import migrations, models
+
+
+def deduplicate_team_codes(apps, schema_editor):
+    Team = apps.get_model("v1", "Team")
+    teams = Team.objects.using(schema_editor.connection.alias)
+
+    codes = set()
+    for team in teams.only("id", "code").order_by("id").iterator():
+        if team.code not in codes:
+            codes.add(team.code)
+            continue
+
+        code = api.v1.utils.code_generator_util.code_generator()
+        while code in codes or teams.filter(code=code).exists():
+            code = api.v1.utils.code_generator_util.code_generator()
+
+        codes.add(code)
+        teams.filter(id=team.id).update(code=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0004_note_fts'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_team_codes, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='team',
+            name='code_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='team',
+            name='code',
+            field=models.CharField(default=api.v1.utils.code_generator_util.code_generator, max_length=8, unique=True),
+        ),
+    ]
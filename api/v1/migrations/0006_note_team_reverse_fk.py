@@ -0,0 +1,79 @@
+# Generated by Django 4.2.13 on 2026-10-17 00:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def reconcile_team_notes(apps, schema_editor):
+    """
+    Make `Note.team` agree with the `Team.notes` through-table before it is
+    dropped. A note keeps its team when the through-table lists it there;
+    otherwise it moves to the team of its most recent through row.
+    """
+    Team = apps.get_model("v1", "Team")
+    Note = apps.get_model("v1", "Note")
+    TeamNotes = Team.notes.through
+    alias = schema_editor.connection.alias
+
+    teams_by_note = {}
+    rows = (
+        TeamNotes.objects.using(alias)
+        .order_by("id")
+        .values_list("note_id", "team_id")
+    )
+    for note_id, team_id in rows.iterator():
+        teams_by_note.setdefault(note_id, []).append(team_id)
+
+    moved = []
+    notes = Note.objects.using(alias).filter(id__in=list(teams_by_note))
+    for note_id, team_id in notes.values_list("id", "team_id").iterator():
+        team_ids = teams_by_note[note_id]
+        if team_id not in team_ids:
+            moved.append((team_ids[-1], note_id))
+
+    for team_id, note_id in moved:
+        Note.objects.using(alias).filter(id=note_id).update(team_id=team_id)
+
+    if moved and schema_editor.connection.vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(
+                "UPDATE v1_note_fts SET team_id = %s WHERE rowid = %s", moved
+            )
+
+
+def restore_team_notes(apps, schema_editor):
+    Team = apps.get_model("v1", "Team")
+    Note = apps.get_model("v1", "Note")
+    TeamNotes = Team.notes.through
+    alias = schema_editor.connection.alias
+
+    TeamNotes.objects.using(alias).bulk_create(
+        [
+            TeamNotes(team_id=team_id, note_id=note_id)
+            for note_id, team_id in Note.objects.using(alias)
+            .values_list("id", "team_id")
+            .iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('v1', '0005_team_code_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(reconcile_team_notes, restore_team_notes),
+        migrations.RemoveField(
+            model_name='team',
+            name='notes',
+        ),
+        migrations.AlterField(
+            model_name='note',
+            name='team',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notes', to='v1.team'),
+        ),
+    ]
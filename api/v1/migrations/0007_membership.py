@@ -0,0 +1,128 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_memberships(apps, schema_editor):
+    Team = apps.get_model("v1", "Team")
+    User = apps.get_model("v1", "User")
+    Membership = apps.get_model("v1", "Membership")
+    alias = schema_editor.connection.alias
+
+    owners = [
+        Membership(team_id=team_id, user_id=owner_id, role="owner")
+        for team_id, owner_id in Team.objects.using(alias)
+        .values_list("id", "owner_id")
+        .iterator()
+    ]
+    Membership.objects.using(alias).bulk_create(owners, batch_size=1000)
+
+    for through in (Team.members.through, User.teams.through):
+        members = [
+            Membership(team_id=team_id, user_id=user_id, role="member")
+            for team_id, user_id in through.objects.using(alias)
+            .values_list("team_id", "user_id")
+            .iterator()
+        ]
+        Membership.objects.using(alias).bulk_create(
+            members, batch_size=1000, ignore_conflicts=True
+        )
+
+
+def restore_memberships(apps, schema_editor):
+    Team = apps.get_model("v1", "Team")
+    Membership = apps.get_model("v1", "Membership")
+    TeamMembers = Team.members.through
+    alias = schema_editor.connection.alias
+
+    TeamMembers.objects.using(alias).bulk_create(
+        [
+            TeamMembers(team_id=team_id, user_id=user_id)
+            for team_id, user_id in Membership.objects.using(alias)
+            .filter(role="member")
+            .values_list("team_id", "user_id")
+            .iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("v1", "0006_note_team_reverse_fk"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Membership",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "role",
+                    models.CharField(
+                        choices=[("owner", "Owner"), ("member", "Member")],
+                        default="member",
+                        max_length=10,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "team",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="memberships",
+                        to="v1.team",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="memberships",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="membership",
+            constraint=models.UniqueConstraint(
+                fields=("team", "user"), name="membership_team_user_unique"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="membership",
+            index=models.Index(
+                fields=["user", "team", "role"], name="membership_user_team_role_idx"
+            ),
+        ),
+        migrations.RunPython(copy_memberships, restore_memberships),
+        migrations.RemoveField(
+            model_name="user",
+            name="teams",
+        ),
+        migrations.RemoveField(
+            model_name="team",
+            name="members",
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="members",
+            field=models.ManyToManyField(
+                blank=True,
+                related_name="teams",
+                through="v1.Membership",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+# `jti` is already indexed by its unique constraint; pruning filters on
+# `expires_at`, which the blacklist app leaves unindexed.
+EXPIRES_AT_INDEX = models.Index(
+    fields=["expires_at"], name="outstandingtoken_expires_idx"
+)
+
+
+def add_expires_at_index(apps, schema_editor):
+    OutstandingToken = apps.get_model("token_blacklist", "OutstandingToken")
+    schema_editor.add_index(OutstandingToken, EXPIRES_AT_INDEX)
+
+
+def remove_expires_at_index(apps, schema_editor):
+    OutstandingToken = apps.get_model("token_blacklist", "OutstandingToken")
+    schema_editor.remove_index(OutstandingToken, EXPIRES_AT_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("v1", "0007_membership"),
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_expires_at_index, remove_expires_at_index),
+    ]
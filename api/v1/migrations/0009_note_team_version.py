@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("v1", "0008_outstandingtoken_expires_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="note",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
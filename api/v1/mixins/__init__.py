@@ -0,0 +1,16 @@
+from api.v1.mixins.object_lookup_mixin import ObjectLookupMixin
+from api.v1.mixins.instrumented_viewset_mixin import InstrumentedViewSetMixin
+from api.v1.mixins.instrumented_serializer_mixin import InstrumentedSerializerMixin
+from api.v1.mixins.sanitized_serializer_mixin import SanitizedSerializerMixin
+from api.v1.mixins.async_viewset_mixin import AsyncViewSetMixin
+from api.v1.mixins.conditional_request_mixin import ConditionalRequestMixin
+
+
+__all__ = [
+    "ObjectLookupMixin",
+    "InstrumentedViewSetMixin",
+    "InstrumentedSerializerMixin",
+    "SanitizedSerializerMixin",
+    "AsyncViewSetMixin",
+    "ConditionalRequestMixin",
+]
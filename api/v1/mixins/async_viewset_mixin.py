@@ -0,0 +1,143 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework_simplejwt.settings import api_settings
+
+
+class AsyncViewSetMixin:
+    """
+    Serve a viewset from the event loop under ASGI.
+
+    Handlers written as `async def` are awaited directly and the remaining
+    ones run in a single `sync_to_async` hop. Authentication, permission
+    and throttle checks run inline whenever stateless authentication keeps
+    them free of queries, except for throttles whose store is `blocking`.
+    Overridden handlers inherit the swagger schema of the handler they
+    replace.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, handler in list(vars(cls).items()):
+            if not iscoroutinefunction(handler) or hasattr(
+                handler, "_swagger_auto_schema"
+            ):
+                continue
+
+            replaced = getattr(super(cls, cls), name, None)
+            schema = getattr(replaced, "_swagger_auto_schema", None)
+            if schema is not None:
+                handler._swagger_auto_schema = schema
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        return markcoroutinefunction(super().as_view(actions, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Async counterpart of `APIView.dispatch()`.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        # Token-backed users only need the user row to check revoked tokens.
+        if not settings.STATELESS_JWT_AUTHENTICATION or api_settings.CHECK_REVOKE_TOKEN:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            return
+
+        if not any(
+            getattr(throttle, "blocking", True) for throttle in self.get_throttles()
+        ):
+            self.initial(request, *args, **kwargs)
+            return
+
+        # Throttles whose store may block are checked in a thread hop.
+        self._defer_throttles = True
+        try:
+            self.initial(request, *args, **kwargs)
+        finally:
+            self._defer_throttles = False
+        await sync_to_async(self.check_throttles)(request)
+
+    def check_throttles(self, request):
+        if not getattr(self, "_defer_throttles", False):
+            super().check_throttles(request)
+
+    async def aget_object(self, queryset=None):
+        """
+        Async counterpart of `get_object()`, raising the model's
+        `DoesNotExist` when nothing matches like `ObjectLookupMixin`.
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+        queryset = self.filter_queryset(queryset)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+
+        try:
+            obj = await queryset.aget(**lookup)
+        except (TypeError, ValueError, DjangoValidationError):
+            raise queryset.model.DoesNotExist
+
+        await self.acheck_object_permissions(self.request, obj)
+        return obj
+
+    async def acheck_object_permissions(self, request, obj):
+        """
+        Check object permissions, awaiting `ahas_object_permission()` on the
+        permissions that define it.
+        """
+        for permission in self.get_permissions():
+            check = getattr(permission, "ahas_object_permission", None)
+            if check is not None:
+                allowed = await check(request, self, obj)
+            else:
+                allowed = permission.has_object_permission(request, self, obj)
+
+            if not allowed:
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, "message", None),
+                    code=getattr(permission, "code", None),
+                )
+
+    async def aperform(self, perform, serializer):
+        """
+        Validate `serializer` and pass it to `perform` in one thread hop.
+
+        Model field validators and `transaction.atomic()` have no async
+        API, so a write keeps them together rather than hopping per query.
+        """
+
+        def validate_and_perform():
+            serializer.is_valid(raise_exception=True)
+            perform(serializer)
+
+        await sync_to_async(validate_and_perform)()
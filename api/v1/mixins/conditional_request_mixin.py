@@ -0,0 +1,161 @@
+import hashlib
+from datetime import datetime
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags
+from rest_framework.response import Response
+from api.v1.models import VersionConflict
+
+
+class ConditionalRequestMixin:
+    """
+    Tag responses with a strong `ETag` and a `Last-Modified` date, and
+    answer `If-None-Match` and `If-Modified-Since` with 304 Not Modified.
+
+    Validators come from the state of the rows in the database, their
+    version, `updated_at` and what they embed from other rows, never from
+    the serialized body, so every worker tags the same state alike and a
+    client whose copy is current costs no serialization. The ETag wins when
+    a client sends both headers, as `Last-Modified` does not move when a
+    related owner or member changes.
+
+    ETags of versioned objects lead with the row version, which updates
+    check `If-Match` against.
+    """
+
+    def get_validated_response(self, request, etag, last_modified, build):
+        """
+        Return 304 if the client's copy matches the validators, otherwise the
+        response `build()` returns, tagged with them.
+        """
+        response = self.get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = build()
+
+        return self.set_validators(response, etag, last_modified)
+
+    def get_validated_page_response(
+        self, request, queryset, validators=None, get_tags=None
+    ):
+        """
+        Paginate `queryset` like `list()` does, tagging the page with
+        validators read from the database along with the page: the id,
+        version and `updated_at` of every row, and the `validators`
+        expressions covering what a row embeds from other tables.
+        `get_tags(rows)` maps row ids to what else a row depends on for the
+        reader.
+
+        The page is cut on those columns alone, so a client whose copy is
+        current gets 304 without the rows being loaded.
+        """
+        validators = validators or {}
+        rows = self.paginate_queryset(
+            queryset.values("id", "created_at", "version", "updated_at", **validators)
+        )
+        if rows is None:
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+
+        etag, last_modified = self.get_page_validators(
+            rows, validators, get_tags(rows) if get_tags else {}
+        )
+
+        return self.get_validated_response(
+            request,
+            etag,
+            last_modified,
+            lambda: self.get_page_response(queryset, rows),
+        )
+
+    def get_page_response(self, queryset, rows):
+        """
+        Load and serialize the rows of a page cut by
+        `get_validated_page_response`, in page order.
+        """
+        instances = queryset.in_bulk([row["id"] for row in rows])
+        page = [instances[row["id"]] for row in rows if row["id"] in instances]
+
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def get_page_validators(self, rows, validators, tags):
+        """
+        Return the ETag and `Last-Modified` date of a page of row values.
+        Timestamps among the `validators` count towards the date.
+        """
+        fields = ["id", "version", "updated_at", *validators]
+        etag = self.make_etag(
+            self.paginator.has_previous,
+            self.paginator.has_next,
+            *([row[field] for field in fields] + [tags.get(row["id"])] for row in rows),
+        )
+        timestamps = [
+            row[field]
+            for row in rows
+            for field in fields
+            if isinstance(row[field], datetime)
+        ]
+
+        return etag, max(timestamps, default=None)
+
+    def get_not_modified_response(self, request, etag, last_modified):
+        """
+        Return 304, or 412 for a failed `If-Match`, if the request's
+        preconditions settle it, otherwise `None`.
+        """
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=self._timestamp(last_modified),
+        )
+
+    def check_if_match(self, instance):
+        """
+        Raise `VersionConflict` unless `If-Match` is absent, `*`, or names
+        an ETag of the version `instance` was read at.
+        """
+        header = self.request.headers.get("If-Match")
+        if header is None or header.strip() == "*":
+            return
+
+        versions = set()
+        for etag in parse_etags(header):
+            # `If-Match` uses the strong comparison, which weak tags fail.
+            version, _, _ = etag.strip('"').partition("-")
+            if not etag.startswith("W/") and version.isdigit():
+                versions.add(int(version))
+
+        if instance.version not in versions:
+            raise VersionConflict(
+                f"{instance._meta.object_name} {instance.pk} is at version "
+                f"{instance.version}."
+            )
+
+    def set_saved_validators(self, etag, last_modified):
+        """
+        Tag the response to a write with the validators of the object as it
+        was saved, so the client can chain a conditional request without
+        reading it again.
+        """
+        self.headers["ETag"] = etag
+        self.headers["Last-Modified"] = http_date(self._timestamp(last_modified))
+
+    def set_validators(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(self._timestamp(last_modified))
+
+        return response
+
+    @staticmethod
+    def make_etag(*parts, version=None):
+        """
+        Return a strong ETag naming the given parts, led by the row
+        `version` of a versioned object.
+        """
+        value = "\n".join(str(part) for part in parts)
+        digest = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+        return f'"{digest}"' if version is None else f'"{version}-{digest}"'
+
+    @staticmethod
+    def _timestamp(value):
+        return None if value is None else int(value.timestamp())
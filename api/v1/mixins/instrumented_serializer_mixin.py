@@ -0,0 +1,20 @@
+from api.v1.utils import get_request_metrics
+
+
+class InstrumentedSerializerMixin:
+    """
+    Add the time spent in `to_representation` to the request metrics.
+
+    Nested serializers are only counted once, by the outermost call.
+    """
+
+    def to_representation(self, instance):
+        metrics = get_request_metrics()
+        if metrics is None:
+            return super().to_representation(instance)
+
+        started = metrics.enter_serializer()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.exit_serializer(started)
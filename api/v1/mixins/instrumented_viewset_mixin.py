@@ -0,0 +1,44 @@
+from api.v1.metrics import get_metrics_registry
+from api.v1.utils import get_request_metrics
+
+
+class InstrumentedViewSetMixin:
+    """
+    Tag the request metrics with the `<ViewSet>.<action>` that served the
+    request, time how long the response takes to render and count throttle
+    rejections by scope.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        metrics = get_request_metrics()
+        if metrics is not None:
+            action = getattr(self, "action", None) or request.method.lower()
+            metrics.view_name = f"{self.__class__.__name__}.{action}"
+
+        super().initial(request, *args, **kwargs)
+
+    def check_throttles(self, request):
+        throttle_durations = []
+        for throttle in self.get_throttles():
+            if not throttle.allow_request(request, self):
+                get_metrics_registry().inc(
+                    "throttle_rejections_total",
+                    {"scope": getattr(throttle, "scope", type(throttle).__name__)},
+                )
+                throttle_durations.append(throttle.wait())
+
+        if throttle_durations:
+            durations = [
+                duration for duration in throttle_durations if duration is not None
+            ]
+            self.throttled(request, max(durations, default=None))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        metrics = get_request_metrics()
+        if metrics is not None and hasattr(response, "add_post_render_callback"):
+            metrics.start_render()
+            response.add_post_render_callback(lambda rendered: metrics.stop_render())
+
+        return response
@@ -0,0 +1,28 @@
+from django.core.exceptions import ValidationError
+from django.http import Http404
+
+
+class ObjectLookupMixin:
+    """
+    Raise the model's `DoesNotExist` when `get_object()` finds nothing, so
+    the viewset handlers answer 404 instead of a generic 500.
+    """
+
+    def get_object(self):
+        try:
+            return super().get_object()
+        except Http404:
+            raise self.get_queryset().model.DoesNotExist
+
+    def get_object_pk(self):
+        """
+        Return the primary key named by the URL, raising the model's
+        `DoesNotExist` if it cannot be one.
+        """
+        model = self.queryset.model
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+
+        try:
+            return model._meta.pk.to_python(self.kwargs[lookup_url_kwarg])
+        except ValidationError:
+            raise model.DoesNotExist
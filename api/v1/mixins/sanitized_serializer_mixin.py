@@ -0,0 +1,21 @@
+from api.v1.utils import sanitize
+
+
+class SanitizedSerializerMixin:
+    """
+    Sanitize the string fields named in `sanitize_policies` with their
+    `SanitizePolicy` once they pass field validation. Fields left out are
+    stored as given.
+    """
+
+    sanitize_policies = {}
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+
+        for field, policy in self.sanitize_policies.items():
+            value = attrs.get(field)
+            if isinstance(value, str):
+                attrs[field] = sanitize(value, policy)
+
+        return attrs
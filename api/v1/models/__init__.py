@@ -1,6 +1,8 @@
+from api.v1.models.versioned import VersionConflict
 from api.v1.models.users import User
 from api.v1.models.teams import Team
 from api.v1.models.notes import Note
+from api.v1.models.memberships import Membership
 
 
-__all__ = ["User", "Team", "Note"]
+__all__ = ["VersionConflict", "User", "Team", "Note", "Membership"]
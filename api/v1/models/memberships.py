@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class Membership(models.Model):
+
+    class Role(models.TextChoices):
+        OWNER = "owner", "Owner"
+        MEMBER = "member", "Member"
+
+    team = models.ForeignKey(
+        "Team", on_delete=models.CASCADE, related_name="memberships", blank=False
+    )
+    user = models.ForeignKey(
+        "User", on_delete=models.CASCADE, related_name="memberships", blank=False
+    )
+    role = models.CharField(max_length=10, choices=Role.choices, default=Role.MEMBER)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["team", "user"], name="membership_team_user_unique"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "team", "role"], name="membership_user_team_role_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} in {self.team_id} ({self.role})"
@@ -1,16 +1,25 @@
 from django.db import models
+from api.v1.models.versioned import VersionedModel
 
 
-class Note(models.Model):
+class Note(VersionedModel):
 
     title = models.CharField(max_length=100, unique=True, blank=False, null=False)
     body = models.TextField(blank=True, null=True)
 
-    team = models.ForeignKey("Team", on_delete=models.CASCADE, blank=False)
+    team = models.ForeignKey(
+        "Team", on_delete=models.CASCADE, related_name="notes", blank=False
+    )
     owner = models.ForeignKey("User", on_delete=models.CASCADE, blank=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+
+        indexes = [
+            models.Index(fields=["team", "created_at"], name="note_team_created_at_idx")
+        ]
+
     def __str__(self):
         return self.title
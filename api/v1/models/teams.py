@@ -1,22 +1,90 @@
-from django.db import models
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+from api.v1.models.memberships import Membership
+from api.v1.models.versioned import VersionedModel
 from api.v1.utils import code_generator
 
 
-class Team(models.Model):
+class Team(VersionedModel):
+
+    CODE_ALLOCATION_ATTEMPTS = 5
 
     profile = models.URLField(blank=True, null=True)
     code = models.CharField(
-        max_length=8, default=code_generator, blank=False, null=False
+        max_length=8, default=code_generator, unique=True, blank=False, null=False
     )
+    code_expires_at = models.DateTimeField(blank=True, null=True)
     name = models.CharField(max_length=20, unique=True, blank=False, null=False)
     description = models.TextField(blank=True, null=True)
 
     owner = models.ForeignKey("User", on_delete=models.CASCADE, blank=False)
-    members = models.ManyToManyField("User", related_name="user_team", blank=True)
-    notes = models.ManyToManyField("Note", related_name="team_notes", blank=True)
+    members = models.ManyToManyField(
+        "User", through="Membership", related_name="teams", blank=True
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="team_created_at_id_idx")
+        ]
+
     def __str__(self):
         return self.name
+
+    @property
+    def code_is_expired(self):
+        return (
+            self.code_expires_at is not None and self.code_expires_at <= timezone.now()
+        )
+
+    def save(self, *args, **kwargs):
+
+        if not self._state.adding:
+            return super().save(*args, **kwargs)
+
+        if self.code_expires_at is None and settings.TEAM_CODE_TTL:
+            self.code_expires_at = timezone.now() + settings.TEAM_CODE_TTL
+
+        with transaction.atomic():
+            self._save_with_unique_code(
+                lambda: super(Team, self).save(*args, **kwargs)
+            )
+            Membership.objects.create(
+                team=self, user_id=self.owner_id, role=Membership.Role.OWNER
+            )
+
+    def rotate_code(self, ttl=None):
+        """
+        Replace the invite code, invalidating the previous one.
+        """
+        ttl = settings.TEAM_CODE_TTL if ttl is None else ttl
+
+        self.code = code_generator()
+        self.code_expires_at = timezone.now() + ttl if ttl else None
+
+        self._save_with_unique_code(
+            lambda: super(Team, self).save(
+                update_fields=["code", "code_expires_at", "updated_at"]
+            )
+        )
+
+    def _save_with_unique_code(self, save):
+        """
+        Run `save`, drawing a fresh code whenever the unique index reports
+        that the current one is taken.
+        """
+        for attempt in range(self.CODE_ALLOCATION_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return save()
+            except IntegrityError:
+                taken = Team.objects.filter(code=self.code).exclude(pk=self.pk)
+                if not taken.exists():
+                    raise
+                self.code = code_generator()
+
+        raise IntegrityError("Could not allocate a unique team code.")
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import DEFERRED
 
 
 class User(AbstractUser):
@@ -11,10 +12,31 @@ class User(AbstractUser):
     last_name = models.CharField(max_length=40, blank=True, null=True)
     email = models.EmailField(unique=True, blank=False, null=False)
 
-    teams = models.ManyToManyField("Team", related_name="team_user", blank=True)
-
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
     def __str__(self):
         return self.email
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super().from_db(db, field_names, values)
+        # Kept to tell whether a save changed what teams and notes display.
+        user._loaded_values = dict(zip(field_names, values))
+        return user
+
+    def has_changed(self, *fields):
+        """
+        Whether any of `fields` differs from the value it was loaded with.
+        Users that were not loaded from the database count as changed.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            return True
+
+        for field in fields:
+            value = loaded.get(field, DEFERRED)
+            if value is DEFERRED or value != getattr(self, field):
+                return True
+
+        return False
@@ -0,0 +1,51 @@
+from django.db import models
+
+
+class VersionConflict(Exception):
+    """
+    Raised when saving an instance whose row was changed, or deleted, since
+    the instance was read.
+    """
+
+
+class VersionedModel(models.Model):
+    """
+    Model updated with optimistic concurrency.
+
+    Each update is a single `UPDATE ... WHERE id = ? AND version = ?` that
+    also increments `version`, so a write based on a stale read raises
+    `VersionConflict` instead of silently undoing a concurrent one.
+    """
+
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    class Meta:
+
+        abstract = True
+
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        if self._state.adding:
+            return super()._do_update(
+                base_qs, using, pk_val, values, update_fields, forced_update
+            )
+
+        field = self._meta.get_field("version")
+        values = [value for value in values if value[0] is not field]
+        values.append((field, None, self.version + 1))
+
+        updated = super()._do_update(
+            base_qs.filter(version=self.version),
+            using,
+            pk_val,
+            values,
+            update_fields,
+            forced_update,
+        )
+        if not updated:
+            raise VersionConflict(
+                f"{self._meta.object_name} {pk_val} is no longer at version "
+                f"{self.version}."
+            )
+
+        self.version += 1
+        return updated
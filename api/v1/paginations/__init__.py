@@ -0,0 +1,4 @@
+from api.v1.paginations.keyset_pagination import KeysetPagination
+
+
+__all__ = ["KeysetPagination"]
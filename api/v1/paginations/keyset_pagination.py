@@ -0,0 +1,141 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+Keyset = namedtuple("Keyset", ["reverse", "value", "pk"])
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination keyed on `(created_at, id)`.
+
+    Every page is a single indexed range scan, so deep pages cost the same
+    as the first one and rows inserted concurrently never shift a page.
+    """
+
+    ordering = "-created_at"
+    ordering_query_param = "ordering"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        field = self.ordering[0].lstrip("-")
+        descending = self.ordering[0].startswith("-")
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        if descending != reverse:
+            queryset = queryset.order_by(f"-{field}", "-pk")
+        else:
+            queryset = queryset.order_by(field, "pk")
+
+        if self.cursor is not None:
+            lookup = "lt" if descending != reverse else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": self.cursor.value})
+                | Q(**{field: self.cursor.value, f"pk__{lookup}": self.cursor.pk})
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        has_following_page = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_following_page
+        else:
+            self.has_next = has_following_page
+            self.has_previous = self.cursor is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Resolve the direction of the keyset from `?ordering=` or the view.
+        """
+        field = self.ordering.lstrip("-")
+        allowed = (field, f"-{field}")
+
+        requested = request.query_params.get(self.ordering_query_param)
+        if requested in allowed:
+            return (requested,)
+
+        view_ordering = getattr(view, "ordering", None) or []
+        if isinstance(view_ordering, str):
+            view_ordering = [view_ordering]
+        if view_ordering and view_ordering[0] in allowed:
+            return (view_ordering[0],)
+
+        return (self.ordering,)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        if not self.page:
+            return self.encode_cursor(self.cursor._replace(reverse=False))
+
+        return self.encode_cursor(self._get_keyset(self.page[-1], reverse=False))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return self.encode_cursor(self.cursor._replace(reverse=True))
+
+        return self.encode_cursor(self._get_keyset(self.page[0], reverse=True))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            reverse, value, pk = json.loads(
+                urlsafe_b64decode((encoded + padding).encode("ascii"))
+            )
+            value = parse_datetime(value)
+            if value is None:
+                raise ValueError(encoded)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Keyset(reverse=bool(reverse), value=value, pk=int(pk))
+
+    def encode_cursor(self, cursor):
+        payload = json.dumps(
+            [int(cursor.reverse), cursor.value.isoformat(), cursor.pk],
+            separators=(",", ":"),
+        )
+        encoded = urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded.rstrip("=")
+        )
+
+    def _get_keyset(self, instance, reverse):
+        field = self.ordering[0].lstrip("-")
+
+        if isinstance(instance, dict):
+            return Keyset(reverse=reverse, value=instance[field], pk=instance["id"])
+
+        return Keyset(reverse=reverse, value=getattr(instance, field), pk=instance.pk)
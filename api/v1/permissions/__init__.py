@@ -1,4 +1,5 @@
 from api.v1.permissions.team_permission import IsOwner
+from api.v1.permissions.team_member_permission import IsTeamMember
 
 
-__all__ = ["IsOwner"]
+__all__ = ["IsOwner", "IsTeamMember"]
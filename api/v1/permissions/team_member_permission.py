@@ -0,0 +1,13 @@
+from rest_framework.permissions import BasePermission
+from api.v1.utils import aget_user_team_ids, get_user_team_ids
+
+
+class IsTeamMember(BasePermission):
+
+    def has_object_permission(self, request, view, obj):
+        team_id = getattr(obj, "team_id", obj.pk)
+        return team_id in get_user_team_ids(request.user.id)
+
+    async def ahas_object_permission(self, request, view, obj):
+        team_id = getattr(obj, "team_id", obj.pk)
+        return team_id in await aget_user_team_ids(request.user.id)
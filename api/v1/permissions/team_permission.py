@@ -4,4 +4,4 @@ from rest_framework.permissions import BasePermission
 class IsOwner(BasePermission):
 
     def has_object_permission(self, request, view, obj):
-        return request.user == obj.owner
+        return request.user.id == obj.owner_id
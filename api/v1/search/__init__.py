@@ -0,0 +1,12 @@
+from api.v1.search.base_backend import SearchBackend, SearchHit, get_search_backend
+from api.v1.search.database_backend import DatabaseSearchBackend
+from api.v1.search.sqlite_backend import SQLiteFTSBackend
+
+
+__all__ = [
+    "SearchBackend",
+    "SearchHit",
+    "get_search_backend",
+    "DatabaseSearchBackend",
+    "SQLiteFTSBackend",
+]
@@ -0,0 +1,76 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+from html import unescape
+from django.conf import settings
+from django.utils.html import escape, strip_tags
+from django.utils.module_loading import import_string
+
+
+SearchHit = namedtuple("SearchHit", ["note_id", "rank", "title", "body"])
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchBackend:
+    """
+    Interface every note search backend implements.
+
+    Backends receive notes as they are saved or deleted, cascades and bulk
+    writes included, and answer ranked queries restricted to a set of team
+    ids.
+    """
+
+    highlight_start = "<mark>"
+    highlight_end = "</mark>"
+
+    # Private-use code points that mark matches inside plain text until the
+    # text is escaped and the markers are swapped for real tags.
+    match_start = "\ue000"
+    match_end = "\ue001"
+
+    def index_notes(self, notes):
+        raise NotImplementedError("`index_notes()` must be implemented.")
+
+    def remove_notes(self, note_ids):
+        raise NotImplementedError("`remove_notes()` must be implemented.")
+
+    def search(self, query, team_ids, limit, offset=0):
+        """
+        Return up to `limit` `SearchHit` tuples ordered by relevance.
+        """
+        raise NotImplementedError("`search()` must be implemented.")
+
+    def rebuild(self):
+        raise NotImplementedError("`rebuild()` must be implemented.")
+
+    def index_note(self, note):
+        self.index_notes([note])
+
+    def remove_note(self, note_id):
+        self.remove_notes([note_id])
+
+    def tokenize(self, query):
+        return TOKEN_PATTERN.findall(query or "")
+
+    def get_document(self, note):
+        """
+        Return the plain `(title, body)` text indexed for a note.
+        """
+        return to_plain_text(note.title), to_plain_text(note.body)
+
+    def format_highlight(self, text):
+        return (
+            escape(text)
+            .replace(self.match_start, self.highlight_start)
+            .replace(self.match_end, self.highlight_end)
+        )
+
+
+def to_plain_text(value):
+    return unescape(strip_tags(value or ""))
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    return import_string(settings.NOTE_SEARCH_BACKEND)()
@@ -0,0 +1,57 @@
+import re
+from django.db.models import Q
+from api.v1.models import Note
+from api.v1.search.base_backend import SearchBackend, SearchHit, to_plain_text
+
+
+class DatabaseSearchBackend(SearchBackend):
+    """
+    Portable fallback that scans `title`/`body` with `icontains`.
+
+    It keeps no index of its own, so writes are free but every query is a
+    full scan of the caller's notes. Use it only where no real full-text
+    backend is available.
+    """
+
+    def index_notes(self, notes):
+        pass
+
+    def remove_notes(self, note_ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def search(self, query, team_ids, limit, offset=0):
+        tokens = self.tokenize(query)
+        if not tokens or not team_ids:
+            return []
+
+        condition = Q()
+        for token in tokens:
+            condition &= Q(title__icontains=token) | Q(body__icontains=token)
+
+        notes = (
+            Note.objects.filter(condition, team_id__in=team_ids)
+            .order_by("-created_at", "-id")
+            .values_list("id", "title", "body")[offset : offset + limit]
+        )
+
+        pattern = re.compile("|".join(map(re.escape, tokens)), re.IGNORECASE)
+        return [
+            SearchHit(
+                note_id=note_id,
+                rank=0.0,
+                title=self.highlight(pattern, to_plain_text(title)),
+                body=self.highlight(pattern, to_plain_text(body)),
+            )
+            for note_id, title, body in notes
+        ]
+
+    def highlight(self, pattern, text):
+        return self.format_highlight(
+            pattern.sub(
+                lambda match: f"{self.match_start}{match.group(0)}{self.match_end}",
+                text,
+            )
+        )
@@ -0,0 +1,120 @@
+from django.db import connections, transaction
+from api.v1.models import Note
+from api.v1.search.base_backend import SearchBackend, SearchHit
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """
+    Inverted index stored in an SQLite FTS5 virtual table.
+
+    The `v1_note_fts` table is created by migration `0004_note_fts` and
+    mirrors the plain text of `title` and `body` plus `team_id` of every
+    note, keyed by note id. Results are ranked with BM25, weighting title
+    matches above body ones.
+    """
+
+    table = "v1_note_fts"
+    title_weight = 10.0
+    body_weight = 1.0
+    snippet_tokens = 32
+    batch_size = 2000
+
+    def __init__(self, using="default"):
+        self.using = using
+
+    def index_notes(self, notes, replace=True):
+        rows = [(note.id, *self.get_document(note), note.team_id) for note in notes]
+        if not rows:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            if replace:
+                cursor.executemany(
+                    f"DELETE FROM {self.table} WHERE rowid = %s",
+                    [(row[0],) for row in rows],
+                )
+            cursor.executemany(
+                f"INSERT INTO {self.table} (rowid, title, body, team_id) "
+                "VALUES (%s, %s, %s, %s)",
+                rows,
+            )
+
+    def remove_notes(self, note_ids):
+        if not note_ids:
+            return
+
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.table} WHERE rowid = %s",
+                [(note_id,) for note_id in note_ids],
+            )
+
+    def rebuild(self):
+        # One transaction: committing every batch would sync the file each time.
+        with transaction.atomic(using=self.using):
+            with connections[self.using].cursor() as cursor:
+                cursor.execute(f"DELETE FROM {self.table}")
+
+            notes = Note.objects.using(self.using).only(
+                "id", "title", "body", "team_id"
+            )
+            batch = []
+            for note in notes.iterator(chunk_size=self.batch_size):
+                batch.append(note)
+                if len(batch) >= self.batch_size:
+                    self.index_notes(batch, replace=False)
+                    batch = []
+            self.index_notes(batch, replace=False)
+
+    def search(self, query, team_ids, limit, offset=0):
+        expression = self.build_match_expression(query)
+        if not expression or not team_ids:
+            return []
+
+        team_ids = list(team_ids)
+        rank = f"bm25({self.table}, {self.title_weight}, {self.body_weight})"
+        placeholders = ", ".join(["%s"] * len(team_ids))
+
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, {rank}, "
+                f"highlight({self.table}, 0, %s, %s), "
+                f"snippet({self.table}, 1, %s, %s, '…', {self.snippet_tokens}) "
+                f"FROM {self.table} "
+                f"WHERE {self.table} MATCH %s AND team_id IN ({placeholders}) "
+                f"ORDER BY {rank} LIMIT %s OFFSET %s",
+                [
+                    self.match_start,
+                    self.match_end,
+                    self.match_start,
+                    self.match_end,
+                    expression,
+                    *team_ids,
+                    limit,
+                    offset,
+                ],
+            )
+            rows = cursor.fetchall()
+
+        return [
+            SearchHit(
+                note_id=note_id,
+                rank=rank,
+                title=self.format_highlight(title),
+                body=self.format_highlight(body),
+            )
+            for note_id, rank, title, body in rows
+        ]
+
+    def build_match_expression(self, query):
+        """
+        Turn free text into an FTS5 query: every term must match and the
+        last one is treated as a prefix so partially typed words still hit.
+        """
+        tokens = self.tokenize(query)
+        if not tokens:
+            return ""
+
+        terms = ['"%s"' % token.replace('"', '""') for token in tokens]
+        terms[-1] += "*"
+        return " ".join(terms)
@@ -1,14 +1,36 @@
 from api.v1.serializers.user_serializer import UserSerializer
-from api.v1.serializers.login_serializer import LoginSerializer
+from api.v1.serializers.login_serializer import (
+    CredentialsSerializer,
+    LoginSerializer,
+)
 from api.v1.serializers.team_serializer import TeamSerializer
 from api.v1.serializers.join_team_serializer import JoinTeamSerializer
+from api.v1.serializers.team_code_serializer import TeamCodeSerializer
 from api.v1.serializers.note_serializer import NoteSerializer
+from api.v1.serializers.bulk_note_serializer import (
+    BulkNoteCreateSerializer,
+    BulkNoteSerializer,
+    BulkNoteUpdateSerializer,
+    operation_count,
+)
+from api.v1.serializers.token_serializer import (
+    TokenRefreshSerializer,
+    TokenBlacklistSerializer,
+)
 
 
 __all__ = [
     "UserSerializer",
+    "CredentialsSerializer",
     "LoginSerializer",
     "TeamSerializer",
     "JoinTeamSerializer",
+    "TeamCodeSerializer",
     "NoteSerializer",
+    "BulkNoteCreateSerializer",
+    "BulkNoteSerializer",
+    "BulkNoteUpdateSerializer",
+    "operation_count",
+    "TokenRefreshSerializer",
+    "TokenBlacklistSerializer",
 ]
@@ -0,0 +1,159 @@
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+from api.v1.models import Note
+from api.v1.utils import SanitizePolicy, get_user_team_ids
+from api.v1.mixins import SanitizedSerializerMixin
+
+
+class BulkNoteCreateSerializer(SanitizedSerializerMixin, serializers.Serializer):
+
+    title = serializers.CharField(max_length=100)
+    body = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True, default=None
+    )
+    team = serializers.IntegerField()
+
+    sanitize_policies = {"title": SanitizePolicy.TEXT, "body": SanitizePolicy.RICH}
+
+
+class BulkNoteUpdateSerializer(SanitizedSerializerMixin, serializers.Serializer):
+
+    id = serializers.IntegerField()
+    title = serializers.CharField(max_length=100, required=False)
+    body = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    version = serializers.IntegerField(required=False, min_value=1)
+
+    sanitize_policies = {"title": SanitizePolicy.TEXT, "body": SanitizePolicy.RICH}
+
+
+class BulkNoteSerializer(serializers.Serializer):
+    """
+    Batch of note operations applied together: notes to create, changes to
+    existing notes and ids of notes to delete.
+
+    Items are checked against each other and against the database in a
+    fixed number of queries, whatever the batch size. Errors are reported
+    per item, at the position of the item they concern. Once valid, each
+    update carries its `note` and `delete` holds the notes to delete.
+    """
+
+    create = BulkNoteCreateSerializer(many=True, required=False, default=list)
+    update = BulkNoteUpdateSerializer(many=True, required=False, default=list)
+    delete = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    def to_internal_value(self, data):
+        # Refuse oversized batches before validating any of their items.
+        if operation_count(data) > settings.NOTE_BULK_MAX_OPERATIONS:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        f"At most {settings.NOTE_BULK_MAX_OPERATIONS} operations "
+                        "are allowed per request."
+                    ]
+                }
+            )
+
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        if not operation_count(attrs):
+            raise serializers.ValidationError("At least one operation is required.")
+
+        request = self.context["request"]
+        team_ids = get_user_team_ids(request.user.id)
+        errors = {
+            "create": [{} for _ in attrs["create"]],
+            "update": [{} for _ in attrs["update"]],
+            "delete": {},
+        }
+
+        for item, error in zip(attrs["create"], errors["create"]):
+            if item["team"] not in team_ids:
+                error["team"] = ["User is not a member of the team."]
+
+        notes = Note.objects.select_related("owner", "team").in_bulk(
+            {item["id"] for item in attrs["update"]} | set(attrs["delete"])
+        )
+        deleted = set()
+        for position, pk in enumerate(attrs["delete"]):
+            if pk in deleted:
+                errors["delete"][position] = ["Note is deleted more than once."]
+            elif pk not in notes or notes[pk].team_id not in team_ids:
+                errors["delete"][position] = ["Note not found."]
+            deleted.add(pk)
+
+        updated = set()
+        for item, error in zip(attrs["update"], errors["update"]):
+            pk = item["id"]
+            if pk not in notes or notes[pk].team_id not in team_ids:
+                error["id"] = ["Note not found."]
+            elif pk in updated:
+                error["id"] = ["Note is updated more than once."]
+            elif pk in deleted:
+                error["id"] = ["Note is both updated and deleted."]
+            updated.add(pk)
+
+        self.validate_titles(attrs, deleted, errors)
+
+        errors = {
+            "create": errors["create"] if any(errors["create"]) else None,
+            "update": errors["update"] if any(errors["update"]) else None,
+            "delete": errors["delete"] or None,
+        }
+        if any(errors.values()):
+            raise serializers.ValidationError(
+                {operation: error for operation, error in errors.items() if error}
+            )
+
+        for item in attrs["update"]:
+            item["note"] = notes[item.pop("id")]
+        attrs["delete"] = [notes[pk] for pk in attrs["delete"]]
+
+        return attrs
+
+    def validate_titles(self, attrs, deleted, errors):
+        """
+        Flag titles repeated within the batch or held by a note that the
+        batch does not delete, in one query.
+        """
+        items = [
+            (None, item, error)
+            for item, error in zip(attrs["create"], errors["create"])
+        ] + [
+            (item["id"], item, error)
+            for item, error in zip(attrs["update"], errors["update"])
+            if "title" in item
+        ]
+        holders = dict(
+            Note.objects.filter(
+                title__in=[item["title"] for _, item, _ in items]
+            ).values_list("title", "id")
+        )
+
+        seen = set()
+        for pk, item, error in items:
+            title = item["title"]
+            holder = holders.get(title)
+            if title in seen or (
+                holder is not None and holder != pk and holder not in deleted
+            ):
+                error.setdefault("title", []).append(
+                    "note with this title already exists."
+                )
+            seen.add(title)
+
+
+def operation_count(data):
+    """
+    Return how many operations the data of a bulk request carries, before
+    it is validated.
+    """
+    count = 0
+    for operation in ("create", "update", "delete"):
+        items = data.get(operation) if isinstance(data, dict) else None
+        count += len(items) if isinstance(items, list) else 0
+
+    return count
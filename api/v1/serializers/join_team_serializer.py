@@ -1,13 +1,10 @@
-import bleach
 from rest_framework import serializers
+from api.v1.mixins import SanitizedSerializerMixin
+from api.v1.utils import SanitizePolicy
 
 
-class JoinTeamSerializer(serializers.Serializer):
+class JoinTeamSerializer(SanitizedSerializerMixin, serializers.Serializer):
 
-    code = serializers.CharField(required=True)
+    code = serializers.CharField(required=True, max_length=8)
 
-    def validate(self, attrs):
-        if "code" in attrs:
-            attrs["code"] = bleach.clean(attrs["code"])
-
-        return attrs
+    sanitize_policies = {"code": SanitizePolicy.NONE}
@@ -1,11 +1,16 @@
-import bleach
 from rest_framework import serializers
 from api.v1.models import Note
+from api.v1.utils import SanitizePolicy, get_user_team_ids
+from api.v1.mixins import InstrumentedSerializerMixin, SanitizedSerializerMixin
 
 
-class NoteSerializer(serializers.ModelSerializer):
+class NoteSerializer(
+    InstrumentedSerializerMixin, SanitizedSerializerMixin, serializers.ModelSerializer
+):
 
-    owner = serializers.StringRelatedField()
+    owner = serializers.SerializerMethodField()
+
+    sanitize_policies = {"title": SanitizePolicy.TEXT, "body": SanitizePolicy.RICH}
 
     class Meta:
 
@@ -30,20 +35,18 @@ class NoteSerializer(serializers.ModelSerializer):
                 for field in exclude_fields:
                     self.fields.pop(field, None)
 
-    def validate(self, attrs):
+    def validate_team(self, team):
+
+        request = self.context.get("request")
 
-        if "title" in attrs:
-            attrs["title"] = bleach.clean(attrs["title"])
-        if "body" in attrs:
-            attrs["body"] = bleach.clean(attrs["body"])
+        if request and team.id not in get_user_team_ids(request.user.id):
+            raise serializers.ValidationError("User is not a member of the team.")
 
-        return attrs
+        return team
 
     def to_representation(self, instance):
 
         data = super().to_representation(instance)
-
-        data["owner"] = self.get_owner(instance)
         data["team"] = self.get_team(instance)
 
         return data
@@ -63,12 +66,17 @@ class NoteSerializer(serializers.ModelSerializer):
     def get_team(self, instance):
 
         if instance:
-            team_instance = instance.team
-            return {
-                "id": team_instance.id,
-                "profile": team_instance.profile,
-                "name": team_instance.name,
-                "description": team_instance.description,
-            }
+            teams = self.context.setdefault("teams", {})
+
+            if instance.team_id not in teams:
+                team_instance = instance.team
+                teams[instance.team_id] = {
+                    "id": team_instance.id,
+                    "profile": team_instance.profile,
+                    "name": team_instance.name,
+                    "description": team_instance.description,
+                }
+
+            return teams[instance.team_id]
 
         return None
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class TeamCodeSerializer(serializers.Serializer):
+
+    expires_in = serializers.IntegerField(
+        required=False, allow_null=True, min_value=0, write_only=True
+    )
+    code = serializers.CharField(read_only=True)
+    code_expires_at = serializers.DateTimeField(read_only=True)
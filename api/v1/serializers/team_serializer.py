@@ -1,17 +1,43 @@
-import bleach
+from django.db import models
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework import serializers
-from api.v1.models import Team
+from api.v1.models import Team, Membership
+from api.v1.mixins import InstrumentedSerializerMixin, SanitizedSerializerMixin
+from api.v1.utils import SanitizePolicy
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamListSerializer(InstrumentedSerializerMixin, serializers.ListSerializer):
 
-    owner = serializers.StringRelatedField()
-    members = serializers.StringRelatedField(many=True, read_only=True)
+    def to_representation(self, data):
+
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        teams = list(iterable)
+
+        joined_teams = [team for team in teams if self.child.team_is_joined(team)]
+        if joined_teams:
+            prefetch_related_objects(joined_teams, self.child.get_members_prefetch())
+
+        return super().to_representation(teams)
+
+
+class TeamSerializer(
+    InstrumentedSerializerMixin, SanitizedSerializerMixin, serializers.ModelSerializer
+):
+
+    owner = serializers.SerializerMethodField()
+    members = serializers.SerializerMethodField()
     is_joined = serializers.SerializerMethodField(method_name="team_is_joined")
 
+    sanitize_policies = {
+        "profile": SanitizePolicy.TEXT,
+        "name": SanitizePolicy.TEXT,
+        "description": SanitizePolicy.RICH,
+    }
+
     class Meta:
 
         model = Team
+        list_serializer_class = TeamListSerializer
         fields = [
             "id",
             "profile",
@@ -36,24 +62,10 @@ class TeamSerializer(serializers.ModelSerializer):
             for field in exclude_fields:
                 self.fields.pop(field, None)
 
-    def validate(self, attrs):
-
-        if "profile" in attrs:
-            attrs["profile"] = bleach.clean(attrs["profile"])
-        if "name" in attrs:
-            attrs["name"] = bleach.clean(attrs["name"])
-        if "description" in attrs:
-            attrs["description"] = bleach.clean(attrs["description"])
-
-        return attrs
-
     def to_representation(self, instance):
 
         data = super().to_representation(instance)
 
-        data["owner"] = self.get_owner(instance)
-        data["members"] = self.get_members(instance) if data.get("is_joined") else []
-
         if (
             "code" in data
             and self.context.get("request")
@@ -77,29 +89,57 @@ class TeamSerializer(serializers.ModelSerializer):
 
     def get_members(self, instance):
 
-        if instance:
-            members_instance = instance.members.all()
-            members = []
+        if not instance:
+            return []
 
-            for member in members_instance:
-                members.append(
-                    {
-                        "id": member.id,
-                        "username": member.username,
-                        "email": member.email,
-                    }
-                )
+        if not hasattr(instance, "member_memberships"):
+            if not self.team_is_joined(instance):
+                return []
 
-            return members
+            prefetch_related_objects([instance], self.get_members_prefetch())
 
-        return None
+        members = []
+
+        for membership in instance.member_memberships:
+            member = membership.user
+            members.append(
+                {
+                    "id": member.id,
+                    "username": member.username,
+                    "email": member.email,
+                }
+            )
+
+        return members
+
+    @classmethod
+    def get_members_prefetch(cls, limit=None):
+        """
+        Prefetch of the member rows consumed by `get_members`, optionally
+        capped at `limit` members per team.
+        """
+        queryset = (
+            Membership.objects.filter(role=Membership.Role.MEMBER)
+            .select_related("user")
+            .only("id", "team_id", "user__id", "user__username", "user__email")
+            .order_by("id")
+        )
+
+        if limit is not None:
+            queryset = queryset[:limit]
+
+        return Prefetch("memberships", queryset=queryset, to_attr="member_memberships")
 
     def team_is_joined(self, team: Team):
         request = self.context.get("request")
 
-        if request:
-            user = request.user
-            if user in team.members.all() or user == team.owner:
-                return True
+        if request is None or "is_joined" not in self.fields:
+            return False
+
+        if not hasattr(team, "is_joined"):
+            # Kept on the instance so `members` and `is_joined` share one query.
+            team.is_joined = Membership.objects.filter(
+                team_id=team.id, user_id=request.user.id
+            ).exists()
 
-        return False
+        return team.is_joined
@@ -0,0 +1,12 @@
+from rest_framework_simplejwt import serializers
+from api.v1.authentication import UserRefreshToken
+
+
+class TokenRefreshSerializer(serializers.TokenRefreshSerializer):
+
+    token_class = UserRefreshToken
+
+
+class TokenBlacklistSerializer(serializers.TokenBlacklistSerializer):
+
+    token_class = UserRefreshToken
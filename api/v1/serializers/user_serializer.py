@@ -1,14 +1,26 @@
-import bleach
 from rest_framework import serializers
 from api.v1.models import User
+from api.v1.mixins import InstrumentedSerializerMixin, SanitizedSerializerMixin
+from api.v1.utils import SanitizePolicy
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(
+    InstrumentedSerializerMixin, SanitizedSerializerMixin, serializers.ModelSerializer
+):
 
     re_password = serializers.CharField(
         write_only=True, style={"input_type": "password"}
     )
 
+    sanitize_policies = {
+        "username": SanitizePolicy.TEXT,
+        "first_name": SanitizePolicy.TEXT,
+        "middle_name": SanitizePolicy.TEXT,
+        "last_name": SanitizePolicy.TEXT,
+        "email": SanitizePolicy.TEXT,
+        "password": SanitizePolicy.NONE,
+    }
+
     class Meta:
 
         model = User
@@ -46,17 +58,6 @@ class UserSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
 
-        if "username" in attrs:
-            attrs["username"] = bleach.clean(attrs["username"])
-        if "email" in attrs:
-            attrs["email"] = bleach.clean(attrs["email"])
-        if "first_name" in attrs:
-            attrs["first_name"] = bleach.clean(attrs["first_name"])
-        if "middle_name" in attrs:
-            attrs["middle_name"] = bleach.clean(attrs["middle_name"])
-        if "last_name" in attrs:
-            attrs["last_name"] = bleach.clean(attrs["last_name"])
-
         if "password" in attrs and "re_password" in attrs:
             if attrs["password"] != attrs["re_password"]:
                 raise serializers.ValidationError(
@@ -0,0 +1,29 @@
+from api.v1.signals.membership_signal import invalidate_membership_cache
+from api.v1.signals.user_signal import invalidate_user_cache
+from api.v1.signals.connection_signal import install_query_recorder
+from api.v1.signals.object_cache_signal import (
+    invalidate_saved_note,
+    invalidate_deleted_note,
+    invalidate_saved_team,
+    invalidate_deleted_team,
+    invalidate_team_members,
+    invalidate_changed_team_members,
+    invalidate_user_payloads,
+)
+from api.v1.signals.search_index_signal import index_saved_note, remove_deleted_note
+
+
+__all__ = [
+    "invalidate_membership_cache",
+    "invalidate_user_cache",
+    "install_query_recorder",
+    "invalidate_saved_note",
+    "invalidate_deleted_note",
+    "invalidate_saved_team",
+    "invalidate_deleted_team",
+    "invalidate_team_members",
+    "invalidate_changed_team_members",
+    "invalidate_user_payloads",
+    "index_saved_note",
+    "remove_deleted_note",
+]
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from api.v1.models import Membership
+from api.v1.utils import invalidate_user_team_ids
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_membership_cache(sender, instance, **kwargs):
+    invalidate_user_team_ids(instance.user_id)
@@ -0,0 +1,66 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from api.v1.caches import note_cache, team_cache
+from api.v1.models import Membership, Note, Team, User
+
+
+# User fields embedded in the cached payloads of their teams and notes.
+USER_FIELDS = ("username", "email")
+
+
+@receiver(post_save, sender=Note)
+def invalidate_saved_note(sender, instance, **kwargs):
+    note_cache.invalidate(instance.pk, version=instance.updated_at.isoformat())
+
+
+@receiver(post_delete, sender=Note)
+def invalidate_deleted_note(sender, instance, **kwargs):
+    note_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Team)
+def invalidate_saved_team(sender, instance, **kwargs):
+    team_cache.invalidate(instance.pk, version=instance.updated_at.isoformat())
+    # Every note embeds the team and its `updated_at`, which the ETag covers.
+    note_cache.invalidate_scope(instance.pk, instance.updated_at)
+
+
+@receiver(post_delete, sender=Team)
+def invalidate_deleted_team(sender, instance, **kwargs):
+    team_cache.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def invalidate_team_members(sender, instance, **kwargs):
+    team_cache.invalidate(instance.team_id)
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def invalidate_changed_team_members(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if not reverse:
+        team_cache.invalidate(instance.pk)
+    elif action == "pre_clear":
+        team_cache.invalidate(*instance.teams.values_list("id", flat=True))
+    else:
+        team_cache.invalidate(*pk_set)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_payloads(sender, instance, created, **kwargs):
+    if created or not instance.has_changed(*USER_FIELDS):
+        return
+
+    team_cache.invalidate(
+        *Membership.objects.filter(user_id=instance.pk).values_list(
+            "team_id", flat=True
+        )
+    )
+    note_cache.invalidate(
+        *Note.objects.filter(owner_id=instance.pk).values_list("id", flat=True)
+    )
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from api.v1.models import Note
+from api.v1.search import get_search_backend
+
+
+# The index is written in the transaction of the change, so it commits or
+# rolls back along with the row. Bulk writes send no signals and index
+# their notes themselves.
+@receiver(post_save, sender=Note)
+def index_saved_note(sender, instance, **kwargs):
+    get_search_backend().index_note(instance)
+
+
+@receiver(post_delete, sender=Note)
+def remove_deleted_note(sender, instance, **kwargs):
+    get_search_backend().remove_note(instance.pk)
@@ -0,0 +1,69 @@
+from unittest import mock
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from api.v1.authentication import UserRefreshToken
+from api.v1.models import Note, Team, User
+from api.v1.throttles import SlidingWindowRateThrottle
+from api.v1.utils import get_last_login_buffer
+
+
+class APITestCase(TestCase):
+    """
+    Test case calling the API as users authenticated with access tokens.
+
+    Each request runs the callbacks it registered for commit, as it would
+    outside of the test transaction, so cache invalidation is exercised.
+    Throttles let every request through unless `throttle` is set.
+    """
+
+    throttle = False
+
+    def setUp(self):
+        for alias in settings.CACHES:
+            caches[alias].clear()
+
+        if not self.throttle:
+            patcher = mock.patch.object(
+                SlidingWindowRateThrottle, "allow_request", return_value=True
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Write buffered logins while the test database still exists.
+        self.addCleanup(get_last_login_buffer().flush)
+
+    def create_user(self, username):
+        return User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="password"
+        )
+
+    def create_team(self, owner, name=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Team.objects.create(
+                name=name or f"{owner.username} team", owner=owner
+            )
+
+    def create_note(self, team, owner, title, body="body"):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Note.objects.create(team=team, owner=owner, title=title, body=body)
+
+    def join(self, user, team):
+        response = self.request(
+            user, "post", f"/api/v1/teams/{team.pk}/join/", {"code": team.code}
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+
+    def authorize(self, user):
+        """
+        Return an `Authorization` header carrying an access token of the user.
+        """
+        return f"Bearer {UserRefreshToken.for_user(user).access_token}"
+
+    def request(self, user, method, path, data=None, **headers):
+        if user is not None:
+            headers["HTTP_AUTHORIZATION"] = self.authorize(user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return getattr(self.client, method)(
+                path, data, content_type="application/json", **headers
+            )
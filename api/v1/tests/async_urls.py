@@ -0,0 +1,11 @@
+from django.urls import path, include
+from rest_framework import routers
+from api.v1.viewsets import AsyncNoteViewSet, AsyncTeamViewSet
+
+
+# Serve the ASGI-native viewsets whatever `ASYNC_VIEWSETS` is set to.
+route = routers.DefaultRouter()
+route.register(r"teams", AsyncTeamViewSet, basename="teams")
+route.register(r"notes", AsyncNoteViewSet, basename="notes")
+
+urlpatterns = [path("api/v1/", include(route.urls))]
@@ -0,0 +1,108 @@
+from django.test import override_settings
+from api.v1.models import Note, Team
+from api.v1.tests.api_test_case import APITestCase
+
+
+@override_settings(ROOT_URLCONF="api.v1.tests.async_urls")
+class AsyncViewSetTests(APITestCase):
+    """
+    The ASGI-native viewsets behave as the viewsets they replace.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.member = self.create_user("member")
+        self.stranger = self.create_user("stranger")
+        self.team = self.create_team(self.owner)
+        self.note = self.create_note(self.team, self.owner, "Plan")
+        self.path = f"/api/v1/notes/{self.note.pk}/"
+
+    def test_created_notes_are_sanitized_and_readable(self):
+        response = self.request(
+            self.owner,
+            "post",
+            "/api/v1/notes/",
+            {"team": self.team.pk, "title": "<b>Hi</b>", "body": "<i>ok</i>"},
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        note = self.request(
+            self.owner, "get", f"/api/v1/notes/{response.json()['id']}/"
+        )
+        self.assertEqual(note.json()["title"], "&lt;b&gt;Hi&lt;/b&gt;")
+        self.assertEqual(note.json()["body"], "<i>ok</i>")
+
+    def test_current_copies_are_not_modified(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        response = self.request(self.owner, "get", self.path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_updates_return_the_etag_and_refuse_stale_ones(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        response = self.request(
+            self.owner, "patch", self.path, {"title": "First"}, HTTP_IF_MATCH=etag
+        )
+        stale = self.request(
+            self.owner, "patch", self.path, {"title": "Second"}, HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            response["ETag"], self.request(self.owner, "get", self.path)["ETag"]
+        )
+        self.assertEqual(stale.status_code, 412)
+        self.note.refresh_from_db()
+        self.assertEqual(self.note.title, "First")
+
+    def test_team_updates_return_the_etag(self):
+        path = f"/api/v1/teams/{self.team.pk}/"
+
+        response = self.request(self.owner, "patch", path, {"name": "Renamed"})
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            response["ETag"], self.request(self.owner, "get", path)["ETag"]
+        )
+
+    def test_notes_of_other_teams_are_not_found(self):
+        for method, data in [("get", None), ("patch", {"title": "Taken"})]:
+            with self.subTest(method=method):
+                response = self.request(self.stranger, method, self.path, data)
+                self.assertEqual(response.status_code, 404)
+
+    def test_members_join_and_leave(self):
+        self.join(self.member, self.team)
+        self.assertEqual(self.request(self.member, "get", self.path).status_code, 200)
+
+        response = self.request(
+            self.member, "delete", f"/api/v1/teams/{self.team.pk}/leave/"
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.request(self.member, "get", self.path).status_code, 404)
+
+    def test_deleted_users_are_unauthorized(self):
+        authorization = self.authorize(self.member)
+        self.member.delete()
+
+        response = self.request(
+            None,
+            "post",
+            "/api/v1/teams/",
+            {"name": "Ghost", "description": ""},
+            HTTP_AUTHORIZATION=authorization,
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(Team.objects.filter(name="Ghost").exists())
+
+    def test_deleting_removes_the_note(self):
+        response = self.request(self.owner, "delete", self.path)
+
+        self.assertEqual(response.status_code, 204, response.content)
+        self.assertFalse(Note.objects.filter(pk=self.note.pk).exists())
+        self.assertEqual(self.request(self.owner, "get", self.path).status_code, 404)
@@ -0,0 +1,169 @@
+from django.test import override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from api.v1.authentication import (
+    StatelessJWTAuthentication,
+    TokenBackedUser,
+    UserRefreshToken,
+)
+from api.v1.models import User
+from api.v1.tests.api_test_case import APITestCase
+from api.v1.utils import TokenBlacklistFilter
+
+
+class StatelessJWTAuthenticationTests(APITestCase):
+    """
+    Access tokens authenticate from their claims, without loading the user.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user("reader")
+
+    def authenticate(self, authorization):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=authorization)
+        return StatelessJWTAuthentication().authenticate(request)
+
+    def test_users_are_built_from_claims_without_queries(self):
+        authorization = self.authorize(self.user)
+
+        with self.assertNumQueries(0):
+            user, _ = self.authenticate(authorization)
+            self.assertIsInstance(user, TokenBackedUser)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertEqual(user.username, "reader")
+            self.assertEqual(user.email, "reader@example.com")
+
+    def test_other_attributes_load_the_user(self):
+        user, _ = self.authenticate(self.authorize(self.user))
+
+        self.assertEqual(user.date_joined, self.user.date_joined)
+
+    def test_inactive_claims_are_refused(self):
+        self.user.is_active = False
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.authorize(self.user))
+
+    @override_settings(STATELESS_JWT_AUTHENTICATION=False)
+    def test_the_user_row_is_loaded_when_disabled(self):
+        user, _ = self.authenticate(self.authorize(self.user))
+
+        self.assertIsInstance(user, User)
+
+
+class RefreshTokenTests(APITestCase):
+    """
+    Refreshing rotates the refresh token and blacklists the one it
+    replaces.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user("reader")
+
+    def refresh(self, token):
+        return self.request(None, "post", "/api/v1/auth/refresh/", {"refresh": token})
+
+    def test_refreshing_blacklists_the_old_refresh_token(self):
+        refresh = str(UserRefreshToken.for_user(self.user))
+
+        response = self.refresh(refresh)
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertNotEqual(response.json()["refresh"], refresh)
+        self.assertEqual(self.refresh(refresh).status_code, 401)
+        self.assertEqual(self.refresh(response.json()["refresh"]).status_code, 200)
+
+    def test_blacklisted_refresh_tokens_are_refused(self):
+        refresh = str(UserRefreshToken.for_user(self.user))
+
+        response = self.request(
+            None, "post", "/api/v1/auth/blacklist/", {"refresh": refresh}
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.refresh(refresh).status_code, 401)
+
+
+class TokenBlacklistFilterTests(APITestCase):
+    """
+    The filter picks up every blacklisted token, whatever order their rows
+    commit in.
+    """
+
+    def setUp(self):
+        super().setUp()
+        user = self.create_user("reader")
+        self.tokens = [
+            OutstandingToken.objects.get(jti=UserRefreshToken.for_user(user)["jti"])
+            for _ in range(2)
+        ]
+
+    def create_filter(self, sync_margin):
+        blacklist_filter = TokenBlacklistFilter(100, 0.001, 0, sync_margin)
+        blacklist_filter.sync()
+        return blacklist_filter
+
+    def test_rows_committed_after_a_higher_id_are_picked_up(self):
+        blacklist_filter = self.create_filter(sync_margin=300)
+        early, late = self.tokens
+
+        BlacklistedToken.objects.create(id=10, token=late)
+        self.assertIn(late.jti, blacklist_filter)
+        # A transaction that got a lower id commits after the sync.
+        BlacklistedToken.objects.create(id=5, token=early)
+
+        self.assertIn(early.jti, blacklist_filter)
+
+    def test_settled_rows_are_not_read_again(self):
+        blacklist_filter = self.create_filter(sync_margin=0)
+
+        BlacklistedToken.objects.create(id=10, token=self.tokens[1])
+        blacklist_filter.sync()
+
+        self.assertEqual(blacklist_filter.high_water, 10)
+
+
+class LoginTests(APITestCase):
+    """
+    Logging in with an email and password issues a token pair.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.create_user("reader")
+
+    def login(self, password="password"):
+        return self.request(
+            None,
+            "post",
+            "/api/v1/auth/login/",
+            {"email": "reader@example.com", "password": password},
+        )
+
+    def test_login_issues_usable_tokens(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, 200, response.content)
+        tokens = response.json()
+        self.assertEqual(
+            self.request(
+                None,
+                "get",
+                "/api/v1/teams/",
+                HTTP_AUTHORIZATION=f"Bearer {tokens['access']}",
+            ).status_code,
+            200,
+        )
+        self.assertEqual(UserRefreshToken(tokens["refresh"])["username"], "reader")
+
+    def test_wrong_passwords_are_refused(self):
+        response = self.login(password="wrong")
+
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn("access", response.json())
@@ -0,0 +1,36 @@
+from django.test import override_settings
+from api.v1.tests.api_test_case import APITestCase
+
+
+class MetricsViewTests(APITestCase):
+    """
+    Metrics are only served to scrapers holding `METRICS_TOKEN`, or to
+    anyone while `DEBUG` is on.
+    """
+
+    path = "/api/v1/metrics/"
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_the_token_is_required(self):
+        self.assertEqual(self.request(None, "get", self.path).status_code, 404)
+        self.assertEqual(
+            self.request(
+                None, "get", self.path, HTTP_AUTHORIZATION="Bearer wrong"
+            ).status_code,
+            404,
+        )
+
+        response = self.request(
+            None, "get", self.path, HTTP_AUTHORIZATION="Bearer secret"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"http_requests_total", response.content)
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_no_token_hides_the_endpoint(self):
+        self.assertEqual(self.request(None, "get", self.path).status_code, 404)
+
+    @override_settings(METRICS_TOKEN=None, DEBUG=True)
+    def test_no_token_serves_the_endpoint_in_debug(self):
+        self.assertEqual(self.request(None, "get", self.path).status_code, 200)
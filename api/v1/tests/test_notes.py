@@ -0,0 +1,386 @@
+from unittest import mock
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from api.v1.models import Note, Team, User
+from api.v1.tests.api_test_case import APITestCase
+
+
+class DeletedUserTests(APITestCase):
+    """
+    A user deleted while their access token is still valid cannot create
+    anything.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+        self.user = self.create_user("gone")
+        self.join(self.user, self.team)
+        self.authorization = self.authorize(self.user)
+        self.user.delete()
+
+    def test_creating_a_team_is_unauthorized(self):
+        response = self.request(
+            None,
+            "post",
+            "/api/v1/teams/",
+            {"name": "Ghost", "description": ""},
+            HTTP_AUTHORIZATION=self.authorization,
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_creating_notes_is_unauthorized(self):
+        # Team ids cached before the user was deleted still list the team.
+        with mock.patch(
+            "api.v1.serializers.note_serializer.get_user_team_ids",
+            return_value={self.team.pk},
+        ), mock.patch(
+            "api.v1.serializers.bulk_note_serializer.get_user_team_ids",
+            return_value={self.team.pk},
+        ):
+            created = self.request(
+                None,
+                "post",
+                "/api/v1/notes/",
+                {"team": self.team.pk, "title": "Ghost", "body": ""},
+                HTTP_AUTHORIZATION=self.authorization,
+            )
+            bulk = self.request(
+                None,
+                "post",
+                "/api/v1/notes/bulk/",
+                {"create": [{"team": self.team.pk, "title": "Ghost"}]},
+                HTTP_AUTHORIZATION=self.authorization,
+            )
+
+        self.assertEqual(created.status_code, 401)
+        self.assertEqual(bulk.status_code, 401)
+        self.assertFalse(Note.objects.filter(title="Ghost").exists())
+
+
+class SanitizationTests(APITestCase):
+    """
+    Titles are stored as text and bodies keep only safe inline markup.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+
+    def test_created_notes_are_sanitized(self):
+        response = self.request(
+            self.owner,
+            "post",
+            "/api/v1/notes/",
+            {
+                "team": self.team.pk,
+                "title": "<b>Plan</b>",
+                "body": "<b>ok</b><script>alert(1)</script><a href='javascript:x'>l</a>",
+            },
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        note = Note.objects.get(pk=response.json()["id"])
+        self.assertEqual(note.title, "&lt;b&gt;Plan&lt;/b&gt;")
+        self.assertEqual(
+            note.body, "<b>ok</b>&lt;script&gt;alert(1)&lt;/script&gt;<a>l</a>"
+        )
+
+    def test_updates_and_bulk_items_are_sanitized(self):
+        note = self.create_note(self.team, self.owner, "Plan")
+
+        self.request(
+            self.owner,
+            "patch",
+            f"/api/v1/notes/{note.pk}/",
+            {"body": "<script>x()</script>"},
+        )
+        response = self.request(
+            self.owner,
+            "post",
+            "/api/v1/notes/bulk/",
+            {"create": [{"team": self.team.pk, "title": "<i>Bulk</i>"}]},
+        )
+
+        note.refresh_from_db()
+        self.assertEqual(note.body, "&lt;script&gt;x()&lt;/script&gt;")
+        self.assertEqual(
+            response.json()["create"][0]["title"], "&lt;i&gt;Bulk&lt;/i&gt;"
+        )
+
+
+class ObjectCacheTests(APITestCase):
+    """
+    Cached note and team payloads are replaced when the rows they embed
+    change.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+        self.note = self.create_note(self.team, self.owner, "Plan")
+        self.path = f"/api/v1/notes/{self.note.pk}/"
+        # Fill the cache.
+        self.request(self.owner, "get", self.path)
+
+    def test_note_updates_are_served(self):
+        self.request(self.owner, "patch", self.path, {"body": "Updated"})
+
+        self.assertEqual(
+            self.request(self.owner, "get", self.path).json()["body"], "Updated"
+        )
+
+    def test_bulk_updates_are_served(self):
+        self.request(
+            self.owner,
+            "post",
+            "/api/v1/notes/bulk/",
+            {"update": [{"id": self.note.pk, "body": "Bulk"}]},
+        )
+
+        self.assertEqual(
+            self.request(self.owner, "get", self.path).json()["body"], "Bulk"
+        )
+
+    def test_team_saves_are_served(self):
+        self.request(
+            self.owner, "patch", f"/api/v1/teams/{self.team.pk}/", {"name": "Renamed"}
+        )
+        self.assertEqual(
+            self.request(self.owner, "get", self.path).json()["team"]["name"],
+            "Renamed",
+        )
+
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+        self.request(self.owner, "post", f"/api/v1/teams/{self.team.pk}/rotate-code/")
+
+        self.assertNotEqual(self.request(self.owner, "get", self.path)["ETag"], etag)
+
+    def test_team_saves_do_not_read_the_teams_notes(self):
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(
+            connection
+        ) as context:
+            team = Team.objects.get(pk=self.team.pk)
+            team.name = "Renamed"
+            team.save()
+
+        self.assertFalse(any(Note._meta.db_table in query["sql"] for query in context))
+        self.assertEqual(
+            self.request(self.owner, "get", self.path).json()["team"]["name"],
+            "Renamed",
+        )
+
+    def test_owner_renames_are_served(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            owner = User.objects.get(pk=self.owner.pk)
+            owner.username = "renamed"
+            owner.save()
+
+        self.assertEqual(
+            self.request(self.owner, "get", self.path).json()["owner"]["username"],
+            "renamed",
+        )
+
+    def test_deleted_notes_are_not_found(self):
+        self.request(self.owner, "delete", self.path)
+
+        self.assertEqual(self.request(self.owner, "get", self.path).status_code, 404)
+
+
+class ConditionalRequestTests(APITestCase):
+    """
+    Reads answer 304 while the client's copy is current.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.member = self.create_user("member")
+        self.team = self.create_team(self.owner)
+        self.note = self.create_note(self.team, self.owner, "Plan")
+        self.path = f"/api/v1/notes/{self.note.pk}/"
+
+    def test_current_copies_are_not_modified(self):
+        response = self.request(self.owner, "get", self.path)
+
+        for headers in [
+            {"HTTP_IF_NONE_MATCH": response["ETag"]},
+            {"HTTP_IF_MODIFIED_SINCE": response["Last-Modified"]},
+        ]:
+            with self.subTest(headers=headers):
+                cached = self.request(self.owner, "get", self.path, **headers)
+                self.assertEqual(cached.status_code, 304)
+                self.assertEqual(cached.content, b"")
+
+    def test_etags_follow_the_database_not_the_cache(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        for cache in caches.all():
+            cache.clear()
+
+        self.assertEqual(self.request(self.owner, "get", self.path)["ETag"], etag)
+
+    def test_changes_to_embedded_rows_change_the_etag(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        self.request(
+            self.owner, "patch", f"/api/v1/teams/{self.team.pk}/", {"name": "Renamed"}
+        )
+
+        response = self.request(self.owner, "get", self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["team"]["name"], "Renamed")
+
+    def test_team_list_changes_when_a_member_joins(self):
+        etag = self.request(self.owner, "get", "/api/v1/teams/")["ETag"]
+        self.assertEqual(
+            self.request(
+                self.owner, "get", "/api/v1/teams/", HTTP_IF_NONE_MATCH=etag
+            ).status_code,
+            304,
+        )
+
+        self.join(self.member, self.team)
+
+        response = self.request(
+            self.owner, "get", "/api/v1/teams/", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class OptimisticConcurrencyTests(APITestCase):
+    """
+    Writes answer 412 when `If-Match` names a stale version of the note.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+        self.note = self.create_note(self.team, self.owner, "Plan")
+        self.path = f"/api/v1/notes/{self.note.pk}/"
+
+    def test_stale_if_match_is_refused(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+        self.request(self.owner, "patch", self.path, {"title": "First"})
+
+        response = self.request(
+            self.owner, "patch", self.path, {"title": "Second"}, HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 412)
+        self.note.refresh_from_db()
+        self.assertEqual(self.note.title, "First")
+
+    def test_updates_return_the_etag_of_the_saved_note(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        response = self.request(
+            self.owner, "patch", self.path, {"title": "First"}, HTTP_IF_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(
+            response["ETag"], self.request(self.owner, "get", self.path)["ETag"]
+        )
+        chained = self.request(
+            self.owner,
+            "patch",
+            self.path,
+            {"title": "Second"},
+            HTTP_IF_MATCH=response["ETag"],
+        )
+        self.assertEqual(chained.status_code, 200, chained.content)
+
+    def test_weak_if_match_is_refused(self):
+        etag = self.request(self.owner, "get", self.path)["ETag"]
+
+        response = self.request(
+            self.owner, "patch", self.path, {"title": "Weak"}, HTTP_IF_MATCH=f"W/{etag}"
+        )
+
+        self.assertEqual(response.status_code, 412)
+
+
+class BulkNoteTests(APITestCase):
+    """
+    A bulk request applies every operation or none.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+        self.kept = self.create_note(self.team, self.owner, "Kept")
+        self.deleted = self.create_note(self.team, self.owner, "Deleted")
+
+    def bulk(self, data):
+        return self.request(self.owner, "post", "/api/v1/notes/bulk/", data)
+
+    def test_operations_are_applied_in_order(self):
+        response = self.bulk(
+            {
+                "create": [{"team": self.team.pk, "title": "Deleted"}],
+                "update": [{"id": self.kept.pk, "body": "Changed"}],
+                "delete": [self.deleted.pk],
+            }
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        self.assertEqual(body["delete"], [{"id": self.deleted.pk}])
+        self.assertEqual(body["update"][0]["body"], "Changed")
+        self.assertEqual(
+            list(Note.objects.order_by("pk").values_list("title", flat=True)),
+            ["Kept", "Deleted"],
+        )
+
+    def test_invalid_items_are_reported_at_their_position(self):
+        response = self.bulk(
+            {
+                "create": [
+                    {"team": self.team.pk, "title": "Fine"},
+                    {"team": self.team.pk, "title": "Kept"},
+                ],
+                "delete": [self.deleted.pk, 0],
+            }
+        )
+
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["detail"]
+        self.assertEqual(errors["create"][0], {})
+        self.assertIn("title", errors["create"][1])
+        self.assertEqual(list(errors["delete"]), ["1"])
+        self.assertEqual(Note.objects.count(), 2)
+
+    def test_a_version_conflict_rolls_back_the_whole_batch(self):
+        response = self.bulk(
+            {
+                "create": [{"team": self.team.pk, "title": "New"}],
+                "update": [{"id": self.kept.pk, "body": "Changed", "version": 99}],
+                "delete": [self.deleted.pk],
+            }
+        )
+
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(
+            sorted(Note.objects.values_list("title", flat=True)), ["Deleted", "Kept"]
+        )
+        self.kept.refresh_from_db()
+        self.assertEqual(self.kept.body, "body")
+
+    @override_settings(NOTE_BULK_MAX_OPERATIONS=2)
+    def test_oversized_batches_are_refused(self):
+        response = self.bulk({"delete": [self.kept.pk, self.deleted.pk, 0]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Note.objects.count(), 2)
+
+    def test_empty_batches_are_refused(self):
+        self.assertEqual(self.bulk({}).status_code, 400)
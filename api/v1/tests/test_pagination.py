@@ -0,0 +1,61 @@
+from api.v1.tests.api_test_case import APITestCase
+
+
+class KeysetPaginationTests(APITestCase):
+    """
+    Team notes are paged by cursor on `(created_at, id)`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+        self.notes = [
+            self.create_note(self.team, self.owner, f"note {index}")
+            for index in range(7)
+        ]
+        self.path = f"/api/v1/teams/{self.team.pk}/notes/"
+
+    def test_next_links_walk_every_note_once_newest_first(self):
+        seen = []
+        url = f"{self.path}?page_size=3"
+        while url:
+            response = self.request(self.owner, "get", url)
+            self.assertEqual(response.status_code, 200, response.content)
+            seen.extend(note["id"] for note in response.json()["results"])
+            url = response.json()["next"]
+
+        self.assertEqual(seen, [note.pk for note in reversed(self.notes)])
+
+    def test_previous_link_returns_the_page_before(self):
+        first = self.request(self.owner, "get", f"{self.path}?page_size=3").json()
+        second = self.request(self.owner, "get", first["next"]).json()
+        previous = self.request(self.owner, "get", second["previous"]).json()
+
+        self.assertIsNone(first["previous"])
+        self.assertEqual(previous["results"], first["results"])
+
+    def test_ascending_ordering(self):
+        response = self.request(
+            self.owner, "get", f"{self.path}?ordering=created_at&page_size=100"
+        )
+
+        self.assertEqual(
+            [note["id"] for note in response.json()["results"]],
+            [note.pk for note in self.notes],
+        )
+
+    def test_notes_added_between_pages_do_not_shift_them(self):
+        first = self.request(self.owner, "get", f"{self.path}?page_size=3").json()
+        self.create_note(self.team, self.owner, "late note")
+        second = self.request(self.owner, "get", first["next"]).json()
+
+        self.assertEqual(
+            [note["id"] for note in second["results"]],
+            [note.pk for note in reversed(self.notes[1:4])],
+        )
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.request(self.owner, "get", f"{self.path}?cursor=bogus")
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,128 @@
+from collections import Counter
+from unittest import mock
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver
+from rest_framework.utils.urls import replace_query_param
+from api.v1.throttles import SlidingWindowRateThrottle
+from api.v1.authentication import UserRefreshToken
+from api.v1 import urls
+from api.v1.benchmarks import SCENARIOS, BenchmarkContext, build_dataset
+from api.v1.benchmarks.query_budgets import PAGINATED_ACTIONS, QUERY_BUDGETS
+from api.v1.utils import fingerprint_sql, get_last_login_buffer
+
+
+PAGE_SIZES = [1, 5, 20]
+
+SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def routed_actions(patterns=urls.urlpatterns):
+    """
+    Yield `<View>.<action>` for every class-based view routed by the API.
+    """
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from routed_actions(pattern.url_patterns)
+            continue
+
+        view = getattr(pattern.callback, "cls", None)
+        if not isinstance(pattern, URLPattern) or view is None:
+            continue
+
+        actions = getattr(pattern.callback, "actions", None)
+        if actions is not None:
+            for action in actions.values():
+                yield f"{view.__name__}.{action}"
+        elif not view.__module__.startswith("rest_framework."):
+            for method in view.http_method_names:
+                if method not in ("options", "head") and hasattr(view, method):
+                    yield f"{view.__name__}.{method}"
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Every routed action must stay within the SQL query budget it declares
+    in `QUERY_BUDGETS`, on seeded data and at several page sizes.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = build_dataset(
+            users=30, teams=40, notes=400, seed=0, rebuild_search_index=True
+        )
+
+    def setUp(self):
+        for alias in settings.CACHES:
+            caches[alias].clear()
+        self.context = BenchmarkContext(self.dataset)
+        throttle = mock.patch.object(
+            SlidingWindowRateThrottle, "allow_request", return_value=True
+        )
+        throttle.start()
+        self.addCleanup(throttle.stop)
+        # Write buffered logins while the test database still exists.
+        self.addCleanup(get_last_login_buffer().flush)
+
+    def test_every_routed_action_declares_a_budget(self):
+        missing = sorted(set(routed_actions()) - set(QUERY_BUDGETS))
+        self.assertEqual(missing, [], "Actions without a query budget.")
+
+    def test_every_budget_has_a_scenario(self):
+        scenarios = {scenario.name for scenario in SCENARIOS}
+        self.assertEqual(sorted(set(QUERY_BUDGETS) - scenarios), [])
+
+    def test_actions_stay_within_their_query_budget(self):
+        for scenario in SCENARIOS:
+            page_sizes = PAGE_SIZES if scenario.name in PAGINATED_ACTIONS else [None]
+
+            for page_size in page_sizes:
+                with self.subTest(action=scenario.name, page_size=page_size):
+                    self.assertWithinBudget(scenario, page_size)
+
+    def assertWithinBudget(self, scenario, page_size):
+        # Warm per-user caches first so only the steady state is measured.
+        self.perform(scenario, page_size, iteration=0)
+        response, statements = self.perform(scenario, page_size, iteration=1)
+
+        self.assertLess(response.status_code, 400, response.content)
+
+        budget = QUERY_BUDGETS[scenario.name].limit(page_size or 1)
+        if len(statements) <= budget:
+            return
+
+        fingerprints = Counter(fingerprint_sql(sql) for sql in statements)
+        report = "\n".join(
+            f"  {count} x {sql}" for sql, count in fingerprints.most_common()
+        )
+        self.fail(
+            f"{scenario.name} ran {len(statements)} queries, budget is {budget}:\n"
+            f"{report}"
+        )
+
+    def perform(self, scenario, page_size, iteration):
+        request = scenario.prepare(self.context, iteration)
+        path = request.path
+        if page_size is not None:
+            path = replace_query_param(path, "page_size", page_size)
+
+        headers = {}
+        if request.auth is not None:
+            user = self.context.actor if request.auth == "actor" else request.auth
+            token = UserRefreshToken.for_user(user).access_token
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, request.method)(
+                path, request.data, content_type="application/json", **headers
+            )
+
+        statements = [
+            query["sql"]
+            for query in queries.captured_queries
+            if not query["sql"].startswith(SAVEPOINT_PREFIXES)
+        ]
+        return response, statements
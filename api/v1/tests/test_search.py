@@ -0,0 +1,66 @@
+from api.v1.search import get_search_backend
+from api.v1.tests.api_test_case import APITestCase
+
+
+class NoteSearchTests(APITestCase):
+    """
+    Search only returns notes of the reader's teams, as they are now.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.stranger = self.create_user("stranger")
+        self.team = self.create_team(self.owner)
+        self.other_team = self.create_team(self.stranger)
+        self.note = self.create_note(self.team, self.owner, "Quarterly roadmap")
+        self.create_note(self.other_team, self.stranger, "Secret roadmap")
+
+    def search(self, user, query):
+        response = self.request(user, "get", f"/api/v1/notes/search/?q={query}")
+        self.assertEqual(response.status_code, 200, response.content)
+        return [note["id"] for note in response.json()["results"]]
+
+    def test_results_are_scoped_to_the_readers_teams(self):
+        self.assertEqual(self.search(self.owner, "roadmap"), [self.note.pk])
+
+    def test_matches_are_highlighted(self):
+        response = self.request(self.owner, "get", "/api/v1/notes/search/?q=quarterly")
+
+        self.assertEqual(
+            response.json()["results"][0]["highlight"]["title"],
+            "<mark>Quarterly</mark> roadmap",
+        )
+
+    def test_updated_titles_are_searched_by_their_new_words(self):
+        self.request(
+            self.owner, "patch", f"/api/v1/notes/{self.note.pk}/", {"title": "Budget"}
+        )
+
+        self.assertEqual(self.search(self.owner, "roadmap"), [])
+        self.assertEqual(self.search(self.owner, "budget"), [self.note.pk])
+
+    def test_deleted_notes_are_not_found(self):
+        self.request(self.owner, "delete", f"/api/v1/notes/{self.note.pk}/")
+
+        self.assertEqual(self.search(self.owner, "roadmap"), [])
+
+    def test_notes_saved_outside_the_api_are_indexed(self):
+        self.note.title = "Hiring plan"
+        self.note.save()
+
+        self.assertEqual(self.search(self.owner, "hiring"), [self.note.pk])
+
+    def test_notes_deleted_with_their_team_leave_the_index(self):
+        team_id = self.team.pk
+        self.request(self.owner, "delete", f"/api/v1/teams/{team_id}/")
+
+        self.assertEqual(get_search_backend().search("quarterly", [team_id], 10), [])
+
+    def test_leaving_a_team_hides_its_notes(self):
+        self.join(self.stranger, self.team)
+        self.assertEqual(self.search(self.stranger, "quarterly"), [self.note.pk])
+
+        self.request(self.stranger, "delete", f"/api/v1/teams/{self.team.pk}/leave/")
+
+        self.assertEqual(self.search(self.stranger, "quarterly"), [])
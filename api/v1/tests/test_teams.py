@@ -0,0 +1,195 @@
+from datetime import timedelta
+from django.utils import timezone
+from api.v1.models import Membership, Team
+from api.v1.tests.api_test_case import APITestCase
+
+
+class TeamCodeTests(APITestCase):
+    """
+    Users join teams by code, which the owner can rotate and let expire.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.member = self.create_user("member")
+        self.team = self.create_team(self.owner)
+
+    def rotate(self, user, data=None):
+        return self.request(
+            user, "post", f"/api/v1/teams/{self.team.pk}/rotate-code/", data or {}
+        )
+
+    def join_with(self, user, code):
+        return self.request(
+            user, "post", f"/api/v1/teams/{self.team.pk}/join/", {"code": code}
+        )
+
+    def test_joining_makes_the_team_readable(self):
+        self.join(self.member, self.team)
+
+        response = self.request(
+            self.member, "get", f"/api/v1/teams/{self.team.pk}/notes/"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertTrue(
+            Membership.objects.filter(
+                team=self.team, user=self.member, role=Membership.Role.MEMBER
+            ).exists()
+        )
+
+    def test_joining_twice_is_refused(self):
+        self.join(self.member, self.team)
+
+        self.assertEqual(self.join_with(self.member, self.team.code).status_code, 400)
+
+    def test_unknown_code_is_not_found(self):
+        deleted = self.create_team(self.owner, name="Deleted team")
+        deleted.delete()
+
+        self.assertEqual(self.join_with(self.member, deleted.code).status_code, 404)
+
+    def test_malformed_code_is_refused(self):
+        self.assertEqual(self.join_with(self.member, "not-a-code").status_code, 400)
+
+    def test_rotating_retires_the_old_code(self):
+        old_code = self.team.code
+
+        response = self.rotate(self.owner)
+
+        self.assertEqual(response.status_code, 200, response.content)
+        new_code = response.json()["code"]
+        self.assertNotEqual(new_code, old_code)
+        self.assertEqual(self.join_with(self.member, old_code).status_code, 404)
+        self.assertEqual(self.join_with(self.member, new_code).status_code, 201)
+
+    def test_expired_codes_are_refused(self):
+        code = self.rotate(self.owner, {"expires_in": 60}).json()["code"]
+        Team.objects.filter(pk=self.team.pk).update(
+            code_expires_at=timezone.now() - timedelta(seconds=1)
+        )
+
+        response = self.join_with(self.member, code)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Team code has expired.")
+
+    def test_only_the_owner_rotates_the_code(self):
+        self.join(self.member, self.team)
+
+        self.assertEqual(self.rotate(self.member).status_code, 403)
+
+
+class CrossTeamAccessTests(APITestCase):
+    """
+    Notes of teams the user does not belong to are reported as missing.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.stranger = self.create_user("stranger")
+        self.team = self.create_team(self.owner)
+        self.note = self.create_note(self.team, self.owner, "Private")
+        self.create_team(self.stranger)
+
+    def test_note_reads_and_writes_are_not_found(self):
+        path = f"/api/v1/notes/{self.note.pk}/"
+
+        for method, data in [
+            ("get", None),
+            ("patch", {"title": "Taken"}),
+            ("put", {"title": "Taken", "body": "", "team": self.team.pk}),
+            ("delete", None),
+        ]:
+            with self.subTest(method=method):
+                response = self.request(self.stranger, method, path, data)
+                self.assertEqual(response.status_code, 404, response.content)
+
+        self.note.refresh_from_db()
+        self.assertEqual(self.note.title, "Private")
+
+    def test_team_notes_are_not_found(self):
+        response = self.request(
+            self.stranger, "get", f"/api/v1/teams/{self.team.pk}/notes/"
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_notes_cannot_be_created_in_the_team(self):
+        response = self.request(
+            self.stranger,
+            "post",
+            "/api/v1/notes/",
+            {"team": self.team.pk, "title": "Intruder", "body": ""},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_members_lose_access_when_they_leave(self):
+        self.join(self.stranger, self.team)
+        path = f"/api/v1/notes/{self.note.pk}/"
+        self.assertEqual(self.request(self.stranger, "get", path).status_code, 200)
+
+        self.request(self.stranger, "delete", f"/api/v1/teams/{self.team.pk}/leave/")
+
+        self.assertEqual(self.request(self.stranger, "get", path).status_code, 404)
+
+
+class UserTeamsTests(APITestCase):
+    """
+    Users list the teams they own or joined, and no one else's.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.owner = self.create_user("owner")
+        self.member = self.create_user("member")
+        self.team = self.create_team(self.owner)
+        self.create_team(self.member)
+
+    def test_joined_teams_are_listed(self):
+        self.join(self.member, self.team)
+
+        response = self.request(
+            self.member, "get", f"/api/v1/users/{self.member.pk}/teams/"
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_other_users_teams_are_not_found(self):
+        response = self.request(
+            self.member, "get", f"/api/v1/users/{self.owner.pk}/teams/"
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TeamSanitizationTests(APITestCase):
+    """
+    Team names and profile URLs are stored as text; descriptions keep safe
+    inline markup.
+    """
+
+    def test_created_teams_are_sanitized(self):
+        owner = self.create_user("owner")
+
+        response = self.request(
+            owner,
+            "post",
+            "/api/v1/teams/",
+            {
+                "name": "<b>Team</b>",
+                "description": "<i>d</i><script>x()</script>",
+                "profile": "https://example.com/<script>x()</script>",
+            },
+        )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        team = Team.objects.get(pk=response.json()["id"])
+        self.assertEqual(team.name, "&lt;b&gt;Team&lt;/b&gt;")
+        self.assertEqual(team.description, "<i>d</i>&lt;script&gt;x()&lt;/script&gt;")
+        self.assertEqual(
+            team.profile, "https://example.com/&lt;script&gt;x()&lt;/script&gt;"
+        )
@@ -0,0 +1,74 @@
+import os
+import tempfile
+from unittest import mock
+from django.test import override_settings
+from rest_framework.throttling import SimpleRateThrottle
+from api.v1.models import Note
+from api.v1.tests.api_test_case import APITestCase
+from api.v1.throttles import FileThrottleStore
+
+
+class NoteThrottleTests(APITestCase):
+    """
+    Bulk requests are charged one request per operation against the `notes`
+    rate, and refused when they carry more operations than the rate allows.
+    """
+
+    throttle = True
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        store = FileThrottleStore(os.path.join(directory.name, "throttles.bin"), 16)
+
+        for patcher in [
+            mock.patch(
+                "api.v1.throttles.sliding_window_throttle.get_throttle_store",
+                return_value=store,
+            ),
+            mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"notes": "3/min"}),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.owner = self.create_user("owner")
+        self.team = self.create_team(self.owner)
+
+    def bulk(self, count):
+        return self.request(
+            self.owner,
+            "post",
+            "/api/v1/notes/bulk/",
+            {
+                "create": [
+                    {"team": self.team.pk, "title": f"n{i}"} for i in range(count)
+                ]
+            },
+        )
+
+    def search(self):
+        return self.request(self.owner, "get", "/api/v1/notes/search/?q=n")
+
+    def test_each_operation_is_charged(self):
+        self.assertEqual(self.bulk(2).status_code, 200)
+        self.assertEqual(self.search().status_code, 200)
+
+        response = self.search()
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    def test_a_batch_over_the_rate_is_refused_uncounted(self):
+        response = self.bulk(4)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse(Note.objects.exists())
+        for _ in range(3):
+            self.assertEqual(self.search().status_code, 200)
+
+    @override_settings(NOTE_BULK_MAX_OPERATIONS=2)
+    def test_an_oversized_batch_is_charged_in_full(self):
+        self.assertEqual(self.bulk(3).status_code, 400)
+
+        self.assertEqual(self.search().status_code, 429)
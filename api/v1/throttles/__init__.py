@@ -0,0 +1,26 @@
+from api.v1.throttles.base_store import (
+    ThrottleStore,
+    ThrottleResult,
+    get_throttle_store,
+)
+from api.v1.throttles.file_store import FileThrottleStore
+from api.v1.throttles.redis_store import RedisThrottleStore
+from api.v1.throttles.sliding_window_throttle import (
+    SlidingWindowRateThrottle,
+    AnonSlidingWindowThrottle,
+    UserSlidingWindowThrottle,
+    ScopedSlidingWindowThrottle,
+)
+
+
+__all__ = [
+    "ThrottleStore",
+    "ThrottleResult",
+    "get_throttle_store",
+    "FileThrottleStore",
+    "RedisThrottleStore",
+    "SlidingWindowRateThrottle",
+    "AnonSlidingWindowThrottle",
+    "UserSlidingWindowThrottle",
+    "ScopedSlidingWindowThrottle",
+]
@@ -0,0 +1,96 @@
+import math
+import os
+from collections import namedtuple
+from functools import lru_cache
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+ThrottleResult = namedtuple("ThrottleResult", ["allowed", "wait"])
+
+
+class ThrottleStore:
+    """
+    Interface every throttle store implements.
+
+    Stores keep one sliding-window counter per key: the request counts of
+    the current and the previous fixed window. The previous count is
+    weighted by how much of it still overlaps the sliding window, which
+    approximates a true sliding log in constant memory per key.
+
+    Stores that wait on the network or on locks held by other processes
+    set `blocking`, so that async views check them off the event loop.
+    """
+
+    blocking = True
+
+    def hit(self, key, limit, window, now, cost=1):
+        """
+        Count a request weighing `cost` requests for `key` if that keeps
+        the count of the last `window` seconds within `limit`, and return a
+        `ThrottleResult`.
+        """
+        raise NotImplementedError("`hit()` must be implemented.")
+
+    def clear(self):
+        raise NotImplementedError("`clear()` must be implemented.")
+
+
+def window_position(now, window):
+    """
+    Return the index of the fixed window containing `now` and the fraction
+    of it that has elapsed.
+    """
+    position = now / window
+    index = math.floor(position)
+    return index, position - index
+
+
+def roll_window(stored_index, current, previous, index):
+    """
+    Return the `(current, previous)` counts of window `index` given the
+    counts stored for window `stored_index`.
+    """
+    if stored_index == index:
+        return current, previous
+    if stored_index == index - 1:
+        return 0, current
+    return 0, 0
+
+
+def sliding_window_hit(current, previous, elapsed, limit, window, cost=1):
+    """
+    Decide a request weighing `cost` against the counts of the current
+    window and return `(result, current)` with the count to store.
+    """
+    if previous * (1 - elapsed) + current + cost <= limit:
+        return ThrottleResult(True, None), current + cost
+
+    wait = sliding_window_wait(current, previous, elapsed, limit, window, cost)
+    return ThrottleResult(False, wait), current
+
+
+def sliding_window_wait(current, previous, elapsed, limit, window, cost=1):
+    """
+    Return the seconds until a request weighing `cost` over the limit
+    would be allowed.
+    """
+    if current + cost > limit:
+        # Wait out this window, then until the carried-over weight of its
+        # count leaves room for the request.
+        fraction = 2 - elapsed - (limit - cost) / current
+    elif previous:
+        fraction = 1 - (limit - cost - current) / previous - elapsed
+    else:
+        fraction = 0
+
+    return max(0.0, fraction * window)
+
+
+@lru_cache(maxsize=None)
+def get_throttle_store():
+    return import_string(settings.THROTTLE_STORE)(**settings.THROTTLE_STORE_OPTIONS)
+
+
+# Locks held by the parent's threads at fork time would never be released.
+os.register_at_fork(after_in_child=get_throttle_store.cache_clear)
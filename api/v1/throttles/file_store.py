@@ -0,0 +1,144 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import stat
+import struct
+import threading
+from django.core.exceptions import ImproperlyConfigured
+from api.v1.throttles.base_store import (
+    ThrottleStore,
+    roll_window,
+    sliding_window_hit,
+    window_position,
+)
+
+
+# Key hash, window index, current count, previous count.
+SLOT = struct.Struct("<QqII")
+
+
+class FileThrottleStore(ThrottleStore):
+    """
+    Throttle store shared by every process on a host through a
+    memory-mapped file.
+
+    The file is a fixed table of `buckets` buckets of `ways` slots, so its
+    size never grows. A key hashes to one bucket, which is locked with a
+    byte-range lock while its slot is read and updated. When every slot of
+    a bucket is taken, the one with the oldest window is reused; size the
+    table above the number of keys active within two windows.
+
+    The file must be a regular file owned by this user and private to it,
+    as whoever can write it can lift or impose any limit. It is never
+    opened through a symbolic link.
+
+    Waiting for a bucket lock held by another process would stall an event
+    loop, so the store is `blocking`.
+    """
+
+    def __init__(self, path, buckets=4096, ways=8):
+        self.path = str(path)
+        self.buckets = buckets
+        self.ways = ways
+        self.bucket_size = ways * SLOT.size
+        self._lock = threading.Lock()
+
+        size = buckets * self.bucket_size
+        self._fd = self._open(self.path)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def hit(self, key, limit, window, now, cost=1):
+        key_hash = self._hash(key)
+        index, elapsed = window_position(now, window)
+        offset = key_hash % self.buckets * self.bucket_size
+
+        with self._lock, self._locked(offset):
+            slot_offset, stored = self._find_slot(offset, key_hash)
+            current, previous = roll_window(stored[1], stored[2], stored[3], index)
+            result, current = sliding_window_hit(
+                current, previous, elapsed, limit, window, cost
+            )
+            SLOT.pack_into(self._map, slot_offset, key_hash, index, current, previous)
+
+        return result
+
+    def clear(self):
+        with self._lock, self._locked(0, len(self._map)):
+            self._map[:] = bytes(len(self._map))
+
+    def _find_slot(self, offset, key_hash):
+        """
+        Return the offset and contents of the slot holding `key_hash`, or of
+        the slot to reuse for it with its counts zeroed.
+        """
+        oldest = None
+
+        for slot_offset in range(offset, offset + self.bucket_size, SLOT.size):
+            stored = SLOT.unpack_from(self._map, slot_offset)
+            if stored[0] == key_hash:
+                return slot_offset, stored
+            if oldest is None or stored[1] < oldest[1][1]:
+                oldest = slot_offset, stored
+
+        return oldest[0], (key_hash, 0, 0, 0)
+
+    @staticmethod
+    def _open(path):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        try:
+            fd = os.open(
+                path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW | os.O_CLOEXEC, 0o600
+            )
+        except OSError as e:
+            raise ImproperlyConfigured(
+                f"Cannot open the throttle file {path}: {e.strerror}."
+            ) from e
+
+        info = os.fstat(fd)
+        if (
+            not stat.S_ISREG(info.st_mode)
+            or info.st_uid != os.geteuid()
+            or info.st_mode & 0o077
+        ):
+            os.close(fd)
+            raise ImproperlyConfigured(
+                f"The throttle file {path} must be a regular file owned by this "
+                "user and neither readable nor writable by others."
+            )
+
+        return fd
+
+    def _locked(self, offset, length=None):
+        return _RangeLock(self._fd, offset, length or self.bucket_size)
+
+    @staticmethod
+    def _hash(key):
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        # Zero marks an empty slot.
+        return int.from_bytes(digest, "little") or 1
+
+
+class _RangeLock:
+    """
+    Exclusive `fcntl` lock on a byte range of a file.
+    """
+
+    def __init__(self, fd, offset, length):
+        self.fd = fd
+        self.offset = offset
+        self.length = length
+
+    def __enter__(self):
+        fcntl.lockf(self.fd, fcntl.LOCK_EX, self.length, self.offset)
+
+    def __exit__(self, *exc_info):
+        fcntl.lockf(self.fd, fcntl.LOCK_UN, self.length, self.offset)
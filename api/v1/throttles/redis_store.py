@@ -0,0 +1,82 @@
+from django.core.exceptions import ImproperlyConfigured
+from api.v1.throttles.base_store import (
+    ThrottleStore,
+    ThrottleResult,
+    sliding_window_wait,
+    window_position,
+)
+
+
+# Rolls the key's counts into the current window and adds the request's cost
+# if the weighted estimate leaves room for it, atomically. Returns the
+# decision and the counts it was made on.
+SLIDING_WINDOW_SCRIPT = """
+local index = tonumber(ARGV[1])
+local elapsed = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local cost = tonumber(ARGV[5])
+
+local state = redis.call("HMGET", KEYS[1], "index", "current", "previous")
+local stored = tonumber(state[1])
+local current, previous = 0, 0
+if stored == index then
+    current = tonumber(state[2])
+    previous = tonumber(state[3])
+elseif stored == index - 1 then
+    previous = tonumber(state[2])
+end
+
+local allowed = 0
+if previous * (1 - elapsed) + current + cost <= limit then
+    allowed = 1
+    redis.call(
+        "HSET", KEYS[1],
+        "index", index, "current", current + cost, "previous", previous
+    )
+    redis.call("PEXPIRE", KEYS[1], ttl)
+end
+
+return {allowed, current, previous}
+"""
+
+
+class RedisThrottleStore(ThrottleStore):
+    """
+    Throttle store kept in Redis, or any server speaking its protocol and
+    running Lua scripts, shared by every host.
+
+    Each key is a small hash updated by one script call, so a check is a
+    single round trip. Keys expire two windows after their last request.
+    """
+
+    def __init__(self, url, prefix="throttle:"):
+        try:
+            import redis
+        except ImportError:
+            raise ImproperlyConfigured(
+                "RedisThrottleStore requires the `redis` package."
+            )
+
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(url)
+        self.script = self.client.register_script(SLIDING_WINDOW_SCRIPT)
+
+    def hit(self, key, limit, window, now, cost=1):
+        index, elapsed = window_position(now, window)
+        allowed, current, previous = self.script(
+            keys=[self.prefix + key],
+            args=[index, repr(elapsed), limit, int(window * 2000), cost],
+        )
+
+        if allowed:
+            return ThrottleResult(True, None)
+
+        wait = sliding_window_wait(
+            int(current), int(previous), elapsed, limit, window, cost
+        )
+        return ThrottleResult(False, wait)
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
@@ -0,0 +1,66 @@
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle,
+)
+from api.v1.throttles.base_store import ThrottleResult, get_throttle_store
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle counting requests in sliding windows kept in the shared
+    `THROTTLE_STORE` instead of per-process timestamp lists in the cache,
+    so limits hold across every worker.
+
+    Views may weigh a request as several by defining
+    `get_throttle_cost(request)`. A request weighing more than the rate is
+    refused outright, since no window would ever have room for it.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        cost = self.get_cost(request, view)
+        if cost > self.num_requests:
+            self.result = ThrottleResult(False, None)
+            return False
+
+        self.result = get_throttle_store().hit(
+            self.key, self.num_requests, self.duration, self.timer(), cost
+        )
+        return self.result.allowed
+
+    @property
+    def blocking(self):
+        return get_throttle_store().blocking
+
+    def get_cost(self, request, view):
+        get_throttle_cost = getattr(view, "get_throttle_cost", None)
+        if get_throttle_cost is None:
+            return 1
+
+        return max(get_throttle_cost(request), 1)
+
+    def wait(self):
+        return self.result.wait
+
+
+class AnonSlidingWindowThrottle(AnonRateThrottle, SlidingWindowRateThrottle):
+    pass
+
+
+class UserSlidingWindowThrottle(UserRateThrottle, SlidingWindowRateThrottle):
+    pass
+
+
+class ScopedSlidingWindowThrottle(ScopedRateThrottle, SlidingWindowRateThrottle):
+    """
+    Throttle the views setting `throttle_scope` at that scope's rate, per
+    user or per address for anonymous requests.
+    """
@@ -1,7 +1,15 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework import routers
-from rest_framework_simplejwt.views import TokenBlacklistView, TokenRefreshView
 from api.v1.viewsets import *
+from api.v1.views import TokenBlacklistView, TokenRefreshView, metrics_view
+
+# Serve the same routes from the ASGI-native viewsets.
+if settings.ASYNC_VIEWSETS:
+    RegisterViewSet = AsyncRegisterViewSet
+    LoginViewSet = AsyncLoginViewSet
+    TeamViewSet = AsyncTeamViewSet
+    NoteViewSet = AsyncNoteViewSet
 
 auth_route = routers.DefaultRouter()
 auth_route.register(r"register", RegisterViewSet, basename="register")
@@ -25,5 +33,6 @@ urlpatterns = [
             ]
         ),
     ),
+    path("metrics/", metrics_view, name="metrics"),
     path("", include(route.urls)),
 ]
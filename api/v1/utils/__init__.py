@@ -1,4 +1,83 @@
 from api.v1.utils.code_generator_util import code_generator
+from api.v1.utils.membership_cache_util import (
+    aget_user_team_ids,
+    ainvalidate_user_team_ids,
+    get_user_team_ids,
+    invalidate_user_team_ids,
+)
+from api.v1.utils.user_cache_util import (
+    aget_authenticated_user,
+    aget_cached_user,
+    get_authenticated_user,
+    get_cached_user,
+    invalidate_cached_user,
+)
+from api.v1.utils.last_login_util import (
+    LastLoginBuffer,
+    arecord_last_login,
+    get_last_login_buffer,
+    record_last_login,
+)
+from api.v1.utils.password_upgrade_util import (
+    PasswordUpgradeQueue,
+    get_password_upgrade_queue,
+)
+from api.v1.utils.password_hashing_util import (
+    acheck_password,
+    amake_password,
+    get_password_hashing_executor,
+)
+from api.v1.utils.bloom_filter_util import BloomFilter
+from api.v1.utils.object_cache_util import ObjectCache
+from api.v1.utils.sanitize_util import SanitizePolicy, sanitize
+from api.v1.utils.token_blacklist_util import (
+    TokenBlacklistFilter,
+    get_blacklist_filter,
+    prune_expired_tokens,
+)
+from api.v1.utils.instrumentation_util import (
+    RequestMetrics,
+    activate_request_metrics,
+    deactivate_request_metrics,
+    fingerprint_sql,
+    get_instrumentation_setting,
+    get_request_metrics,
+    record_query,
+)
 
 
-__all__ = ["code_generator"]
+__all__ = [
+    "code_generator",
+    "aget_user_team_ids",
+    "get_user_team_ids",
+    "invalidate_user_team_ids",
+    "ainvalidate_user_team_ids",
+    "aget_authenticated_user",
+    "aget_cached_user",
+    "get_authenticated_user",
+    "get_cached_user",
+    "invalidate_cached_user",
+    "LastLoginBuffer",
+    "get_last_login_buffer",
+    "record_last_login",
+    "arecord_last_login",
+    "PasswordUpgradeQueue",
+    "get_password_upgrade_queue",
+    "acheck_password",
+    "amake_password",
+    "get_password_hashing_executor",
+    "BloomFilter",
+    "ObjectCache",
+    "SanitizePolicy",
+    "sanitize",
+    "TokenBlacklistFilter",
+    "get_blacklist_filter",
+    "prune_expired_tokens",
+    "RequestMetrics",
+    "activate_request_metrics",
+    "deactivate_request_metrics",
+    "fingerprint_sql",
+    "get_instrumentation_setting",
+    "get_request_metrics",
+    "record_query",
+]
@@ -0,0 +1,150 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from django.conf import settings
+
+
+_current_metrics = ContextVar("v1_request_metrics", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+DEFAULT_INSTRUMENTATION = {
+    "ENABLED": True,
+    "SERVER_TIMING": True,
+    "LOG_DUPLICATE_QUERIES": False,
+    "DUPLICATE_QUERY_THRESHOLD": 2,
+    "SLOW_REQUEST_THRESHOLD": 1.0,
+}
+
+
+def get_instrumentation_setting(name):
+    options = getattr(settings, "API_INSTRUMENTATION", {})
+    return options.get(name, DEFAULT_INSTRUMENTATION[name])
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Reduce a statement to its shape so repeated queries that only differ by
+    parameters, literals or `IN` list length collapse to one fingerprint.
+    """
+    sql = _LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class RequestMetrics:
+    """
+    Timings and SQL statistics collected over a single request.
+
+    All durations are kept in seconds and reported in milliseconds.
+    """
+
+    def __init__(self, track_fingerprints=False):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.view_name = None
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.serializer_time = 0.0
+        self.render_time = 0.0
+        self.fingerprints = Counter() if track_fingerprints else None
+        self._serializer_depth = 0
+        self._render_started = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - started
+            self.query_count += 1
+            if self.fingerprints is not None:
+                self.fingerprints[fingerprint_sql(sql)] += 1
+
+    def enter_serializer(self):
+        self._serializer_depth += 1
+        return time.perf_counter()
+
+    def exit_serializer(self, started):
+        self._serializer_depth -= 1
+        if not self._serializer_depth:
+            self.serializer_time += time.perf_counter() - started
+
+    def start_render(self):
+        self._render_started = time.perf_counter()
+
+    def stop_render(self):
+        if self._render_started is not None:
+            self.render_time += time.perf_counter() - self._render_started
+            self._render_started = None
+
+    def finish(self):
+        self.finished = time.perf_counter()
+
+    @property
+    def wall_time(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def duplicate_queries(self, threshold):
+        if self.fingerprints is None:
+            return []
+        return [
+            (sql, count)
+            for sql, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.sql_time * 1000:.2f};desc="{self.query_count} queries"',
+                f"serializer;dur={self.serializer_time * 1000:.2f}",
+                f"render;dur={self.render_time * 1000:.2f}",
+                f"total;dur={self.wall_time * 1000:.2f}",
+            ]
+        )
+
+    def as_log_fields(self) -> dict:
+        return {
+            "view": self.view_name,
+            "queries": self.query_count,
+            "sql_ms": round(self.sql_time * 1000, 2),
+            "serializer_ms": round(self.serializer_time * 1000, 2),
+            "render_ms": round(self.render_time * 1000, 2),
+            "total_ms": round(self.wall_time * 1000, 2),
+        }
+
+
+def get_request_metrics():
+    """
+    Return the metrics of the request being served, or `None` outside of
+    the instrumentation middleware.
+    """
+    return _current_metrics.get()
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper counting the statement against the metrics of the
+    request being served.
+
+    It is installed on every connection once, rather than per request, so
+    that queries the async viewsets run on `sync_to_async` threads are
+    counted too: the request's metrics follow it there in the context.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def activate_request_metrics(metrics):
+    return _current_metrics.set(metrics)
+
+
+def deactivate_request_metrics(token):
+    _current_metrics.reset(token)
@@ -0,0 +1,139 @@
+import atexit
+import logging
+import os
+import threading
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, DateTimeField, Value, When
+from django.utils import timezone
+from api.v1.models.users import User
+from api.v1.utils.user_cache_util import invalidate_cached_user
+
+
+logger = logging.getLogger(__name__)
+
+# Rows per `UPDATE`, keeping the statement under SQLite's parameter limit.
+FLUSH_BATCH_SIZE = 300
+
+
+class LastLoginBuffer:
+    """
+    Write-behind buffer of `User.last_login` timestamps.
+
+    Logins are recorded in memory and written in one `UPDATE ... CASE` per
+    batch, either `flush_interval` seconds after the first pending login or
+    as soon as `max_pending` users are waiting, whichever comes first. A
+    stored `last_login` is thus at most `flush_interval` seconds stale.
+    """
+
+    def __init__(self, flush_interval, max_pending):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def record(self, user_id, timestamp=None):
+        if self._add(user_id, timestamp):
+            self._flush_quietly()
+
+    async def arecord(self, user_id, timestamp=None):
+        """
+        Async counterpart of `record`, which flushes a full buffer off the
+        event loop.
+        """
+        if self._add(user_id, timestamp):
+            await sync_to_async(self._flush_quietly)()
+
+    def _add(self, user_id, timestamp):
+        """
+        Buffer a login and return whether the buffer is now full.
+        """
+        with self._lock:
+            self._pending[user_id] = timestamp or timezone.now()
+            full = len(self._pending) >= self.max_pending
+
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_in_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        return full
+
+    def flush(self):
+        """
+        Write every pending timestamp and return how many users were updated.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        items = list(pending.items())
+        for start in range(0, len(items), FLUSH_BATCH_SIZE):
+            batch = items[start : start + FLUSH_BATCH_SIZE]
+            User.objects.filter(pk__in=[user_id for user_id, _ in batch]).update(
+                last_login=Case(
+                    *(When(pk=user_id, then=Value(when)) for user_id, when in batch),
+                    output_field=DateTimeField(),
+                )
+            )
+
+        # Bulk updates send no signals, so drop the cached rows by hand.
+        invalidate_cached_user(*pending)
+        return len(pending)
+
+    def _flush_quietly(self):
+        # A failed flush loses the batch but must not fail a login.
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Could not flush buffered last login timestamps.")
+
+    def _flush_in_timer(self):
+        try:
+            self._flush_quietly()
+        finally:
+            connections.close_all()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_last_login_buffer():
+    global _buffer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                buffer = LastLoginBuffer(
+                    flush_interval=settings.LAST_LOGIN_FLUSH_INTERVAL,
+                    max_pending=settings.LAST_LOGIN_MAX_PENDING,
+                )
+                atexit.register(buffer._flush_quietly)
+                _buffer = buffer
+
+    return _buffer
+
+
+def record_last_login(user_id):
+    get_last_login_buffer().record(user_id)
+
+
+async def arecord_last_login(user_id):
+    await get_last_login_buffer().arecord(user_id)
+
+
+def _reset_buffer():
+    # Pending logins belong to the parent, which flushes them itself.
+    global _buffer
+    _buffer = None
+
+
+os.register_at_fork(after_in_child=_reset_buffer)
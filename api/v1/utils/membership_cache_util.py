@@ -0,0 +1,77 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from api.v1.models.memberships import Membership
+from api.v1.metrics import record_cache_lookup
+
+
+def _cache():
+    return caches[settings.MEMBERSHIP_CACHE_ALIAS]
+
+
+def _team_ids_key(user_id) -> str:
+    return f"v1:membership:team_ids:{user_id}"
+
+
+def get_user_team_ids(user_id) -> frozenset:
+    """
+    Return the ids of every team the user owns or joined.
+
+    The set is built with one indexed query on a miss and then served from
+    the `MEMBERSHIP_CACHE_ALIAS` cache until a membership signal
+    invalidates it.
+    """
+    if user_id is None:
+        return frozenset()
+
+    key = _team_ids_key(user_id)
+    team_ids = _cache().get(key)
+    record_cache_lookup("membership", hit=team_ids is not None)
+
+    if team_ids is None:
+        team_ids = frozenset(
+            Membership.objects.filter(user_id=user_id).values_list("team_id", flat=True)
+        )
+        _cache().set(key, team_ids, settings.MEMBERSHIP_CACHE_TIMEOUT)
+
+    return team_ids
+
+
+async def aget_user_team_ids(user_id) -> frozenset:
+    """
+    Async counterpart of `get_user_team_ids`.
+    """
+    if user_id is None:
+        return frozenset()
+
+    key = _team_ids_key(user_id)
+    team_ids = await _cache().aget(key)
+    record_cache_lookup("membership", hit=team_ids is not None)
+
+    if team_ids is None:
+        team_ids = frozenset(
+            [
+                team_id
+                async for team_id in Membership.objects.filter(
+                    user_id=user_id
+                ).values_list("team_id", flat=True)
+            ]
+        )
+        await _cache().aset(key, team_ids, settings.MEMBERSHIP_CACHE_TIMEOUT)
+
+    return team_ids
+
+
+def invalidate_user_team_ids(*user_ids) -> None:
+    """
+    Clear the cached team ids of the given users, and again once the
+    current transaction commits, so a set read by another worker before
+    the commit is not kept.
+    """
+    keys = [_team_ids_key(user_id) for user_id in user_ids]
+    _cache().delete_many(keys)
+    transaction.on_commit(lambda: _cache().delete_many(keys))
+
+
+async def ainvalidate_user_team_ids(*user_ids) -> None:
+    await _cache().adelete_many([_team_ids_key(user_id) for user_id in user_ids])
@@ -0,0 +1,200 @@
+import asyncio
+import time
+import uuid
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from api.v1.metrics import record_cache_lookup
+
+
+# Cached in place of the payload of an id with no row, so that lookups of
+# missing objects stay off the database as well.
+DOES_NOT_EXIST = "__does_not_exist__"
+
+
+class ObjectCache:
+    """
+    Versioned read-through cache of the serialized payloads of one kind of
+    object, kept in the `OBJECT_CACHE_ALIAS` cache.
+
+    Every id has a version key naming its current payload, which lives
+    under the id and that version. Invalidation writes a new version, the
+    row's `updated_at` when it was saved, so a payload rebuilt from a row
+    read before the change lands under a version nobody looks up anymore.
+
+    A missing payload is rebuilt by `load(pk)` in one worker at a time: the
+    others wait up to `OBJECT_CACHE_LOCK_WAIT` seconds for it to appear
+    before loading the row themselves.
+
+    Payloads that embed a parent row, named by `scope`, carry a `scope`
+    entry: the parent's id and its `updated_at` as loaded. A payload is
+    only served while that stamp is at least the one `invalidate_scope`
+    last recorded for the parent, so one write stales every payload under
+    it, however many there are.
+    """
+
+    def __init__(self, kind, load, scope=None):
+        self.kind = kind
+        self.load = load
+        self.scope = scope
+
+    @property
+    def cache(self):
+        return caches[settings.OBJECT_CACHE_ALIAS]
+
+    def get(self, pk):
+        """
+        Return the payload of the object with the given id, or `None` if
+        there is none.
+        """
+        version = self.cache.get_or_set(
+            self._version_key(pk), self._new_version, settings.OBJECT_CACHE_TIMEOUT
+        )
+        key = self._payload_key(pk, version)
+        payload = self.cache.get(key)
+        if payload is not None and not self._in_scope(payload):
+            payload = None
+        record_cache_lookup(self.kind, hit=payload is not None)
+
+        if payload is None:
+            payload = self._rebuild(pk, key)
+
+        return None if payload == DOES_NOT_EXIST else payload
+
+    async def aget(self, pk):
+        """
+        Async counterpart of `get`.
+        """
+        version = await self.cache.aget_or_set(
+            self._version_key(pk), self._new_version, settings.OBJECT_CACHE_TIMEOUT
+        )
+        key = self._payload_key(pk, version)
+        payload = await self.cache.aget(key)
+        if payload is not None and not await self._ain_scope(payload):
+            payload = None
+        record_cache_lookup(self.kind, hit=payload is not None)
+
+        if payload is None:
+            payload = await self._arebuild(pk, key)
+
+        return None if payload == DOES_NOT_EXIST else payload
+
+    def invalidate(self, *pks, version=None):
+        """
+        Point the given ids at a new version once the current transaction
+        commits, so a reader cannot cache the row as it was before.
+        """
+        if not pks:
+            return
+
+        versions = self._new_versions(pks, version)
+        transaction.on_commit(
+            lambda: self.cache.set_many(versions, settings.OBJECT_CACHE_TIMEOUT)
+        )
+
+    async def ainvalidate(self, *pks, version=None):
+        """
+        Async counterpart of `invalidate`, for writes made outside of a
+        transaction.
+        """
+        if pks:
+            await self.cache.aset_many(
+                self._new_versions(pks, version), settings.OBJECT_CACHE_TIMEOUT
+            )
+
+    def invalidate_scope(self, scope_id, stamp):
+        """
+        Stale every payload under the parent `scope_id` loaded before it
+        was saved at `stamp`, once the current transaction commits.
+        """
+        transaction.on_commit(
+            lambda: self.cache.set(
+                self._scope_key(scope_id), stamp, settings.OBJECT_CACHE_TIMEOUT
+            )
+        )
+
+    def _in_scope(self, payload):
+        if self.scope is None or payload == DOES_NOT_EXIST:
+            return True
+
+        scope_id, stamp = payload["scope"]
+        current = self.cache.get(self._scope_key(scope_id))
+        return current is not None and stamp >= current
+
+    async def _ain_scope(self, payload):
+        if self.scope is None or payload == DOES_NOT_EXIST:
+            return True
+
+        scope_id, stamp = payload["scope"]
+        current = await self.cache.aget(self._scope_key(scope_id))
+        return current is not None and stamp >= current
+
+    def _rebuild(self, pk, key):
+        lock_key = f"{key}:lock"
+
+        if self.cache.add(lock_key, 1, settings.OBJECT_CACHE_LOCK_WAIT):
+            try:
+                return self._load_and_store(pk, key)
+            finally:
+                self.cache.delete(lock_key)
+
+        deadline = time.monotonic() + settings.OBJECT_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(settings.OBJECT_CACHE_LOCK_POLL)
+            payload = self.cache.get(key)
+            if payload is not None and self._in_scope(payload):
+                return payload
+
+        return self._load(pk)
+
+    async def _arebuild(self, pk, key):
+        lock_key = f"{key}:lock"
+
+        if await self.cache.aadd(lock_key, 1, settings.OBJECT_CACHE_LOCK_WAIT):
+            try:
+                return await sync_to_async(self._load_and_store)(pk, key)
+            finally:
+                await self.cache.adelete(lock_key)
+
+        deadline = time.monotonic() + settings.OBJECT_CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.OBJECT_CACHE_LOCK_POLL)
+            payload = await self.cache.aget(key)
+            if payload is not None and await self._ain_scope(payload):
+                return payload
+
+        return await sync_to_async(self._load)(pk)
+
+    def _load_and_store(self, pk, key):
+        payload = self._load(pk)
+        self.cache.set(key, payload, settings.OBJECT_CACHE_TIMEOUT)
+
+        if self.scope is not None and payload != DOES_NOT_EXIST:
+            # Record the parent as loaded unless a save recorded it first.
+            scope_id, stamp = payload["scope"]
+            self.cache.add(
+                self._scope_key(scope_id), stamp, settings.OBJECT_CACHE_TIMEOUT
+            )
+
+        return payload
+
+    def _load(self, pk):
+        payload = self.load(pk)
+        return DOES_NOT_EXIST if payload is None else payload
+
+    def _new_versions(self, pks, version):
+        return {self._version_key(pk): version or self._new_version() for pk in pks}
+
+    def _version_key(self, pk):
+        return f"v1:object:{self.kind}:{pk}"
+
+    def _payload_key(self, pk, version):
+        return f"v1:object:{self.kind}:{pk}:{version}"
+
+    def _scope_key(self, scope_id):
+        return f"v1:object:{self.kind}:{self.scope}:{scope_id}"
+
+    @staticmethod
+    def _new_version():
+        return uuid.uuid4().hex
@@ -0,0 +1,57 @@
+import asyncio
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_password_hashing_executor():
+    """
+    Return the executor async handlers hash passwords on.
+
+    It runs at most `PASSWORD_HASHING_WORKERS` hashes at once, so a burst of
+    logins queues up instead of taking over the threads that serve database
+    calls for every other request.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=settings.PASSWORD_HASHING_WORKERS,
+                    thread_name_prefix="password-hashing",
+                )
+                atexit.register(executor.shutdown)
+                _executor = executor
+
+    return _executor
+
+
+async def amake_password(password):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_password_hashing_executor(), make_password, password
+    )
+
+
+async def acheck_password(password, encoded, setter=None):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_password_hashing_executor(), check_password, password, encoded, setter
+    )
+
+
+def _reset_executor():
+    # Executor threads do not survive a fork.
+    global _executor
+    _executor = None
+
+
+os.register_at_fork(after_in_child=_reset_executor)
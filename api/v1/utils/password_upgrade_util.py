@@ -0,0 +1,81 @@
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, connections
+from api.v1.models.users import User
+from api.v1.utils.user_cache_util import invalidate_cached_user
+
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordUpgradeQueue:
+    """
+    Rehash passwords stored with an outdated hasher or work factor on a
+    background thread, so the login that noticed pays no extra hashing.
+
+    A user is queued at most once at a time. The new hash is only written
+    if the stored one is still the hash that was checked, so a password
+    changed in the meantime is never overwritten.
+    """
+
+    def __init__(self):
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="password-upgrade"
+        )
+
+    def submit(self, user_id, encoded, raw_password):
+        with self._lock:
+            if user_id in self._pending:
+                return
+            self._pending.add(user_id)
+
+        self._executor.submit(self._upgrade, user_id, encoded, raw_password)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def _upgrade(self, user_id, encoded, raw_password):
+        try:
+            updated = User.objects.filter(pk=user_id, password=encoded).update(
+                password=make_password(raw_password)
+            )
+            if updated:
+                invalidate_cached_user(user_id)
+        except DatabaseError:
+            logger.exception("Could not upgrade the password hash of user %s.", user_id)
+        finally:
+            with self._lock:
+                self._pending.discard(user_id)
+            connections.close_all()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_password_upgrade_queue():
+    global _queue
+
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                queue = PasswordUpgradeQueue()
+                atexit.register(queue.shutdown)
+                _queue = queue
+
+    return _queue
+
+
+def _reset_queue():
+    # Executor threads do not survive a fork.
+    global _queue
+    _queue = None
+
+
+os.register_at_fork(after_in_child=_reset_queue)
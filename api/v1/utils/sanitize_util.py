@@ -0,0 +1,63 @@
+import re
+import threading
+from functools import lru_cache
+import bleach
+
+
+class SanitizePolicy:
+    """
+    How a string field is sanitized before it is stored.
+
+    - `RICH` keeps bleach's default allowlist of inline tags, for bodies
+      and descriptions.
+    - `TEXT` escapes every tag, for names, titles, emails and URLs, whose
+      fields accept markup characters.
+    - `NONE` stores the value as given, for credentials and codes.
+    """
+
+    NONE = "none"
+    TEXT = "text"
+    RICH = "rich"
+
+
+CLEANER_OPTIONS = {
+    SanitizePolicy.TEXT: {"tags": frozenset(), "attributes": {}},
+    SanitizePolicy.RICH: {},
+}
+
+# Strings without these characters come out of every cleaner unchanged:
+# markup characters, and the control characters the HTML parser rewrites.
+NEEDS_CLEANING = re.compile(r"[<>&\x00-\x08\x0b-\x1f]")
+
+# Values up to this long are memoized, which covers names and titles.
+MEMOIZE_MAX_LENGTH = 256
+MEMOIZE_SIZE = 4096
+
+_cleaners = threading.local()
+
+
+def _get_cleaner(policy):
+    # Cleaners keep parser state, so each thread builds its own, once.
+    cleaners = _cleaners.__dict__
+    if policy not in cleaners:
+        cleaners[policy] = bleach.Cleaner(**CLEANER_OPTIONS[policy])
+    return cleaners[policy]
+
+
+@lru_cache(maxsize=MEMOIZE_SIZE)
+def _clean_memoized(value, policy):
+    return _get_cleaner(policy).clean(value)
+
+
+def sanitize(value, policy=SanitizePolicy.RICH):
+    """
+    Return `value` sanitized under `policy`, skipping the HTML parser when
+    it holds nothing a cleaner would change.
+    """
+    if policy == SanitizePolicy.NONE or not NEEDS_CLEANING.search(value):
+        return value
+
+    if len(value) <= MEMOIZE_MAX_LENGTH:
+        return _clean_memoized(value, policy)
+
+    return _get_cleaner(policy).clean(value)
@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow
+from api.v1.utils.bloom_filter_util import BloomFilter
+
+
+class TokenBlacklistFilter:
+    """
+    Per-process Bloom filter over the jtis of blacklisted tokens.
+
+    A jti missing from the filter is known not to be blacklisted, so only
+    possible hits need a query. Every `sync_interval` seconds the filter
+    reads the blacklist rows past `high_water`, picking up tokens
+    blacklisted by other processes. Ids are not committed in the order they
+    are allocated, so `high_water` only moves past rows blacklisted more
+    than `sync_margin` seconds before the sync; later rows are read again
+    until then, in case a lower id commits after them. Once more jtis than
+    `capacity` have been added it is rebuilt from the unexpired rows,
+    growing if needed.
+    """
+
+    def __init__(self, capacity, error_rate, sync_interval, sync_margin):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.sync_margin = timedelta(seconds=sync_margin)
+        self.bloom = None
+        self.high_water = 0
+        self.synced_at = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti):
+        self.maybe_sync()
+        return jti in self.bloom
+
+    def add(self, jti):
+        self.maybe_sync()
+        with self._lock:
+            self.bloom.add(jti)
+
+    def maybe_sync(self):
+        if self._is_fresh():
+            return
+
+        with self._lock:
+            if not self._is_fresh():
+                self.sync()
+
+    def sync(self):
+        """
+        Add the rows blacklisted since the last sync, or rebuild the filter
+        if it is missing or full. Call with the lock held.
+        """
+        if self.bloom is None:
+            self._rebuild()
+            return
+
+        settled_before = aware_utcnow() - self.sync_margin
+        rows = list(
+            BlacklistedToken.objects.filter(id__gt=self.high_water)
+            .order_by("id")
+            .values_list("id", "token__jti", "blacklisted_at")
+        )
+        added = sum(1 for _, jti, _ in rows if jti not in self.bloom)
+
+        if len(self.bloom) + added > self.bloom.capacity:
+            self._rebuild()
+            return
+
+        self._add_rows(rows, settled_before)
+        self.synced_at = time.monotonic()
+
+    def _rebuild(self):
+        settled_before = aware_utcnow() - self.sync_margin
+        rows = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=aware_utcnow())
+            .order_by("id")
+            .values_list("id", "token__jti", "blacklisted_at")
+        )
+        self.bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        self.high_water = 0
+        self._add_rows(rows, settled_before)
+        self.synced_at = time.monotonic()
+
+    def _add_rows(self, rows, settled_before):
+        settled = True
+        for row_id, jti, blacklisted_at in rows:
+            # Rows read again since the last sync are already in the filter.
+            if jti not in self.bloom:
+                self.bloom.add(jti)
+            # Stop at the first row recent enough that a lower id could
+            # still be uncommitted.
+            settled = settled and blacklisted_at < settled_before
+            if settled:
+                self.high_water = max(self.high_water, row_id)
+
+    def _is_fresh(self):
+        return (
+            self.synced_at is not None
+            and time.monotonic() - self.synced_at < self.sync_interval
+        )
+
+
+_blacklist_filter = None
+_blacklist_filter_lock = threading.Lock()
+
+
+def get_blacklist_filter():
+    global _blacklist_filter
+
+    if _blacklist_filter is None:
+        with _blacklist_filter_lock:
+            if _blacklist_filter is None:
+                _blacklist_filter = TokenBlacklistFilter(
+                    capacity=settings.TOKEN_BLACKLIST_FILTER_CAPACITY,
+                    error_rate=settings.TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+                    sync_interval=settings.TOKEN_BLACKLIST_SYNC_INTERVAL,
+                    sync_margin=settings.TOKEN_BLACKLIST_SYNC_MARGIN,
+                )
+
+    return _blacklist_filter
+
+
+def _reset_blacklist_filter():
+    # The parent's lock may be held at fork time.
+    global _blacklist_filter
+    _blacklist_filter = None
+
+
+os.register_at_fork(after_in_child=_reset_blacklist_filter)
+
+
+def prune_expired_tokens(batch_size=1000, progress=None):
+    """
+    Delete expired outstanding tokens, and their blacklist rows, in batches
+    of `batch_size` so no single transaction locks the tables for long.
+
+    Expired tokens fail validation on their own, so dropping them from the
+    blacklist is safe. `progress` is called with the running total after
+    each batch. Returns the number of outstanding tokens deleted.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=aware_utcnow())
+    deleted = 0
+
+    while True:
+        with transaction.atomic():
+            ids = list(expired.order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                return deleted
+
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+
+        deleted += len(ids)
+        if progress is not None:
+            progress(deleted)
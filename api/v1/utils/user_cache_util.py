@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from api.v1.models.users import User
+from api.v1.metrics import record_cache_lookup
+
+
+def _user_key(user_id) -> str:
+    return f"v1:user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """
+    Return the `User` row with the given id, or `None` if there is none.
+
+    Rows are served from the cache for `USER_CACHE_TIMEOUT` seconds, or
+    until a user signal invalidates them.
+    """
+    if user_id is None:
+        return None
+
+    key = _user_key(user_id)
+    user = cache.get(key)
+    record_cache_lookup("user", hit=user is not None)
+
+    if user is None:
+        user = User.objects.filter(id=user_id).first()
+        if user is not None:
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+
+    return user
+
+
+async def aget_cached_user(user_id):
+    """
+    Async counterpart of `get_cached_user`.
+    """
+    if user_id is None:
+        return None
+
+    key = _user_key(user_id)
+    user = await cache.aget(key)
+    record_cache_lookup("user", hit=user is not None)
+
+    if user is None:
+        user = await User.objects.filter(id=user_id).afirst()
+        if user is not None:
+            await cache.aset(key, user, settings.USER_CACHE_TIMEOUT)
+
+    return user
+
+
+def get_authenticated_user(user_id):
+    """
+    Return the `User` row of the authenticated user, raising
+    `AuthenticationFailed` if it was deleted since its access token was
+    issued, which stateless authentication does not check.
+    """
+    user = get_cached_user(user_id)
+    if user is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    return user
+
+
+async def aget_authenticated_user(user_id):
+    """
+    Async counterpart of `get_authenticated_user`.
+    """
+    user = await aget_cached_user(user_id)
+    if user is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+    return user
+
+
+def invalidate_cached_user(*user_ids) -> None:
+    cache.delete_many([_user_key(user_id) for user_id in user_ids])
@@ -0,0 +1,5 @@
+from api.v1.views.metrics_view import metrics_view
+from api.v1.views.token_view import TokenRefreshView, TokenBlacklistView
+
+
+__all__ = ["metrics_view", "TokenRefreshView", "TokenBlacklistView"]
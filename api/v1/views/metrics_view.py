@@ -0,0 +1,27 @@
+import hmac
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotFound
+from django.views.decorators.http import require_GET
+from api.v1.metrics import CONTENT_TYPE, get_metrics_registry, render_metrics
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Expose the metrics of every worker in the Prometheus text format.
+
+    A plain Django view keeps scrapes off the DRF authentication, throttling
+    and rendering stack. Scrapers must send `METRICS_TOKEN` as
+    `Authorization: Bearer <token>`. Without a token the endpoint is only
+    served when `DEBUG` is on.
+    """
+    token = getattr(settings, "METRICS_TOKEN", None)
+    if token:
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return HttpResponseNotFound()
+    elif not settings.DEBUG:
+        return HttpResponseNotFound()
+
+    body = render_metrics(get_metrics_registry().collect())
+    return HttpResponse(body, content_type=CONTENT_TYPE)
@@ -0,0 +1,15 @@
+from rest_framework_simplejwt import views
+from api.v1.mixins import InstrumentedViewSetMixin
+from api.v1.throttles import ScopedSlidingWindowThrottle
+
+
+class TokenRefreshView(InstrumentedViewSetMixin, views.TokenRefreshView):
+
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "auth"
+
+
+class TokenBlacklistView(InstrumentedViewSetMixin, views.TokenBlacklistView):
+
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "auth"
@@ -3,6 +3,10 @@ from api.v1.viewsets.login_viewset import LoginViewSet
 from api.v1.viewsets.user_viewset import UserViewSet
 from api.v1.viewsets.team_viewset import TeamViewSet
 from api.v1.viewsets.note_viewset import NoteViewSet
+from api.v1.viewsets.async_register_viewset import AsyncRegisterViewSet
+from api.v1.viewsets.async_login_viewset import AsyncLoginViewSet
+from api.v1.viewsets.async_team_viewset import AsyncTeamViewSet
+from api.v1.viewsets.async_note_viewset import AsyncNoteViewSet
 
 
 __all__ = [
@@ -11,4 +15,8 @@ __all__ = [
     "UserViewSet",
     "TeamViewSet",
     "NoteViewSet",
+    "AsyncRegisterViewSet",
+    "AsyncLoginViewSet",
+    "AsyncTeamViewSet",
+    "AsyncNoteViewSet",
 ]
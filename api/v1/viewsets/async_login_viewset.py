@@ -0,0 +1,63 @@
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from api.v1.authentication import UserRefreshToken, aauthenticate_credentials
+from api.v1.serializers import CredentialsSerializer
+from api.v1.mixins import AsyncViewSetMixin
+from api.v1.utils import arecord_last_login
+from api.v1.viewsets.login_viewset import LoginViewSet
+
+
+class AsyncLoginViewSet(AsyncViewSetMixin, LoginViewSet):
+    """
+    `LoginViewSet` served from the event loop, selected with
+    `ASYNC_VIEWSETS`. Passwords are checked on the bounded password hashing
+    executor.
+    """
+
+    serializer_class = CredentialsSerializer
+
+    async def create(self, request, *args, **kwargs):
+        """
+        Create method for generating tokens.
+
+        Returns:
+        - Refresh and access tokens if successful.
+        - Bad Request error if the request data is invalid.
+        - Unauthorized error if invalid credentials.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            user = await aauthenticate_credentials(
+                serializer.validated_data["email"],
+                serializer.validated_data["password"],
+            )
+            if not user:
+                return Response(
+                    {"detail": "Invalid credentials. Please try again."},
+                    status=status.HTTP_401_UNAUTHORIZED,
+                )
+
+            refresh = await sync_to_async(UserRefreshToken.for_user)(user)
+            await arecord_last_login(user.pk)
+
+            return Response(
+                {"refresh": str(refresh), "access": str(refresh.access_token)},
+                status=status.HTTP_200_OK,
+            )
+
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
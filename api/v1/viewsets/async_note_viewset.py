@@ -0,0 +1,198 @@
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.exceptions import AuthenticationFailed, ParseError, ValidationError
+from api.v1.models import Note, VersionConflict
+from api.v1.search import get_search_backend
+from api.v1.caches import note_cache
+from api.v1.utils import aget_user_team_ids
+from api.v1.mixins import AsyncViewSetMixin
+from api.v1.viewsets.note_viewset import NoteViewSet
+
+
+class AsyncNoteViewSet(AsyncViewSetMixin, NoteViewSet):
+    """
+    `NoteViewSet` served from the event loop, selected with
+    `ASYNC_VIEWSETS`.
+    """
+
+    async def aget_queryset(self):
+        """
+        Async counterpart of `get_queryset()`.
+        """
+        return self.get_team_queryset(await aget_user_team_ids(self.request.user.id))
+
+    async def create(self, request, *args, **kwargs):
+        """
+        Create method for creating a new note.
+
+        Returns:
+        - Created note details if successful.
+        - Bad Request error if the request data is invalid or the team does not exist.
+        - Unauthorized if the user was deleted.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            await self.aperform(self.perform_create, serializer)
+
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve method for retrieving a note.
+
+        Returns:
+        - Retrieved note details if found.
+        - Not Modified if the client's copy is current.
+        - Note not found error if the note does not exist.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            return self.get_retrieve_response(
+                request,
+                await note_cache.aget(self.get_object_pk()),
+                await aget_user_team_ids(request.user.id),
+            )
+        except Note.DoesNotExist:
+            return Response(
+                {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def update(self, request, *args, **kwargs):
+        """
+        Update method for updating a note.
+
+        Returns:
+        - Updated note details if successful.
+        - Bad Request error if the request data is invalid.
+        - Note not found error if the note does not exist.
+        - Precondition Failed if the note was changed since it was read.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            return await self.aupdate(request, partial=False)
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Note.DoesNotExist:
+            return Response(
+                {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except VersionConflict:
+            return Response(
+                {"detail": "Note was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def partial_update(self, request, *args, **kwargs):
+        """
+        Partial update method for partially updating a note.
+
+        Returns:
+        - Partially updated note details if successful.
+        - Bad Request error if the request data is invalid.
+        - Note not found error if the note does not exist.
+        - Precondition Failed if the note was changed since it was read.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            return await self.aupdate(request, partial=True)
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Note.DoesNotExist:
+            return Response(
+                {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except VersionConflict:
+            return Response(
+                {"detail": "Note was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def destroy(self, request, *args, **kwargs):
+        """
+        Destroy method for deleting a note.
+
+        Returns:
+        - No Content if the note is successfully deleted.
+        - Note not found error if the note does not exist.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            note = await self.aget_object(await self.aget_queryset())
+            await sync_to_async(self.perform_destroy)(note)
+
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        except Note.DoesNotExist:
+            return Response(
+                {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(methods=["GET"], detail=False)
+    async def search(self, request):
+        """
+        Search notes of the user's teams.
+
+        Returns:
+        - Ranked page of matching notes with highlighted title and body if successful.
+        - Bad Request error if the query or the paging parameters are invalid.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            query, offset, page_size = self.get_search_params(request)
+            team_ids = await aget_user_team_ids(request.user.id)
+
+            hits = await sync_to_async(get_search_backend().search)(
+                query, team_ids, limit=page_size + 1, offset=offset
+            )
+            notes = await self.get_team_queryset(team_ids).ain_bulk(
+                [hit.note_id for hit in hits[:page_size]]
+            )
+
+            return self.get_search_response(request, hits, notes, offset, page_size)
+
+        except ParseError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def aupdate(self, request, partial):
+        note = await self.aget_object(await self.aget_queryset())
+        serializer = self.get_serializer(note, data=request.data, partial=partial)
+        await self.aperform(self.perform_update, serializer)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,62 @@
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from api.v1.authentication import UserRefreshToken
+from api.v1.models import User
+from api.v1.mixins import AsyncViewSetMixin
+from api.v1.utils import amake_password
+from api.v1.viewsets.register_viewset import RegisterViewSet
+
+
+class AsyncRegisterViewSet(AsyncViewSetMixin, RegisterViewSet):
+    """
+    `RegisterViewSet` served from the event loop, selected with
+    `ASYNC_VIEWSETS`. Passwords are hashed on the bounded password hashing
+    executor.
+    """
+
+    async def create(self, request, *args, **kwargs):
+        """
+        Create method for registering new users.
+
+        Returns:
+        - Refresh and access tokens if successful registration.
+        - Bad Request error if the request data is invalid.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            await sync_to_async(serializer.is_valid)(raise_exception=True)
+
+            validated_data = dict(serializer.validated_data)
+            encoded_password = await amake_password(validated_data.pop("password"))
+            refresh = await sync_to_async(self.create_user)(
+                validated_data, encoded_password
+            )
+
+            return Response(
+                {"refresh": str(refresh), "access": str(refresh.access_token)},
+                status=status.HTTP_201_CREATED,
+            )
+
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def create_user(self, validated_data, encoded_password):
+        """
+        Save a user whose password is already hashed, the way
+        `User.objects.create_user()` would, and issue its tokens.
+        """
+        user = User(password=encoded_password, **validated_data)
+        user.email = User.objects.normalize_email(user.email)
+        user.username = User.normalize_username(user.username)
+        user.save()
+
+        return UserRefreshToken.for_user(user)
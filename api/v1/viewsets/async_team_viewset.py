@@ -0,0 +1,268 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from api.v1.models import Team, Membership, VersionConflict
+from api.v1.caches import team_cache
+from api.v1.utils import (
+    aget_authenticated_user,
+    aget_user_team_ids,
+    ainvalidate_user_team_ids,
+)
+from api.v1.mixins import AsyncViewSetMixin
+from api.v1.viewsets.team_viewset import TeamViewSet
+
+
+class AsyncTeamViewSet(AsyncViewSetMixin, TeamViewSet):
+    """
+    `TeamViewSet` served from the event loop, selected with
+    `ASYNC_VIEWSETS`.
+
+    `list`, `notes` and `rotate_code` keep their synchronous handlers, as
+    pagination and code allocation have no async API.
+    """
+
+    async def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieve a team by ID.
+
+        Returns:
+        - Retrieved team details if found.
+        - Not Modified if the client's copy is current.
+        - Team not found error if the team does not exist.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            pk = self.get_object_pk()
+            return self.get_retrieve_response(
+                request,
+                pk,
+                await team_cache.aget(pk),
+                await aget_user_team_ids(request.user.id),
+            )
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def create(self, request, *args, **kwargs):
+        """
+        Create a new team.
+
+        Returns:
+        - Created team details if successful.
+        - Unauthorized if the user was deleted.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            owner = await aget_authenticated_user(request.user.id)
+            await self.aperform(
+                lambda serializer: serializer.save(owner=owner), serializer
+            )
+
+            # The creator is the only member, so nothing is left to look up.
+            team = serializer.instance
+            team.is_joined = True
+            team.member_memberships = []
+
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def update(self, request, *args, **kwargs):
+        """
+        Update a team.
+
+        Returns:
+        - Updated team details if successful.
+        - Team not found error if the team does not exist.
+        - Precondition Failed if the team was changed since it was read.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            return await self.aupdate(request, partial=False)
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except VersionConflict:
+            return Response(
+                {"detail": "Team was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def partial_update(self, request, *args, **kwargs):
+        """
+        Partial update of a team.
+
+        Returns:
+        - Partially updated team details if successful.
+        - Team not found error if the team does not exist.
+        - Precondition Failed if the team was changed since it was read.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            return await self.aupdate(request, partial=True)
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except VersionConflict:
+            return Response(
+                {"detail": "Team was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def destroy(self, request, *args, **kwargs):
+        """
+        Delete a team.
+
+        Returns:
+        - No Content if the team is successfully deleted.
+        - Team not found error if the team does not exist.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            team = await self.aget_object()
+            await team.adelete()
+
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(methods=["POST"], detail=True)
+    async def join(self, request, pk=None):
+        """
+        Join a team.
+
+        Returns:
+        - User successfully added to the team if successful.
+        - Bad Request if the user is already a member or team not found.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            team = await Team.objects.only("id", "code_expires_at").aget(
+                code=serializer.validated_data["code"]
+            )
+
+            if team.code_is_expired:
+                return Response(
+                    {"detail": "Team code has expired."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if await Membership.objects.filter(
+                team_id=team.id, user_id=request.user.id
+            ).aexists():
+                return Response(
+                    {"detail": "User is already a member."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            await Membership.objects.abulk_create(
+                [
+                    Membership(
+                        team_id=team.id,
+                        user_id=request.user.id,
+                        role=Membership.Role.MEMBER,
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            await ainvalidate_user_team_ids(request.user.id)
+            # Bulk inserts send no signals.
+            await team_cache.ainvalidate(team.id)
+
+            return Response(
+                {"detail": "User successfully added to the team."},
+                status=status.HTTP_201_CREATED,
+            )
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exist."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(methods=["DELETE"], detail=True)
+    async def leave(self, request, pk=None):
+        """
+        Leave a team.
+
+        Returns:
+        - User successfully left the team if successful.
+        - Bad Request if the user is an owner or not a member or team not found.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            membership = await Membership.objects.filter(
+                team_id=pk, user_id=request.user.id
+            ).afirst()
+
+            if membership and membership.role == Membership.Role.OWNER:
+                return Response(
+                    {"detail": "User is an owner."}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            if membership is None:
+                return Response(
+                    {"detail": "User is not a member of the team."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            await membership.adelete()
+
+            return Response(
+                {"detail": "User successfully left the team."},
+                status=status.HTTP_200_OK,
+            )
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"}, status=status.HTTP_200_OK
+            )
+
+    async def aupdate(self, request, partial):
+        team = await self.aget_object()
+        serializer = self.get_serializer(team, data=request.data, partial=partial)
+        # `perform_update` serializes the team, members included, for its ETag.
+        await self.aperform(self.perform_update, serializer)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -1,19 +1,24 @@
 from django.contrib.auth import authenticate
 from rest_framework import viewsets, mixins, status
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.exceptions import AuthenticationFailed
-from rest_framework.throttling import AnonRateThrottle
+from api.v1.authentication import UserRefreshToken
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from api.v1.throttles import ScopedSlidingWindowThrottle
 from api.v1.models import User
 from api.v1.serializers import LoginSerializer
+from api.v1.mixins import InstrumentedViewSetMixin
+from api.v1.utils import record_last_login
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 
-class LoginViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class LoginViewSet(
+    InstrumentedViewSetMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
 
     serializer_class = LoginSerializer
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "auth"
 
     @swagger_auto_schema(
         operation_summary="Creates the necessary tokens for unauthenticated user.",
@@ -29,6 +34,7 @@ class LoginViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
                     },
                 ),
             ),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
             status.HTTP_401_UNAUTHORIZED: openapi.Response("Unauthorized"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
@@ -43,6 +49,7 @@ class LoginViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
 
         Returns:
         - Refresh and access tokens if successful.
+        - Bad Request error if the request data is invalid.
         - Unauthorized error if invalid credentials.
         - Internal Server Error if an unexpected exception occurs.
         """
@@ -57,13 +64,17 @@ class LoginViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
                     status=status.HTTP_401_UNAUTHORIZED,
                 )
 
-            refresh = RefreshToken.for_user(user)
+            refresh = UserRefreshToken.for_user(user)
+            record_last_login(user.pk)
 
             return Response(
                 {"refresh": str(refresh), "access": str(refresh.access_token)},
                 status=status.HTTP_200_OK,
             )
 
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         except AuthenticationFailed as e:
             return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
 
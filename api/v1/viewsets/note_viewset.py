@@ -1,16 +1,33 @@
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import ValidationError
-from rest_framework.throttling import UserRateThrottle
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from api.v1.models import Note, Team
-from api.v1.serializers import NoteSerializer
+from rest_framework.exceptions import AuthenticationFailed, ParseError, ValidationError
+from api.v1.throttles import ScopedSlidingWindowThrottle
+from api.v1.authentication import StatelessJWTAuthentication
+from api.v1.models import Note, Team, VersionConflict
+from api.v1.serializers import BulkNoteSerializer, NoteSerializer, operation_count
+from api.v1.permissions import IsTeamMember
+from api.v1.search import get_search_backend
+from api.v1.caches import note_cache, get_note_tag
+from api.v1.utils import get_authenticated_user, get_user_team_ids
+from api.v1.mixins import (
+    ConditionalRequestMixin,
+    InstrumentedViewSetMixin,
+    ObjectLookupMixin,
+)
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 
 class NoteViewSet(
+    InstrumentedViewSetMixin,
+    ObjectLookupMixin,
+    ConditionalRequestMixin,
     viewsets.GenericViewSet,
     mixins.CreateModelMixin,
     mixins.RetrieveModelMixin,
@@ -18,15 +35,137 @@ class NoteViewSet(
     mixins.DestroyModelMixin,
 ):
 
-    queryset = Note.objects.all()
+    queryset = Note.objects.select_related("owner", "team")
     serializer_class = NoteSerializer
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsTeamMember]
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "notes"
 
     ordering_fields = ["title", "body"]
     ordering = ["-created_at"]
 
+    search_page_size = 20
+    search_max_page_size = 50
+
+    def get_queryset(self):
+        """
+        Get queryset restricted to the notes of the user's teams.
+        """
+        return self.get_team_queryset(get_user_team_ids(self.request.user.id))
+
+    def get_team_queryset(self, team_ids):
+        """
+        Get queryset restricted to the notes of the given teams.
+        """
+        return super().get_queryset().filter(team_id__in=team_ids)
+
+    # Saving and deleting send the signals that maintain the search index,
+    # which commits along with the row.
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save(owner=get_authenticated_user(self.request.user.id))
+
+    def perform_update(self, serializer):
+        self.check_if_match(serializer.instance)
+
+        with transaction.atomic():
+            serializer.save()
+
+        note = serializer.instance
+        self.set_saved_validators(
+            self.make_etag("note", note.pk, *get_note_tag(note), version=note.version),
+            max(note.updated_at, note.team.updated_at),
+        )
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+
+    def perform_bulk(self, serializer):
+        """
+        Apply a validated batch in one transaction, deleting first so that
+        the batch may reuse the titles it frees, and return the created and
+        the updated notes.
+        """
+        data = serializer.validated_data
+        if data["create"]:
+            owner = get_authenticated_user(self.request.user.id)
+            teams = Team.objects.in_bulk({item["team"] for item in data["create"]})
+
+        with transaction.atomic():
+            deleted = [note.pk for note in data["delete"]]
+            if deleted:
+                # Deleting sends `post_delete`, which invalidates the cache
+                # and removes the notes from the search index.
+                Note.objects.filter(pk__in=deleted).delete()
+
+            updated = self.bulk_update_notes(data["update"])
+
+            created = Note.objects.bulk_create(
+                [
+                    Note(
+                        title=item["title"],
+                        body=item["body"],
+                        team=teams[item["team"]],
+                        owner=owner,
+                    )
+                    for item in data["create"]
+                ]
+            )
+            note_cache.invalidate(*(note.pk for note in created))
+
+            # Bulk writes send no `post_save`.
+            get_search_backend().index_notes(updated + created)
+
+        return created, updated
+
+    def bulk_update_notes(self, items):
+        """
+        Write the changes of a batch in one `UPDATE` guarded by the version
+        of every note, raising `VersionConflict` if any note was changed
+        since the batch read it or since the version its item names.
+        """
+        if not items:
+            return []
+
+        now = timezone.now()
+        guard = Q()
+        notes = []
+        for item in items:
+            note = item["note"]
+            if item.get("version", note.version) != note.version:
+                raise VersionConflict(f"Note {note.pk} is at version {note.version}.")
+
+            guard |= Q(pk=note.pk, version=note.version)
+            note.title = item.get("title", note.title)
+            note.body = item.get("body", note.body)
+            note.updated_at = now
+            note.version += 1
+            notes.append(note)
+
+        updated = Note.objects.filter(guard).bulk_update(
+            notes, ["title", "body", "updated_at", "version"]
+        )
+        if updated != len(notes):
+            raise VersionConflict("Notes were changed by another request.")
+
+        # Bulk updates send no `post_save`.
+        note_cache.invalidate(*(note.pk for note in notes), version=now.isoformat())
+        return notes
+
+    def get_throttle_cost(self, request):
+        """
+        Count every operation of a bulk request against the throttle rate,
+        including those of a batch over `NOTE_BULK_MAX_OPERATIONS`, which is
+        then rejected.
+        """
+        if self.action != "bulk":
+            return 1
+
+        return operation_count(request.data)
+
     @swagger_auto_schema(
         operation_summary="Create a new note from the team.",
         operation_description="This endpoint creates a new note associated with the authenticated user and a team.",
@@ -41,7 +180,7 @@ class NoteViewSet(
         responses={
             status.HTTP_201_CREATED: openapi.Response("Created", NoteSerializer),
             status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
-            status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
+            status.HTTP_401_UNAUTHORIZED: openapi.Response("Unauthorized"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -55,27 +194,20 @@ class NoteViewSet(
 
         Returns:
         - Created note details if successful.
-        - Bad Request error if the request data is invalid.
-        - Team not found error if the specified team does not exist.
+        - Bad Request error if the request data is invalid or the team does not exist.
+        - Unauthorized if the user was deleted.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
-            serializer.save(owner=request.user)
-
-            note = serializer.instance
-
-            team = Team.objects.get(id=request.data["team"])
-            team.notes.add(note)
+            self.perform_create(serializer)
 
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         except ValidationError as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Team.DoesNotExist:
-            return Response(
-                {"detail": "Team not found."}, status=status.HTTP_404_NOT_FOUND
-            )
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -87,6 +219,7 @@ class NoteViewSet(
         operation_description="This endpoint gets a specific note from the specific team.",
         responses={
             status.HTTP_200_OK: openapi.Response("OK", NoteSerializer),
+            status.HTTP_304_NOT_MODIFIED: openapi.Response("Not Modified"),
             status.HTTP_404_NOT_FOUND: openapi.Response("Note not found"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
@@ -99,11 +232,16 @@ class NoteViewSet(
 
         Returns:
         - Retrieved note details if found.
+        - Not Modified if the client's copy is current.
         - Note not found error if the note does not exist.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
-            return super().retrieve(request, *args, **kwargs)
+            return self.get_retrieve_response(
+                request,
+                note_cache.get(self.get_object_pk()),
+                get_user_team_ids(request.user.id),
+            )
         except Note.DoesNotExist:
             return Response(
                 {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
@@ -128,6 +266,9 @@ class NoteViewSet(
             status.HTTP_200_OK: openapi.Response("OK", NoteSerializer),
             status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
             status.HTTP_404_NOT_FOUND: openapi.Response("Note not found"),
+            status.HTTP_412_PRECONDITION_FAILED: openapi.Response(
+                "Precondition Failed"
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -141,6 +282,7 @@ class NoteViewSet(
         - Updated note details if successful.
         - Bad Request error if the request data is invalid.
         - Note not found error if the note does not exist.
+        - Precondition Failed if the note was changed since it was read.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
@@ -148,9 +290,14 @@ class NoteViewSet(
         except ValidationError as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Note.DoesNotExist:
-            return Reponse(
+            return Response(
                 {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
             )
+        except VersionConflict:
+            return Response(
+                {"detail": "Note was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -171,6 +318,9 @@ class NoteViewSet(
             status.HTTP_200_OK: openapi.Response("OK", NoteSerializer),
             status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
             status.HTTP_404_NOT_FOUND: openapi.Response("Note not found"),
+            status.HTTP_412_PRECONDITION_FAILED: openapi.Response(
+                "Precondition Failed"
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -184,6 +334,7 @@ class NoteViewSet(
         - Partially updated note details if successful.
         - Bad Request error if the request data is invalid.
         - Note not found error if the note does not exist.
+        - Precondition Failed if the note was changed since it was read.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
@@ -194,6 +345,11 @@ class NoteViewSet(
             return Response(
                 {"detail": "Note not found."}, status=status.HTTP_404_NOT_FOUND
             )
+        except VersionConflict:
+            return Response(
+                {"detail": "Note was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -231,3 +387,239 @@ class NoteViewSet(
                 {"detail": "Internal Server Error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @swagger_auto_schema(
+        method="GET",
+        operation_summary="Search notes of the user's teams.",
+        operation_description="This endpoint performs a ranked full-text search over the title and body of the notes in the teams the authenticated user owns or joined.",
+        manual_parameters=[
+            openapi.Parameter(
+                "q",
+                openapi.IN_QUERY,
+                description="Search terms. Every term must match; the last one also matches as a prefix.",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "offset",
+                openapi.IN_QUERY,
+                description="Number of results to skip.",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                "page_size",
+                openapi.IN_QUERY,
+                description="Number of results to return per page.",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            status.HTTP_200_OK: openapi.Response("OK", NoteSerializer(many=True)),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
+                "Internal Server Error"
+            ),
+        },
+    )
+    @action(methods=["GET"], detail=False)
+    def search(self, request):
+        """
+        Search notes of the user's teams.
+
+        Returns:
+        - Ranked page of matching notes with highlighted title and body if successful.
+        - Bad Request error if the query or the paging parameters are invalid.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            query, offset, page_size = self.get_search_params(request)
+            team_ids = get_user_team_ids(request.user.id)
+
+            hits = get_search_backend().search(
+                query, team_ids, limit=page_size + 1, offset=offset
+            )
+            notes = self.get_team_queryset(team_ids).in_bulk(
+                [hit.note_id for hit in hits[:page_size]]
+            )
+
+            return self.get_search_response(request, hits, notes, offset, page_size)
+
+        except ParseError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @swagger_auto_schema(
+        method="POST",
+        operation_summary="Create, update and delete many notes at once.",
+        operation_description="This endpoint applies a batch of note operations in one transaction: either every operation succeeds or none does. Each operation counts as one request against the rate limit, also in a batch rejected for being over the size limit. A batch carrying more operations than the rate allows is refused.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                "create": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "title": openapi.Schema(type=openapi.TYPE_STRING),
+                            "body": openapi.Schema(type=openapi.TYPE_STRING),
+                            "team": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        },
+                    ),
+                ),
+                "update": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        properties={
+                            "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                            "title": openapi.Schema(type=openapi.TYPE_STRING),
+                            "body": openapi.Schema(type=openapi.TYPE_STRING),
+                            "version": openapi.Schema(type=openapi.TYPE_INTEGER),
+                        },
+                    ),
+                ),
+                "delete": openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(type=openapi.TYPE_INTEGER),
+                ),
+            },
+        ),
+        responses={
+            status.HTTP_200_OK: openapi.Response("OK"),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
+            status.HTTP_412_PRECONDITION_FAILED: openapi.Response(
+                "Precondition Failed"
+            ),
+            status.HTTP_401_UNAUTHORIZED: openapi.Response("Unauthorized"),
+            status.HTTP_429_TOO_MANY_REQUESTS: openapi.Response("Too Many Requests"),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
+                "Internal Server Error"
+            ),
+        },
+    )
+    @action(methods=["POST"], detail=False)
+    def bulk(self, request):
+        """
+        Bulk method for creating, updating and deleting many notes at once.
+
+        Returns:
+        - Created and updated note details and deleted note ids, in the order of the request, if successful.
+        - Bad Request error with the errors of each invalid item if any operation is invalid.
+        - Unauthorized if the user was deleted.
+        - Precondition Failed if a note was changed since it was read.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = BulkNoteSerializer(
+                data=request.data, context=self.get_serializer_context()
+            )
+            serializer.is_valid(raise_exception=True)
+            created, updated = self.perform_bulk(serializer)
+
+            return self.get_bulk_response(
+                created, updated, serializer.validated_data["delete"]
+            )
+        except ValidationError as e:
+            return Response({"detail": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+        except VersionConflict:
+            return Response(
+                {"detail": "Notes were changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def get_bulk_response(self, created, updated, deleted):
+        """
+        Build the per-item results of an applied batch.
+        """
+        return Response(
+            {
+                "create": self.get_serializer(created, many=True).data,
+                "update": self.get_serializer(updated, many=True).data,
+                "delete": [{"id": note.pk} for note in deleted],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def get_retrieve_response(self, request, payload, team_ids):
+        """
+        Serve a cached note to a member of its team, raising `DoesNotExist`
+        for anyone else.
+        """
+        if payload is None or payload["team_id"] not in team_ids:
+            raise Note.DoesNotExist
+
+        return self.get_validated_response(
+            request,
+            self.make_etag(
+                "note",
+                payload["data"]["id"],
+                *payload["tag"],
+                version=payload["version"],
+            ),
+            payload["modified"],
+            lambda: Response(payload["data"], status=status.HTTP_200_OK),
+        )
+
+    def get_search_params(self, request):
+        """
+        Return the query, offset and page size of a search request.
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ParseError("Query parameter `q` is required.")
+
+        try:
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+            page_size = int(
+                request.query_params.get("page_size", self.search_page_size)
+            )
+        except ValueError:
+            raise ParseError("`offset` and `page_size` must be integers.")
+
+        return query, offset, min(max(page_size, 1), self.search_max_page_size)
+
+    def get_search_response(self, request, hits, notes, offset, page_size):
+        """
+        Build the page of results from up to `page_size + 1` search hits and
+        the matching notes keyed by id.
+        """
+        has_next = len(hits) > page_size
+        hits = [hit for hit in hits[:page_size] if hit.note_id in notes]
+
+        serializer = self.get_serializer(
+            [notes[hit.note_id] for hit in hits], many=True
+        )
+        results = []
+        for hit, data in zip(hits, serializer.data):
+            data["rank"] = hit.rank
+            data["highlight"] = {"title": hit.title, "body": hit.body}
+            results.append(data)
+
+        url = request.build_absolute_uri()
+        next_url = (
+            replace_query_param(url, "offset", offset + page_size) if has_next else None
+        )
+        previous_url = None
+        if offset > 0:
+            previous_url = (
+                replace_query_param(url, "offset", offset - page_size)
+                if offset > page_size
+                else remove_query_param(url, "offset")
+            )
+
+        return Response(
+            {"next": next_url, "previous": previous_url, "results": results},
+            status=status.HTTP_200_OK,
+        )
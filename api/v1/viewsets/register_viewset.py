@@ -1,18 +1,22 @@
 from rest_framework import viewsets, mixins, status
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
-from rest_framework.throttling import AnonRateThrottle
-from rest_framework_simplejwt.tokens import RefreshToken
+from api.v1.throttles import ScopedSlidingWindowThrottle
+from api.v1.authentication import UserRefreshToken
 from api.v1.models import User
 from api.v1.serializers import UserSerializer
+from api.v1.mixins import InstrumentedViewSetMixin
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 
-class RegisterViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
+class RegisterViewSet(
+    InstrumentedViewSetMixin, viewsets.GenericViewSet, mixins.CreateModelMixin
+):
 
     serializer_class = UserSerializer
-    throttle_classes = [AnonRateThrottle]
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "auth"
 
     @swagger_auto_schema(
         operation_summary="Creates the necessary tokens for new users.",
@@ -50,7 +54,7 @@ class RegisterViewSet(viewsets.GenericViewSet, mixins.CreateModelMixin):
             serializer.is_valid(raise_exception=True)
 
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
+            refresh = UserRefreshToken.for_user(user)
 
             return Response(
                 {"refresh": str(refresh), "access": str(refresh.access_token)},
@@ -1,18 +1,50 @@
+from datetime import timedelta
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import viewsets, mixins, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import ValidationError
-from rest_framework.throttling import UserRateThrottle
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from api.v1.models import Team, Note
-from api.v1.serializers import TeamSerializer, JoinTeamSerializer, NoteSerializer
-from api.v1.permissions import IsOwner
+from rest_framework.exceptions import (
+    AuthenticationFailed,
+    NotFound,
+    PermissionDenied,
+    ValidationError,
+)
+from api.v1.throttles import ScopedSlidingWindowThrottle
+from api.v1.authentication import StatelessJWTAuthentication
+from api.v1.models import Team, Note, Membership, VersionConflict
+from api.v1.serializers import (
+    TeamSerializer,
+    JoinTeamSerializer,
+    TeamCodeSerializer,
+    NoteSerializer,
+)
+from api.v1.permissions import IsOwner, IsTeamMember
+from api.v1.caches import (
+    team_cache,
+    get_team_representation,
+    get_team_tag,
+)
+from api.v1.utils import (
+    get_authenticated_user,
+    get_user_team_ids,
+    invalidate_user_team_ids,
+)
+from api.v1.mixins import (
+    ConditionalRequestMixin,
+    InstrumentedViewSetMixin,
+    ObjectLookupMixin,
+)
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 
 class TeamViewSet(
+    InstrumentedViewSetMixin,
+    ObjectLookupMixin,
+    ConditionalRequestMixin,
     viewsets.GenericViewSet,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
@@ -23,18 +55,39 @@ class TeamViewSet(
 
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [ScopedSlidingWindowThrottle]
+    throttle_scope = "teams"
 
     search_fields = ["name", "description"]
     ordering_fields = ["name", "description"]
     ordering = ["-created_at"]
 
+    def get_queryset(self):
+        """
+        Get queryset annotated with the membership of the authenticated user.
+        """
+        user_id = self.request.user.id
+
+        if self.action == "notes":
+            return super().get_queryset().filter(id__in=get_user_team_ids(user_id))
+
+        membership = Membership.objects.filter(team_id=OuterRef("pk"), user_id=user_id)
+
+        return (
+            super()
+            .get_queryset()
+            .select_related("owner")
+            .annotate(is_joined=Exists(membership))
+        )
+
     def get_permissions(self):
 
-        if self.action in ["update", "partial_update", "destroy"]:
+        if self.action in ["update", "partial_update", "destroy", "rotate_code"]:
             return [IsAuthenticated(), IsOwner()]
+        elif self.action == "notes":
+            return [IsAuthenticated(), IsTeamMember()]
 
         return super().get_permissions()
 
@@ -42,11 +95,30 @@ class TeamViewSet(
 
         if self.action == "join":
             return JoinTeamSerializer
+        elif self.action == "rotate_code":
+            return TeamCodeSerializer
         elif self.action == "notes":
             return NoteSerializer
 
         return super().get_serializer_class()
 
+    def perform_update(self, serializer):
+        self.check_if_match(serializer.instance)
+        serializer.save()
+
+        # Serializing here lists the members once, for the ETag and the body.
+        team, data = serializer.instance, serializer.data
+        self.set_saved_validators(
+            self.make_etag(
+                "team",
+                team.pk,
+                *get_team_tag(team, data["members"]),
+                data["is_joined"],
+                version=team.version,
+            ),
+            team.updated_at,
+        )
+
     @swagger_auto_schema(
         operation_summary="List all teams.",
         operation_description="This endpoint retrieves a list of teams.",
@@ -54,6 +126,8 @@ class TeamViewSet(
             status.HTTP_200_OK: openapi.Response(
                 "OK", TeamSerializer(many=True, context={"exclude_fields": []})
             ),
+            status.HTTP_304_NOT_MODIFIED: openapi.Response("Not Modified"),
+            status.HTTP_404_NOT_FOUND: openapi.Response("Invalid cursor"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -65,10 +139,23 @@ class TeamViewSet(
 
         Returns:
         - List of all teams if successful.
+        - Not Modified if the client's copy of the page is current.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
-            return super().list(request, *args, **kwargs)
+            team_ids = get_user_team_ids(request.user.id)
+
+            return self.get_validated_page_response(
+                request,
+                self.filter_queryset(self.get_queryset()),
+                {
+                    "owner_username": F("owner__username"),
+                    "owner_email": F("owner__email"),
+                },
+                get_tags=lambda rows: self.get_member_tags(rows, team_ids),
+            )
+        except NotFound as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -82,6 +169,7 @@ class TeamViewSet(
             status.HTTP_200_OK: openapi.Response(
                 "OK", TeamSerializer(context={"exclude_fields": []})
             ),
+            status.HTTP_304_NOT_MODIFIED: openapi.Response("Not Modified"),
             status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
@@ -94,11 +182,15 @@ class TeamViewSet(
 
         Returns:
         - Retrieved team details if found.
+        - Not Modified if the client's copy is current.
         - Team not found error if the team does not exist.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
-            return super().retrieve(request, *args, **kwargs)
+            pk = self.get_object_pk()
+            return self.get_retrieve_response(
+                request, pk, team_cache.get(pk), get_user_team_ids(request.user.id)
+            )
         except Team.DoesNotExist:
             return Response(
                 {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
@@ -116,6 +208,7 @@ class TeamViewSet(
             status.HTTP_201_CREATED: openapi.Response(
                 "Created", TeamSerializer(context={"exclude_fields": []})
             ),
+            status.HTTP_401_UNAUTHORIZED: openapi.Response("Unauthorized"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -127,15 +220,22 @@ class TeamViewSet(
 
         Returns:
         - Created team details if successful.
+        - Unauthorized if the user was deleted.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
-            serializer.save(owner=request.user)
+            team = serializer.save(owner=get_authenticated_user(request.user.id))
+
+            # The creator is the only member, so nothing is left to look up.
+            team.is_joined = True
+            team.member_memberships = []
 
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+        except AuthenticationFailed as e:
+            return Response({"detail": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -150,6 +250,9 @@ class TeamViewSet(
                 "OK", TeamSerializer(context={"exclude_fields": []})
             ),
             status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
+            status.HTTP_412_PRECONDITION_FAILED: openapi.Response(
+                "Precondition Failed"
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -162,6 +265,7 @@ class TeamViewSet(
         Returns:
         - Updated team details if successful.
         - Team not found error if the team does not exist.
+        - Precondition Failed if the team was changed since it was read.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
@@ -170,6 +274,11 @@ class TeamViewSet(
             return Response(
                 {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
             )
+        except VersionConflict:
+            return Response(
+                {"detail": "Team was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -184,6 +293,9 @@ class TeamViewSet(
                 "OK", TeamSerializer(context={"exclude_fields": []})
             ),
             status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
+            status.HTTP_412_PRECONDITION_FAILED: openapi.Response(
+                "Precondition Failed"
+            ),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -196,6 +308,7 @@ class TeamViewSet(
         Returns:
         - Partially updated team details if successful.
         - Team not found error if the team does not exist.
+        - Precondition Failed if the team was changed since it was read.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
@@ -204,6 +317,11 @@ class TeamViewSet(
             return Response(
                 {"detail": "Team does not exists."}, status=status.HTTP_404_NOT_FOUND
             )
+        except VersionConflict:
+            return Response(
+                {"detail": "Team was changed by another request."},
+                status=status.HTTP_412_PRECONDITION_FAILED,
+            )
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -269,29 +387,104 @@ class TeamViewSet(
             serializer = self.get_serializer(data=request.data)
             serializer.is_valid(raise_exception=True)
 
-            team = Team.objects.filter(code=serializer.validated_data["code"]).first()
+            team = Team.objects.only("id", "code_expires_at").get(
+                code=serializer.validated_data["code"]
+            )
+
+            if team.code_is_expired:
+                return Response(
+                    {"detail": "Team code has expired."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-            if team and request.user in team.members.all():
+            if Membership.objects.filter(
+                team_id=team.id, user_id=request.user.id
+            ).exists():
                 return Response(
                     {"detail": "User is already a member."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            team.members.add(request.user)
+            Membership.objects.bulk_create(
+                [
+                    Membership(
+                        team_id=team.id,
+                        user_id=request.user.id,
+                        role=Membership.Role.MEMBER,
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            invalidate_user_team_ids(request.user.id)
+            # Bulk inserts send no signals.
+            team_cache.invalidate(team.id)
 
             return Response(
                 {"detail": "User successfully added to the team."},
                 status=status.HTTP_201_CREATED,
             )
         except ValidationError as e:
-            return Responses({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Team.DoesNotExist:
             return Response(
                 {"detail": "Team does not exist."}, status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
             return Response(
-                {"detail": "Internal Server Error"}, status=status.HTTP_200_OK
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @swagger_auto_schema(
+        method="POST",
+        operation_summary="Rotate the team code.",
+        operation_description="This endpoint replaces the code used to join the team, invalidating the previous one. `expires_in` sets the lifetime of the new code in seconds; `0` keeps it valid until the next rotation.",
+        request_body=TeamCodeSerializer,
+        responses={
+            status.HTTP_200_OK: openapi.Response("OK", TeamCodeSerializer),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
+            status.HTTP_403_FORBIDDEN: openapi.Response("Forbidden"),
+            status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
+            status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
+                "Internal Server Error"
+            ),
+        },
+    )
+    @action(methods=["POST"], detail=True, url_path="rotate-code")
+    def rotate_code(self, request, pk=None):
+        """
+        Rotate the team code.
+
+        Returns:
+        - New team code and its expiry if successful.
+        - Bad Request if `expires_in` is invalid.
+        - Forbidden if the user is not the owner of the team.
+        - Team not found error if the team does not exist.
+        - Internal Server Error if an unexpected exception occurs.
+        """
+        try:
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            expires_in = serializer.validated_data.get("expires_in")
+            ttl = timedelta(seconds=expires_in) if expires_in is not None else None
+
+            team = self.get_object()
+            team.rotate_code(ttl=ttl)
+
+            return Response(TeamCodeSerializer(team).data, status=status.HTTP_200_OK)
+        except ValidationError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except PermissionDenied as e:
+            return Response({"detail": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except Team.DoesNotExist:
+            return Response(
+                {"detail": "Team does not exist."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {"detail": "Internal Server Error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
     @swagger_auto_schema(
@@ -318,20 +511,22 @@ class TeamViewSet(
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
-            team = self.queryset.filter(id=pk).first()
+            membership = Membership.objects.filter(
+                team_id=pk, user_id=request.user.id
+            ).first()
 
-            if team and request.user == team.owner:
+            if membership and membership.role == Membership.Role.OWNER:
                 return Response(
                     {"detail": "User is an owner."}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            if not (team and request.user in team.members.all()):
+            if membership is None:
                 return Response(
                     {"detail": "User is not a member of the team."},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            team.members.remove(request.user)
+            membership.delete()
 
             return Response(
                 {"detail": "User successfully left the team."},
@@ -351,9 +546,26 @@ class TeamViewSet(
     @swagger_auto_schema(
         method="GET",
         operation_summary="List notes of a team.",
-        operation_description="This endpoint retrieves a list of specific team notes.",
+        operation_description="This endpoint retrieves a paginated list of specific team notes.",
+        manual_parameters=[
+            openapi.Parameter(
+                "since",
+                openapi.IN_QUERY,
+                description="Only return notes created at or after this ISO 8601 datetime.",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_DATETIME,
+            ),
+            openapi.Parameter(
+                "ordering",
+                openapi.IN_QUERY,
+                description="Either `created_at` or `-created_at` (default).",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: openapi.Response("OK", NoteSerializer(many=True)),
+            status.HTTP_304_NOT_MODIFIED: openapi.Response("Not Modified"),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
             status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
@@ -366,23 +578,87 @@ class TeamViewSet(
         List notes of a team.
 
         Returns:
-        - List of notes belonging to the team if successful.
+        - Paginated list of notes belonging to the team if successful.
+        - Not Modified if the client's copy of the page is current.
+        - Bad Request error if `since` is not a valid datetime.
         - Team not found error if the team does not exist.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
             team = self.get_object()
-            notes = team.notes.all()
-            serializer = self.get_serializer(notes, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            notes = team.notes.select_related("owner")
+
+            since = request.query_params.get("since")
+            if since:
+                since_datetime = parse_datetime(since)
+                if since_datetime is None:
+                    return Response(
+                        {"detail": "Invalid `since` datetime."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if timezone.is_naive(since_datetime):
+                    since_datetime = timezone.make_aware(since_datetime)
+                notes = notes.filter(created_at__gte=since_datetime)
+
+            return self.get_validated_page_response(
+                request,
+                notes,
+                {
+                    "team_updated_at": F("team__updated_at"),
+                    "owner_username": F("owner__username"),
+                    "owner_email": F("owner__email"),
+                },
+            )
 
         except Team.DoesNotExist:
             return Response(
                 {"detail": "Team does not exist."}, status=status.HTTP_404_NOT_FOUND
             )
 
+        except NotFound as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    def get_member_tags(self, rows, team_ids):
+        """
+        Map the teams of a page to whether the reader joined them and, for
+        those joined, the members listed to the reader, in one query.
+        """
+        joined = [row["id"] for row in rows if row["id"] in team_ids]
+        members = {pk: [] for pk in joined}
+        if joined:
+            for team_id, *member in (
+                Membership.objects.filter(team_id__in=joined)
+                .order_by("team_id", "user_id")
+                .values_list("team_id", "user_id", "user__username", "user__email")
+            ):
+                members[team_id].append(member)
+
+        return {
+            row["id"]: [row["id"] in members, members.get(row["id"])] for row in rows
+        }
+
+    def get_retrieve_response(self, request, pk, payload, team_ids):
+        """
+        Serve a cached team, with `is_joined` and the members for the
+        reader, raising `DoesNotExist` if there is no such team.
+        """
+        if payload is None:
+            raise Team.DoesNotExist
+
+        is_joined = pk in team_ids
+        return self.get_validated_response(
+            request,
+            self.make_etag(
+                "team", pk, *payload["tag"], is_joined, version=payload["version"]
+            ),
+            payload["modified"],
+            lambda: Response(
+                get_team_representation(payload, is_joined), status=status.HTTP_200_OK
+            ),
+        )
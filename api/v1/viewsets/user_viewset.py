@@ -1,18 +1,21 @@
-from django.db.models import Q
+from django.db.models import prefetch_related_objects
 from rest_framework import viewsets, mixins, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import ValidationError
-from rest_framework.throttling import UserRateThrottle
-from rest_framework_simplejwt.authentication import JWTAuthentication
-from api.v1.models import User, Team
+from rest_framework.exceptions import NotFound, ValidationError
+from api.v1.throttles import UserSlidingWindowThrottle
+from api.v1.authentication import StatelessJWTAuthentication
+from api.v1.models import User, Team, Membership
 from api.v1.serializers import UserSerializer, TeamSerializer
+from api.v1.mixins import InstrumentedViewSetMixin, ObjectLookupMixin
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 
 class UserViewSet(
+    InstrumentedViewSetMixin,
+    ObjectLookupMixin,
     viewsets.GenericViewSet,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -21,9 +24,11 @@ class UserViewSet(
 
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
+    throttle_classes = [UserSlidingWindowThrottle]
+
+    max_members_preview = 20
 
     def get_queryset(self):
         """
@@ -190,13 +195,22 @@ class UserViewSet(
     @swagger_auto_schema(
         method="GET",
         operation_summary="Lists teams associated with the user.",
-        operation_description="This endpoint retrieves all the teams that the specific authenticated user have.",
+        operation_description="This endpoint retrieves a paginated list of the teams that the specific authenticated user owns or joined.",
+        manual_parameters=[
+            openapi.Parameter(
+                "members",
+                openapi.IN_QUERY,
+                description="Include a preview of up to this many members per team (max 20).",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
         responses={
             status.HTTP_200_OK: openapi.Response(
                 "OK",
                 TeamSerializer(many=True, context={"exclude_fields": ["is_joined"]}),
             ),
-            status.HTTP_404_NOT_FOUND: openapi.Response("Team not found"),
+            status.HTTP_400_BAD_REQUEST: openapi.Response("Bad Request"),
+            status.HTTP_404_NOT_FOUND: openapi.Response("User not found"),
             status.HTTP_500_INTERNAL_SERVER_ERROR: openapi.Response(
                 "Internal Server Error"
             ),
@@ -208,26 +222,63 @@ class UserViewSet(
         Action method for listing teams associated with the user.
 
         Returns:
-        - List of teams associated with the user if successful.
-        - Team not found error if user has no associated teams.
+        - Paginated list of teams associated with the user if successful.
+        - Bad Request error if `members` is not a non-negative integer.
+        - Not Found error if user not found.
         - Internal Server Error if an unexpected exception occurs.
         """
         try:
-            user_teams = Team.objects.filter(
-                Q(owner=request.user) | Q(members=request.user)
+            try:
+                members_preview = int(request.query_params.get("members", 0))
+            except ValueError:
+                members_preview = -1
+            if members_preview < 0:
+                return Response(
+                    {"detail": "`members` must be a non-negative integer."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            members_preview = min(members_preview, self.max_members_preview)
+
+            # Users may only list their own teams; the membership subquery
+            # needs the id alone, so the user row is never loaded.
+            user_id = self.get_object_pk()
+            if user_id != request.user.id:
+                raise User.DoesNotExist
+
+            team_ids = Membership.objects.filter(user_id=user_id).values("team_id")
+            user_teams = Team.objects.filter(id__in=team_ids)
+
+            page = self.paginate_queryset(user_teams)
+            teams = page if page is not None else list(user_teams)
+
+            owners = User.objects.only("id", "username", "email").in_bulk(
+                {team.owner_id for team in teams}
             )
+            for team in teams:
+                team.owner = owners[team.owner_id]
+
+            if members_preview:
+                prefetch_related_objects(
+                    teams, TeamSerializer.get_members_prefetch(limit=members_preview)
+                )
 
             serializer = TeamSerializer(
-                user_teams, many=True, context={"exclude_fields": ["is_joined"]}
+                teams, many=True, context={"exclude_fields": ["is_joined"]}
             )
 
+            if page is not None:
+                return self.get_paginated_response(serializer.data)
+
             return Response(serializer.data, status=status.HTTP_200_OK)
 
-        except Team.DoesNotExist:
+        except User.DoesNotExist:
             return Response(
-                {"detail": "Team not found."}, status=status.HTTP_404_NOT_FOUND
+                {"detail": "User not found."}, status=status.HTTP_404_NOT_FOUND
             )
 
+        except NotFound as e:
+            return Response({"detail": str(e)}, status=status.HTTP_404_NOT_FOUND)
+
         except Exception as e:
             return Response(
                 {"detail": "Internal Server Error"},
@@ -13,11 +13,30 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 import os
 from pathlib import Path
 from datetime import timedelta
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 
 load_dotenv()
 
+
+def cache_from_url(url, alias):
+    """
+    Return the `CACHES` entry of a cache every worker shares, given as
+    `redis://`, `rediss://` or `memcached://host:port`.
+    """
+    scheme, _, location = url.partition("://")
+    if scheme in ("redis", "rediss"):
+        backend = "django.core.cache.backends.redis.RedisCache"
+        location = url
+    elif scheme == "memcached":
+        backend = "django.core.cache.backends.memcached.PyMemcacheCache"
+    else:
+        raise ImproperlyConfigured(f"Unsupported cache URL scheme `{scheme}`.")
+
+    return {"BACKEND": backend, "LOCATION": location, "KEY_PREFIX": alias}
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -44,6 +63,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "api.v1.middlewares.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -119,7 +139,7 @@ AUTH_USER_MODEL = "v1.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "api.v1.authentication.StatelessJWTAuthentication"
     ],
     "DEFAULT_PERMISSIONS_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
     "DEFAULT_FILTER_BACKENDS": [
@@ -127,11 +147,17 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
     ],
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "api.v1.throttles.AnonSlidingWindowThrottle",
+        "api.v1.throttles.UserSlidingWindowThrottle",
     ],
-    "DEFAULT_THROTTLE_RATES": {"anon": "50/day", "user": "1000/day"},
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_THROTTLE_RATES": {
+        "anon": "50/day",
+        "user": "1000/day",
+        "teams": "1000/day",
+        "notes": "1000/day",
+        "auth": "50/day",
+    },
+    "DEFAULT_PAGINATION_CLASS": "api.v1.paginations.KeysetPagination",
     "PAGE_SIZE": 10,
 }
 
@@ -140,7 +166,155 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=30),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
-    "UPDATE_LAST_LOGIN": True,
+    # `last_login` is written behind by `LastLoginBuffer` instead.
+    "UPDATE_LAST_LOGIN": False,
+    "TOKEN_REFRESH_SERIALIZER": "api.v1.serializers.TokenRefreshSerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "api.v1.serializers.TokenBlacklistSerializer",
+}
+
+# Store shared by every worker for the sliding-window throttle counters. The
+# file store covers the workers of one host and lives in the project's `var`
+# directory rather than a shared temporary one; set
+# `DJANGO_THROTTLE_REDIS_URL` to share the counters between hosts.
+THROTTLE_STORE = "api.v1.throttles.FileThrottleStore"
+THROTTLE_STORE_OPTIONS = {
+    "path": os.environ.get("DJANGO_THROTTLE_FILE", BASE_DIR / "var" / "throttles.bin"),
+}
+
+if os.environ.get("DJANGO_THROTTLE_REDIS_URL"):
+    THROTTLE_STORE = "api.v1.throttles.RedisThrottleStore"
+    THROTTLE_STORE_OPTIONS = {"url": os.environ["DJANGO_THROTTLE_REDIS_URL"]}
+
+# Blacklisted refresh tokens are tracked per process in a Bloom filter sized
+# for this many tokens at this false positive rate, so refreshing a token
+# that is not blacklisted needs no query. The filter picks up tokens
+# blacklisted by other processes every `TOKEN_BLACKLIST_SYNC_INTERVAL`
+# seconds. Run `python manage.py prunetokens` periodically to drop expired
+# tokens.
+TOKEN_BLACKLIST_FILTER_CAPACITY = 100_000
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = 0.001
+TOKEN_BLACKLIST_SYNC_INTERVAL = 5.0
+# Rows blacklisted within this many seconds of a sync are read again by the
+# next one, in case a transaction still holding a lower id commits later.
+# Keep it above the longest transaction plus the clock skew between hosts.
+TOKEN_BLACKLIST_SYNC_MARGIN = 300.0
+
+# Serve authenticated requests from the access token claims instead of
+# looking up the user row on every request.
+STATELESS_JWT_AUTHENTICATION = (
+    os.environ.get("DJANGO_STATELESS_JWT_AUTHENTICATION", "1") == "1"
+)
+
+# Route registration, login, teams and notes to their async viewsets. Only
+# useful when served through `config.asgi`; under WSGI every async view runs
+# in its own event loop.
+ASYNC_VIEWSETS = os.environ.get("DJANGO_ASYNC_VIEWSETS") == "1"
+
+# Threads the async viewsets hash passwords on, bounding how many hashes
+# run at once.
+PASSWORD_HASHING_WORKERS = int(os.environ.get("DJANGO_PASSWORD_HASHING_WORKERS", 4))
+
+# Seconds a cached user row may live before it is reloaded.
+USER_CACHE_TIMEOUT = 60
+
+# Logins are buffered and `last_login` written in bulk at most this many
+# seconds later, or once this many users are pending.
+LAST_LOGIN_FLUSH_INTERVAL = 10.0
+LAST_LOGIN_MAX_PENDING = 500
+
+# Set `DJANGO_CACHE_URL` to share the caches between workers. Without it
+# each worker keeps its own in memory, which only suits a single process.
+SHARED_CACHE_URL = os.environ.get("DJANGO_CACHE_URL")
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "memberships": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "memberships",
+    },
+    "objects": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "objects",
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    },
+}
+
+# Cache of the serialized notes and teams served by the detail endpoints.
+# Payloads live for `OBJECT_CACHE_TIMEOUT` seconds unless a write replaces
+# them sooner. Only one worker rebuilds a missing payload; the others poll
+# for it every `OBJECT_CACHE_LOCK_POLL` seconds for up to
+# `OBJECT_CACHE_LOCK_WAIT` seconds before reading the row themselves.
+OBJECT_CACHE_ALIAS = "objects"
+OBJECT_CACHE_TIMEOUT = 300
+OBJECT_CACHE_LOCK_WAIT = 0.5
+OBJECT_CACHE_LOCK_POLL = 0.01
+
+if SHARED_CACHE_URL:
+    CACHES["default"] = cache_from_url(SHARED_CACHE_URL, "default")
+    CACHES["memberships"] = cache_from_url(SHARED_CACHE_URL, "memberships")
+    CACHES["objects"] = cache_from_url(SHARED_CACHE_URL, "objects")
+
+# Set `DJANGO_OBJECT_CACHE_URL` to keep the object cache apart from the rest.
+OBJECT_CACHE_URL = os.environ.get("DJANGO_OBJECT_CACHE_URL")
+if OBJECT_CACHE_URL:
+    CACHES["objects"] = cache_from_url(OBJECT_CACHE_URL, "objects")
+
+# Cache of the team ids each user may read and write the notes of. A change
+# clears the entry in the cache, so authorization is only current for every
+# worker when the alias is shared.
+MEMBERSHIP_CACHE_ALIAS = "memberships"
+
+# Seconds a user's cached set of team ids may live before it is rebuilt.
+MEMBERSHIP_CACHE_TIMEOUT = 300
+
+# Lifetime of team invite codes; `None` keeps codes valid until rotated.
+TEAM_CODE_TTL = None
+
+NOTE_SEARCH_BACKEND = "api.v1.search.DatabaseSearchBackend"
+
+# Most operations one `POST /notes/bulk/` request may carry. Each operation
+# counts as one request against the `notes` throttle rate.
+NOTE_BULK_MAX_OPERATIONS = int(os.environ.get("DJANGO_NOTE_BULK_MAX_OPERATIONS", 100))
+
+# Per-request query and latency instrumentation. Set `LOG_DUPLICATE_QUERIES`
+# to log the fingerprint of every statement repeated at least
+# `DUPLICATE_QUERY_THRESHOLD` times in one request, which points at N+1 sites.
+# Requests slower than `SLOW_REQUEST_THRESHOLD` seconds are logged at INFO,
+# the others at DEBUG.
+API_INSTRUMENTATION = {
+    "ENABLED": True,
+    "SERVER_TIMING": True,
+    "LOG_DUPLICATE_QUERIES": os.environ.get("DJANGO_LOG_DUPLICATE_QUERIES") == "1",
+    "DUPLICATE_QUERY_THRESHOLD": 2,
+    "SLOW_REQUEST_THRESHOLD": float(
+        os.environ.get("DJANGO_SLOW_REQUEST_THRESHOLD", 1.0)
+    ),
+}
+
+# Directory shared by every worker process for metric snapshots. Leave unset
+# to serve only the scraped process's metrics; clear it when workers restart.
+METRICS_DIRECTORY = os.environ.get("DJANGO_METRICS_DIR")
+
+# Seconds between snapshot writes of a worker.
+METRICS_FLUSH_INTERVAL = 1.0
+
+# Bearer token required to scrape `/api/v1/metrics/`. Unset, the endpoint is
+# only served with `DEBUG` on.
+METRICS_TOKEN = os.environ.get("DJANGO_METRICS_TOKEN")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "api.v1.instrumentation": {
+            "handlers": ["console"],
+            "level": os.environ.get("DJANGO_INSTRUMENTATION_LOG_LEVEL", "INFO"),
+            "propagate": False,
+        },
+    },
 }
 
 APPEND_SLASH = False
@@ -11,3 +11,5 @@ DATABASES = {
         "NAME": BASE_DIR / "db.sqlite3",
     }
 }
+
+NOTE_SEARCH_BACKEND = "api.v1.search.SQLiteFTSBackend"
@@ -6,3 +6,17 @@ DEBUG = False
 ALLOWED_HOSTS = []
 
 DATABASES = {}
+
+if not SHARED_CACHE_URL:
+    # A worker's own copy would keep granting access to a team the user
+    # left through another worker, so read memberships on every request.
+    CACHES["memberships"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+
+if not (SHARED_CACHE_URL or OBJECT_CACHE_URL):
+    # Likewise, serve notes and teams fresh rather than a copy that another
+    # worker's write could not invalidate.
+    CACHES["objects"] = {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }